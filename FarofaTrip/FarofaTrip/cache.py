@@ -0,0 +1,85 @@
+"""
+Configuração do cache a partir de variáveis de ambiente.
+
+"default" é a camada compartilhada (catálogo, preços, perfil e histórico
+de pedidos, throttling, versão da blacklist e os helpers de core.cache).
+O backend vem de CACHE_BACKEND (padrão: local com DEBUG, file sem DEBUG):
+    local           LocMemCache: um cache por processo; desenvolvimento,
+                    testes e runserver. Com vários workers cada um teria
+                    as suas janelas de throttling (o limite real vira
+                    taxa x workers)
+    file            FileBasedCache em CACHE_DIR (padrão: BASE_DIR/.cache):
+                    compartilhado entre os workers do gunicorn de um nó,
+                    sem serviço externo. add/incr não são atômicos
+                    entre processos: o lock de recálculo do catálogo
+                    (core.cache.obtem_com_revalidacao) e os contadores
+                    do throttling podem deixar passar requests
+                    simultâneas de workers diferentes
+    redis           RedisCache; CACHE_LOCATION aceita socket local
+                    (padrão: unix:///run/redis/redis.sock). Requer redis
+    memcached       PyMemcacheCache; CACHE_LOCATION aceita socket local
+                    (padrão: unix:/run/memcached/memcached.sock). Requer
+                    pymemcache
+
+Dados quentes por processo (usuários do JWT, filtro da blacklist) ficam
+em estruturas em memória dos próprios módulos (core.authentication,
+core.blacklist), não em um cache do Django.
+
+Outras variáveis:
+    CACHE_KEY_PREFIX   prefixo das chaves (padrão: farofatrip)
+    CACHE_TIMEOUT      TTL padrão em segundos (padrão: 300)
+    CACHE_MAX_ENTRIES  limite de entradas dos backends local/file
+                       (padrão: 5000)
+"""
+import os
+
+from .database import env_int
+
+
+BACKENDS = {
+    "local": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+}
+
+LOCATIONS_PADRAO = {
+    "redis": "unix:///run/redis/redis.sock",
+    "memcached": "unix:/run/memcached/memcached.sock",
+}
+
+
+def cache_compartilhado(environ, base_dir, debug=False):
+    """
+    Retorna CACHES['default'] para o backend em CACHE_BACKEND.
+    """
+    padrao = "local" if debug else "file"
+    backend = (environ.get("CACHE_BACKEND") or padrao).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"CACHE_BACKEND desconhecido: {backend!r} (use {', '.join(BACKENDS)})"
+        )
+
+    config = {
+        "BACKEND": BACKENDS[backend],
+        "KEY_PREFIX": environ.get("CACHE_KEY_PREFIX") or "farofatrip",
+        "TIMEOUT": env_int(environ, "CACHE_TIMEOUT", 300),
+    }
+    if backend == "local":
+        config["LOCATION"] = "farofatrip-default"
+    elif backend == "file":
+        config["LOCATION"] = str(environ.get("CACHE_DIR") or base_dir / ".cache")
+    else:
+        config["LOCATION"] = environ.get("CACHE_LOCATION") or LOCATIONS_PADRAO[backend]
+
+    if backend in ("local", "file"):
+        config["OPTIONS"] = {"MAX_ENTRIES": env_int(environ, "CACHE_MAX_ENTRIES", 5000)}
+    return config
+
+
+def cache_config(base_dir, environ=None, debug=False):
+    """
+    Retorna o dicionário CACHES.
+    """
+    environ = os.environ if environ is None else environ
+    return {"default": cache_compartilhado(environ, base_dir, debug)}
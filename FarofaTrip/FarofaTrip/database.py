@@ -0,0 +1,125 @@
+"""
+Configuração do banco de dados a partir de variáveis de ambiente.
+
+Perfis (DB_ENGINE):
+
+- sqlite (padrão): desenvolvimento e deploy de nó único.
+    SQLITE_PATH           caminho do arquivo (padrão: BASE_DIR/db.sqlite3)
+    SQLITE_TUNED          1 (padrão) aplica WAL, synchronous=NORMAL,
+                          busy_timeout, mmap e BEGIN IMMEDIATE (ver
+                          core/sqlite.py); 0 usa os padrões do Django
+    SQLITE_BUSY_TIMEOUT   segundos esperando um lock (padrão: 20)
+    SQLITE_MMAP_SIZE      bytes mapeados em memória (padrão: 128 MiB)
+    SQLITE_CACHE_SIZE     páginas de cache (negativo = KiB; padrão: -20000)
+    SQLITE_SYNCHRONOUS    NORMAL (padrão) ou FULL
+
+- postgresql: produção com vários workers do gunicorn.
+    Requer: pip install "psycopg[binary,pool]"
+    DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT
+    DB_CONN_MAX_AGE       segundos de conexão persistente (padrão: 60)
+    DB_POOL               1 usa o pool do psycopg (Django 5.1+); nesse caso
+                          as conexões persistentes ficam desligadas
+    DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE / DB_POOL_TIMEOUT
+"""
+import os
+
+
+# PRAGMAs do perfil sqlite com SQLITE_TUNED (aplicados por core.sqlite a
+# cada conexão nova, a partir de DATABASES[alias]["PRAGMAS"])
+PRAGMAS_PADRAO = {
+    # busy_timeout primeiro: a troca para WAL também precisa esperar locks
+    "busy_timeout": 20000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -20000,
+    "mmap_size": 128 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+def _env_bool(environ, name, default):
+    valor = environ.get(name)
+    if valor is None or valor == "":
+        return default
+    return valor.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(environ, name, default):
+    """
+    Inteiro da variável de ambiente `name`, ou `default` se vazia/ausente.
+    Usado também por FarofaTrip.cache.
+    """
+    valor = environ.get(name)
+    if valor is None or valor == "":
+        return default
+    return int(valor)
+
+
+def sqlite_config(environ, base_dir):
+    """
+    Perfil SQLite. Com SQLITE_TUNED, cada conexão recebe os PRAGMAs de
+    concorrência (chave "PRAGMAS", aplicada por core.sqlite) e as transações
+    de escrita começam com BEGIN IMMEDIATE (evita o 'database is locked' no
+    upgrade de lock de leitura para escrita).
+    """
+    config = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": environ.get("SQLITE_PATH") or base_dir / "db.sqlite3",
+        "OPTIONS": {},
+    }
+    if not _env_bool(environ, "SQLITE_TUNED", True):
+        return config
+
+    busy_timeout = env_int(environ, "SQLITE_BUSY_TIMEOUT", 20)
+    config["OPTIONS"] = {
+        "timeout": busy_timeout,
+        "transaction_mode": "IMMEDIATE",
+    }
+    config["PRAGMAS"] = {
+        **PRAGMAS_PADRAO,
+        "busy_timeout": busy_timeout * 1000,
+        "synchronous": environ.get("SQLITE_SYNCHRONOUS") or PRAGMAS_PADRAO["synchronous"],
+        "mmap_size": env_int(environ, "SQLITE_MMAP_SIZE", PRAGMAS_PADRAO["mmap_size"]),
+        "cache_size": env_int(environ, "SQLITE_CACHE_SIZE", PRAGMAS_PADRAO["cache_size"]),
+    }
+    return config
+
+
+def postgresql_config(environ):
+    """
+    Perfil PostgreSQL com conexões persistentes + health check, ou com o
+    pool de conexões do psycopg (DB_POOL=1).
+    """
+    config = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": environ.get("DB_NAME", "farofatrip"),
+        "USER": environ.get("DB_USER", "farofatrip"),
+        "PASSWORD": environ.get("DB_PASSWORD", ""),
+        "HOST": environ.get("DB_HOST", "localhost"),
+        "PORT": environ.get("DB_PORT", "5432"),
+        "CONN_MAX_AGE": env_int(environ, "DB_CONN_MAX_AGE", 60),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
+    }
+    if _env_bool(environ, "DB_POOL", False):
+        # O pool do Django não pode ser usado junto com CONN_MAX_AGE
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = {
+            "min_size": env_int(environ, "DB_POOL_MIN_SIZE", 2),
+            "max_size": env_int(environ, "DB_POOL_MAX_SIZE", 10),
+            "timeout": env_int(environ, "DB_POOL_TIMEOUT", 10),
+        }
+    return config
+
+
+def database_config(base_dir, environ=None):
+    """
+    Retorna o dicionário DATABASES['default'] para o perfil em DB_ENGINE.
+    """
+    environ = os.environ if environ is None else environ
+    engine = (environ.get("DB_ENGINE") or "sqlite").strip().lower()
+    if engine in ("postgres", "postgresql"):
+        return postgresql_config(environ)
+    if engine in ("sqlite", "sqlite3"):
+        return sqlite_config(environ, base_dir)
+    raise ValueError(f"DB_ENGINE desconhecido: {engine!r} (use sqlite ou postgresql)")
@@ -14,6 +14,9 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 
+from .cache import cache_config
+from .database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -104,15 +107,31 @@ JAZZMIN_UI_TWEAKS = {
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",          
+    # Antes dos demais: comprime o corpo final das respostas da API
+    "core.compressao.CompressaoMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # 503 quando o pool de hash de senhas está cheio (admin/formulários)
+    "core.hashing.HashingOcupadoMiddleware",
+    # Sessão, CSRF, autenticação, mensagens e X-Frame-Options só fora de
+    # /api/ (admin); a API usa JWT (core.middleware)
+    "core.middleware.ForaDaApiMiddleware",
+]
+
+MIDDLEWARE_FORA_DA_API = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+API_PREFIXOS = ("/api/",)
+
+# O admin procura sessão/autenticação/mensagens direto em MIDDLEWARE;
+# aqui eles estão em MIDDLEWARE_FORA_DA_API
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5500",
     "http://127.0.0.1:5500",
@@ -121,19 +140,69 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:8000",
 ]
 
+# Resultado do preflight em cache no navegador por 2 h: o limite do
+# Chrome (o padrão do django-cors-headers, 24 h, ele reduz para 2 h)
+CORS_PREFLIGHT_MAX_AGE = 7200
+
+# Headers de paginação/cache que o FrontEnd precisa ler
+CORS_EXPOSE_HEADERS = [
+    "Link",
+    "X-Page-Size",
+    "X-Count-Estimate",
+    "ETag",
+    "Last-Modified",
+]
+
 CSRF_TRUSTED_ORIGINS = [
     "http://localhost:5500",
     "http://localhost:5501",
 ]
 
 
+# Login por e-mail (uma query) ou username
+AUTHENTICATION_BACKENDS = [
+    'core.backends.EmailOrUsernameBackend',
+]
+
+# PBKDF2 em pool de threads limitado (503 + Retry-After quando cheio);
+# os demais hashers do Django continuam validando senhas antigas
+PASSWORD_HASHERS = [
+    'core.hashing.PBKDF2LimitadoPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWTAuthentication com cache do usuário em memória
+        'core.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Paginação por cursor; cada ViewSet define ordenação e tamanho máximo
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.KeysetPagination',
+    # JSON com orjson (core.renderers); a API navegável só com DEBUG
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.ORJSONRenderer',
+        *(('rest_framework.renderers.BrowsableAPIRenderer',) if DEBUG else ()),
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    # Janela deslizante por IP e por conta (core.throttling); as views de
+    # autenticação escolhem o escopo com throttle_scope
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': '30/min',
+        'login_conta': '10/min',
+        'registro_ip': '20/hour',
+        'registro_conta': '5/hour',
+        'senha_conta': '5/min',
+    },
 }
 
 
@@ -168,15 +237,25 @@ WSGI_APPLICATION = 'FarofaTrip.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+#
+# Perfil escolhido por variáveis de ambiente (ver FarofaTrip/database.py):
+# SQLite ajustado (padrão) ou PostgreSQL com conexões persistentes/pool.
 
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(BASE_DIR),
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# "default" é a camada compartilhada entre os workers (CACHE_BACKEND:
+# local, file, redis ou memcached; sem a variável, local com DEBUG e file
+# sem DEBUG; ver FarofaTrip/cache.py).
+
+CACHES = cache_config(BASE_DIR, debug=DEBUG)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -14,3 +14,14 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FarofaTrip.settings')
 
 application = get_wsgi_application()
+
+# Carrega o filtro da blacklist de refresh tokens antes da primeira request
+from django.db import DatabaseError  # noqa: E402
+
+from core.blacklist import filtro_blacklist  # noqa: E402
+
+try:
+    filtro_blacklist.aquece()
+except DatabaseError:
+    # Banco ainda sem migrations: o filtro é carregado na primeira verificação
+    pass
@@ -0,0 +1,9 @@
+"""
+Benchmarks do projeto FarofaTrip.
+
+Os benchmarks são escritos como TestCases do Django para reaproveitar o
+banco de testes (nunca tocam o db.sqlite3 real) e não fazem parte da suíte
+padrão. Para executar:
+
+    python manage.py test benchmarks -p "bench_*.py"
+"""
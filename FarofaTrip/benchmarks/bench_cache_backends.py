@@ -0,0 +1,64 @@
+import os
+import tempfile
+import time
+import unittest
+
+from django.utils.module_loading import import_string
+
+from FarofaTrip.cache import cache_compartilhado
+
+from .utils import reporta
+
+
+OPERACOES = int(os.environ.get("BENCH_CACHE_OPS", 2000))
+LOTE = 50
+
+# Backends comparados. Redis/memcached só entram com BENCH_CACHE_SOCKETS=1
+# e os serviços escutando nos sockets padrão (ou em CACHE_LOCATION).
+BACKENDS = ["local", "file"]
+if os.environ.get("BENCH_CACHE_SOCKETS"):
+    BACKENDS += ["redis", "memcached"]
+
+
+def cria_cache(backend, diretorio):
+    config = cache_compartilhado(
+        {**os.environ, "CACHE_BACKEND": backend, "CACHE_DIR": diretorio},
+        base_dir=diretorio,
+    )
+    config["KEY_PREFIX"] = "bench"
+    return import_string(config["BACKEND"])(config["LOCATION"], config)
+
+
+class CacheBackendsBenchmark(unittest.TestCase):
+    """
+    Custo de get/set/get_many em cada backend de FarofaTrip/cache.py,
+    com valores do tamanho de uma página do catálogo.
+    """
+
+    def _mede(self, fn, repeticoes):
+        inicio = time.perf_counter()
+        for i in range(repeticoes):
+            fn(i)
+        return round((time.perf_counter() - inicio) * 1_000_000 / repeticoes, 1)
+
+    def test_backends(self):
+        valor = {"results": [{"id": i, "nome": f"Evento {i}", "preco": "100.00"} for i in range(20)]}
+        linhas = []
+        with tempfile.TemporaryDirectory() as diretorio:
+            for backend in BACKENDS:
+                cache = cria_cache(backend, diretorio)
+                cache.clear()
+                chaves = [f"item:{i}" for i in range(LOTE)]
+                set_us = self._mede(lambda i: cache.set(f"pagina:{i % 100}", valor), OPERACOES)
+                get_us = self._mede(lambda i: cache.get(f"pagina:{i % 100}"), OPERACOES)
+                cache.set_many({c: i for i, c in enumerate(chaves)})
+                get_many_us = self._mede(lambda i: cache.get_many(chaves), OPERACOES // 10)
+                cache.clear()
+                cache.close()
+                linhas.append((backend, set_us, get_us, get_many_us))
+
+        reporta(
+            f"Cache ({OPERACOES} operações, get_many de {LOTE} chaves)",
+            linhas,
+            ["backend", "set (us)", "get (us)", "get_many (us)"],
+        )
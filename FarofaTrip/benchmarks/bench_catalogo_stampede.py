@@ -0,0 +1,117 @@
+import os
+import statistics
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APIClient
+
+from core.cache import obtem_com_revalidacao
+from core.catalogo import incrementa_versao_catalogo
+from core.models import Evento
+
+from .utils import reporta
+
+
+REQUESTS_CONCORRENTES = int(os.environ.get("BENCH_STAMPEDE_THREADS", 32))
+EXPIRACOES = int(os.environ.get("BENCH_STAMPEDE_RODADAS", 5))
+EVENTOS = 200
+
+
+def get_set_simples(chave, calcula, versao=None, timeout=None):
+    """
+    Comportamento anterior: cada request que não acha a entrada recalcula.
+    """
+    entrada = cache.get(chave)
+    if entrada is None or entrada[0] != versao:
+        entrada = (versao, calcula())
+        cache.set(chave, entrada, timeout)
+    return entrada[1]
+
+
+class CatalogoStampedeBenchmark(TransactionTestCase):
+    """
+    Queries ao banco por expiração do catálogo: a cada rodada a versão do
+    catálogo muda (como no save de um evento novo) e N requests chegam
+    juntas em /api/eventos/.
+
+    Compara o get/set simples (todas recalculam) com
+    core.cache.obtem_com_revalidacao (um recálculo; as demais recebem a
+    versão anterior).
+    """
+
+    def setUp(self):
+        data = date.today() + timedelta(days=30)
+        Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Local",
+                    cidade="Cidade",
+                    data=data,
+                    descricao="Descrição",
+                    ingresso=Decimal("100.00"),
+                )
+                for i in range(EVENTOS)
+            ]
+        )
+        cache.clear()
+
+    def _rodada(self, queries, latencias):
+        barreira = threading.Barrier(REQUESTS_CONCORRENTES)
+        lock = threading.Lock()
+
+        def conta(execute, sql, params, many, context):
+            # PRAGMAs da conexão nova de cada thread não contam
+            if not sql.startswith("PRAGMA"):
+                with lock:
+                    queries.append(sql)
+            return execute(sql, params, many, context)
+
+        def request():
+            client = APIClient()
+            barreira.wait()
+            inicio = time.perf_counter()
+            with connection.execute_wrapper(conta):
+                resposta = client.get("/api/eventos/")
+            with lock:
+                latencias.append((time.perf_counter() - inicio) * 1000)
+            connection.close()
+            self.assertEqual(resposta.status_code, 200)
+
+        threads = [threading.Thread(target=request) for _ in range(REQUESTS_CONCORRENTES)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _mede(self, estrategia):
+        cache.clear()
+        with mock.patch("core.views.obtem_com_revalidacao", estrategia):
+            # Aquece o cache (a primeira entrada não conta)
+            APIClient().get("/api/eventos/")
+            queries, latencias = [], []
+            for _ in range(EXPIRACOES):
+                incrementa_versao_catalogo()
+                self._rodada(queries, latencias)
+        return (
+            round(len(queries) / EXPIRACOES, 1),
+            round(statistics.median(latencias), 1),
+            round(max(latencias), 1),
+        )
+
+    def test_queries_por_expiracao(self):
+        linhas = [
+            ("get/set simples", *self._mede(get_set_simples)),
+            ("single-flight + stale", *self._mede(obtem_com_revalidacao)),
+        ]
+        reporta(
+            f"Catálogo: {REQUESTS_CONCORRENTES} requests por expiração ({EXPIRACOES} rodadas)",
+            linhas,
+            ["estratégia", "queries/expiração", "p50 (ms)", "máx (ms)"],
+        )
@@ -0,0 +1,82 @@
+import os
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from core import compressao
+from core.models import Evento
+
+from .utils import reporta
+
+
+LINHAS = int(os.environ.get("BENCH_LINHAS", 100))
+REPETICOES = 200
+
+
+class CompressaoBenchmark(TestCase):
+    """
+    Bytes no fio e CPU por request de GET /api/eventos/ com LINHAS
+    eventos (cache do catálogo quente), por codificação negociada:
+
+    - sem compressão;
+    - comprimindo a cada request (variantes do cache desligadas);
+    - com as variantes pré-computadas na entrada do catálogo.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        data = date.today() + timedelta(days=30)
+        Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Local do evento",
+                    cidade="São Paulo",
+                    data=data,
+                    descricao=f"Descrição do evento {i} em {data:%d/%m}. " * 5,
+                    ingresso=Decimal("149.90"),
+                    excursao=Decimal("35.00"),
+                )
+                for i in range(LINHAS)
+            ]
+        )
+
+    def _mede(self, accept_encoding, sem_variantes=False):
+        cache.clear()
+        url = reverse("evento-list")
+        params = {"page_size": LINHAS}
+        self.client.get(url, params, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+        if sem_variantes:
+            # Entrada nova sem variantes: o middleware comprime a cada request
+            with mock.patch("core.views.variantes_comprimidas", return_value=None):
+                cache.clear()
+                self.client.get(url, params, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+        inicio = time.process_time()
+        for _ in range(REPETICOES):
+            resp = self.client.get(url, params, HTTP_ACCEPT_ENCODING=accept_encoding)
+        cpu_ms = (time.process_time() - inicio) * 1000 / REPETICOES
+        return len(resp.content), resp.get("Content-Encoding", "-"), round(cpu_ms, 3)
+
+    def test_bytes_e_cpu_por_request(self):
+        linhas = []
+        casos = [("identity", "sem compressão", False)]
+        for codificacao in compressao.codificacoes_disponiveis():
+            casos.append((codificacao, "a cada request", True))
+            casos.append((codificacao, "pré-computada", False))
+
+        for accept, estrategia, sem_variantes in casos:
+            tamanho, encoding, cpu_ms = self._mede(accept, sem_variantes)
+            linhas.append((accept, estrategia, encoding, tamanho, cpu_ms))
+
+        reporta(
+            f"GET /api/eventos/ com {LINHAS} eventos ({REPETICOES} requests)",
+            linhas,
+            ["Accept-Encoding", "estratégia", "Content-Encoding", "bytes", "CPU ms/request"],
+        )
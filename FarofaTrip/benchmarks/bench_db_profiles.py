@@ -0,0 +1,123 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from django.core.management import call_command
+from django.db import OperationalError, connections, transaction
+
+from FarofaTrip.database import database_config
+from core.models import Evento, Pedido, PedidoItem
+
+from .utils import registra_alias, reporta
+
+
+WRITERS = int(os.environ.get("BENCH_WRITERS", 8))
+PEDIDOS_POR_WRITER = int(os.environ.get("BENCH_PEDIDOS", 50))
+ITENS_POR_PEDIDO = 3
+
+# Perfis comparados. O PostgreSQL só entra com BENCH_POSTGRES=1 e as
+# variáveis DB_* apontando para um servidor de testes (o banco é migrado).
+PERFIS = {
+    "sqlite-padrao": {"SQLITE_TUNED": "0"},
+    "sqlite-ajustado": {},
+}
+if os.environ.get("BENCH_POSTGRES"):
+    PERFIS["postgresql"] = {**os.environ, "DB_ENGINE": "postgresql", "DB_POOL": "0"}
+    PERFIS["postgresql-pool"] = {**os.environ, "DB_ENGINE": "postgresql", "DB_POOL": "1"}
+
+
+class DatabaseProfilesBenchmark(unittest.TestCase):
+    """
+    Vazão de criação de pedidos com N threads escrevendo ao mesmo tempo,
+    para cada perfil de FarofaTrip/database.py.
+
+    Cada perfil usa um banco próprio (arquivo temporário no SQLite),
+    registrado como um alias extra em django.db.connections.
+    """
+
+    def _prepara(self, alias):
+        call_command("migrate", database=alias, verbosity=0)
+        return Evento.objects.using(alias).bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Local",
+                    cidade="Cidade",
+                    data="2030-01-01",
+                    descricao="Descrição",
+                    ingresso=Decimal("100.00"),
+                )
+                for i in range(ITENS_POR_PEDIDO)
+            ]
+        )
+
+    def _writer(self, alias, eventos, erros):
+        """
+        Mesmo padrão de escrita do PedidoSerializer.create:
+        um INSERT do cabeçalho + um bulk INSERT dos itens, em uma transação.
+        """
+        try:
+            for _ in range(PEDIDOS_POR_WRITER):
+                try:
+                    with transaction.atomic(using=alias):
+                        pedido = Pedido.objects.using(alias).create(
+                            valor_total=Decimal("300.00"), status="pago"
+                        )
+                        PedidoItem.objects.using(alias).bulk_create(
+                            [
+                                PedidoItem(
+                                    pedido=pedido,
+                                    evento=evento,
+                                    quantidade=1,
+                                    preco_ingresso=evento.ingresso,
+                                    preco_excursao=Decimal("0.00"),
+                                    subtotal=evento.ingresso,
+                                )
+                                for evento in eventos
+                            ]
+                        )
+                except OperationalError:
+                    erros.append(1)
+        finally:
+            connections[alias].close()
+
+    def _mede_perfil(self, nome, environ, tmpdir):
+        alias = f"bench_{nome.replace('-', '_')}"
+        environ = {**environ, "SQLITE_PATH": str(Path(tmpdir) / f"{alias}.sqlite3")}
+        self.addCleanup(registra_alias(alias, database_config(Path(tmpdir), environ=environ)))
+        eventos = self._prepara(alias)
+
+        erros = []
+        threads = [
+            threading.Thread(target=self._writer, args=(alias, eventos, erros))
+            for _ in range(WRITERS)
+        ]
+        inicio = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        duracao = time.perf_counter() - inicio
+
+        gravados = Pedido.objects.using(alias).count()
+        return (nome, WRITERS, gravados, len(erros), round(gravados / duracao, 1))
+
+    def test_vazao_de_pedidos_por_perfil(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            linhas = [
+                self._mede_perfil(nome, environ, tmpdir)
+                for nome, environ in PERFIS.items()
+            ]
+
+        reporta(
+            f"Criação concorrente de pedidos ({PEDIDOS_POR_WRITER} por writer)",
+            linhas,
+            ["perfil", "writers", "pedidos", "erros_lock", "pedidos/s"],
+        )
+
+        ajustado = next(linha for linha in linhas if linha[0] == "sqlite-ajustado")
+        self.assertEqual(ajustado[3], 0)
@@ -0,0 +1,112 @@
+import os
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+
+from core.leitura import LeituraCompilada
+from core.models import Evento, Pedido, PedidoItem
+from core.serializers import EventoSerializer, PedidoSerializer
+
+from .utils import reporta
+
+
+User = get_user_model()
+
+LINHAS = int(os.environ.get("BENCH_LINHAS", 1000))
+# Tamanho das páginas lidas (prefetch e IN dos itens ficam por página,
+# como nas listagens da API)
+PAGINA = 100
+REPETICOES = 5
+
+
+class LeituraCompiladaBenchmark(TestCase):
+    """
+    Linhas por segundo na leitura de LINHAS eventos e pedidos (3 itens
+    cada), em páginas de PAGINA: queryset de instâncias + serializer
+    contra .values() + leitura compilada. Inclui o tempo das queries.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="bench", password="x")
+        data = date.today() + timedelta(days=30)
+        eventos = Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Local do evento",
+                    cidade="São Paulo",
+                    data=data,
+                    descricao="Descrição do evento",
+                    imagem=f"eventos/{i}.jpg",
+                    ingresso=Decimal("149.90"),
+                    excursao=Decimal("35.00"),
+                )
+                for i in range(LINHAS)
+            ]
+        )
+        pedidos = Pedido.objects.bulk_create(
+            [Pedido(usuario=user, valor_total=Decimal("554.70"), forma_pagamento="pix")
+             for _ in range(LINHAS)]
+        )
+        PedidoItem.objects.bulk_create(
+            [
+                PedidoItem(
+                    pedido=pedido,
+                    evento=eventos[(i + j) % LINHAS],
+                    quantidade=1,
+                    preco_ingresso=Decimal("149.90"),
+                    preco_excursao=Decimal("35.00"),
+                    subtotal=Decimal("184.90"),
+                )
+                for i, pedido in enumerate(pedidos)
+                for j in range(3)
+            ]
+        )
+
+    def _linhas_por_segundo(self, fn):
+        tempos = []
+        for _ in range(REPETICOES):
+            inicio = time.perf_counter()
+            fn()
+            tempos.append(time.perf_counter() - inicio)
+        return int(LINHAS / min(tempos))
+
+    def _paginas(self, queryset):
+        return [queryset.order_by("id")[i:i + PAGINA] for i in range(0, LINHAS, PAGINA)]
+
+    def _compara(self, nome, serializer_class, queryset, prefetch):
+        contexto = {"request": APIRequestFactory().get("/api/", HTTP_HOST="testserver")}
+        leitura = LeituraCompilada(serializer_class)
+
+        def serializer():
+            return [
+                serializer_class(pagina.prefetch_related(*prefetch), many=True, context=contexto).data
+                for pagina in self._paginas(queryset)
+            ]
+
+        def compilada():
+            return [
+                leitura.representa(leitura.consulta(pagina), contexto)
+                for pagina in self._paginas(queryset)
+            ]
+
+        self.assertEqual(compilada(), serializer())
+        antes = self._linhas_por_segundo(serializer)
+        depois = self._linhas_por_segundo(compilada)
+        return nome, antes, depois, f"{depois / antes:.1f}x"
+
+    def test_linhas_por_segundo(self):
+        linhas = [
+            self._compara("Evento", EventoSerializer, Evento.objects.all(), ()),
+            self._compara("Pedido", PedidoSerializer, Pedido.objects.all(), ("itens__evento",)),
+        ]
+        reporta(
+            f"Leitura de {LINHAS} linhas em páginas de {PAGINA} (linhas/s)",
+            linhas,
+            ["model", "serializer", "compilada", "ganho"],
+        )
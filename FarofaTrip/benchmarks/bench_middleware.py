@@ -0,0 +1,98 @@
+import time
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.http import JsonResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+
+from .utils import reporta
+
+
+REPETICOES = 5000
+RODADAS = 5
+
+# Cadeia antes de core.middleware.ForaDaApiMiddleware: tudo para todas as requests
+ANTES = [
+    "corsheaders.middleware.CorsMiddleware",
+    "core.compressao.CompressaoMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+
+@csrf_exempt  # como as APIViews do DRF
+def ping(request):
+    return JsonResponse({"ok": True})
+
+
+urlpatterns = [path("api/ping/", ping)]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class MiddlewareBenchmark(SimpleTestCase):
+    """
+    Custo da cadeia de middleware por request em /api/: handler do Django
+    com uma view trivial, sem middleware, com a cadeia antiga (ANTES) e
+    com a atual (settings.MIDDLEWARE). Vale a menor de RODADAS medições
+    intercaladas de REPETICOES requests; overhead = diferença para
+    "sem middleware".
+    """
+
+    def _handler(self, middleware):
+        with override_settings(MIDDLEWARE=middleware):
+            handler = BaseHandler()
+            handler.load_middleware()
+        return handler
+
+    def _us_por_request(self, handler, request):
+        inicio = time.perf_counter()
+        for _ in range(REPETICOES):
+            handler.get_response(request)
+        return (time.perf_counter() - inicio) * 1e6 / REPETICOES
+
+    def test_overhead_por_request(self):
+        factory = RequestFactory()
+        casos = [
+            ("GET anônimo", factory.get("/api/ping/")),
+            ("GET com JWT", factory.get("/api/ping/", HTTP_AUTHORIZATION="Bearer x.y.z")),
+            (
+                "POST com Origin",
+                factory.post("/api/ping/", {}, HTTP_ORIGIN="http://localhost:5500"),
+            ),
+        ]
+        handlers = [
+            self._handler(middleware) for middleware in ([], ANTES, list(settings.MIDDLEWARE))
+        ]
+        linhas = []
+        for nome, request in casos:
+            base, antes, depois = (
+                min(medidas)
+                for medidas in zip(
+                    *(
+                        [self._us_por_request(handler, request) for handler in handlers]
+                        for _ in range(RODADAS)
+                    )
+                )
+            )
+            linhas.append(
+                (
+                    nome,
+                    round(base, 1),
+                    round(antes, 1),
+                    round(depois, 1),
+                    round(antes - base, 1),
+                    round(depois - base, 1),
+                )
+            )
+        reporta(
+            f"Cadeia de middleware em /api/ (µs por request, menor de {RODADAS}x{REPETICOES})",
+            linhas,
+            ["request", "sem middleware", "antes", "depois", "overhead antes", "overhead depois"],
+        )
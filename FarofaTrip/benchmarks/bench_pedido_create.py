@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+
+from core.models import Evento
+from core.serializers import PedidoSerializer
+
+from .utils import mede, reporta
+
+
+User = get_user_model()
+
+TAMANHOS_CARRINHO = [1, 5, 10, 25, 50, 100]
+
+
+class PedidoCreateBenchmark(TestCase):
+    """
+    Mede queries e tempo da validação e do save() do PedidoSerializer
+    conforme o carrinho cresce. O número de queries deve ficar constante.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="bench", email="bench@example.com", password="x"
+        )
+        data = date.today() + timedelta(days=30)
+        cls.eventos = Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Local",
+                    cidade="Cidade",
+                    data=data,
+                    descricao="Descrição",
+                    ingresso=Decimal("100.00"),
+                    excursao=Decimal("25.00"),
+                )
+                for i in range(max(TAMANHOS_CARRINHO))
+            ]
+        )
+
+    def test_queries_por_tamanho_de_carrinho(self):
+        request = APIRequestFactory().post("/api/pedidos/")
+        request.user = self.user
+
+        linhas = []
+        for n in TAMANHOS_CARRINHO:
+            itens = [{"evento_id": e.id, "quantidade": 2} for e in self.eventos[:n]]
+            serializer = PedidoSerializer(
+                data={"itens": itens}, context={"request": request}
+            )
+            with mede() as v:
+                self.assertTrue(serializer.is_valid(), serializer.errors)
+            with mede() as m:
+                serializer.save()
+            linhas.append((n, v["queries"], v["ms"], m["queries"], m["ms"]))
+
+        reporta(
+            "PedidoSerializer is_valid() + save()",
+            linhas,
+            ["itens", "q_valid", "ms_valid", "q_save", "ms_save"],
+        )
+
+        # Contagem fixa: o número de queries não depende do carrinho
+        self.assertEqual(len({linha[1] for linha in linhas}), 1)
+        self.assertEqual(len({linha[3] for linha in linhas}), 1)
@@ -0,0 +1,169 @@
+import os
+import statistics
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import OperationalError, connections, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from FarofaTrip.database import database_config
+from core.retencao import limite_expiracao, purga_tokens
+
+from .utils import registra_alias, reporta
+
+
+# Use BENCH_TOKENS=2000000 para a medição completa (alguns minutos)
+TOKENS = int(os.environ.get("BENCH_TOKENS", 200_000))
+LOGINS_PARALELOS = int(os.environ.get("BENCH_LOGINS", 4))
+ALIAS = "bench_tokens"
+
+
+class PurgaTokensBenchmark(unittest.TestCase):
+    """
+    Purga de tokens expirados com logins acontecendo ao mesmo tempo.
+
+    Compara o DELETE único do `flushexpiredtokens` do SimpleJWT com a
+    purga em lotes de core.retencao, medindo a vazão da purga e a
+    latência dos logins (INSERT em OutstandingToken) durante a limpeza.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        environ = {"SQLITE_PATH": str(Path(cls.tmpdir.name) / "tokens.sqlite3")}
+        cls.remove_alias = registra_alias(
+            ALIAS, database_config(Path(cls.tmpdir.name), environ=environ)
+        )
+        call_command("migrate", database=ALIAS, verbosity=0)
+        cls.user = get_user_model().objects.db_manager(ALIAS).create_user(
+            username="bench", password="x"
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.remove_alias()
+        cls.tmpdir.cleanup()
+
+    def _popula(self):
+        """
+        TOKENS linhas: 90% expiradas, 10% do total na blacklist.
+        """
+        OutstandingToken.objects.using(ALIAS).all().delete()
+        agora = timezone.now()
+        lote = []
+        for i in range(TOKENS):
+            expirado = i % 10 != 0
+            lote.append(
+                OutstandingToken(
+                    user_id=self.user.id,
+                    jti=uuid.uuid4().hex,
+                    token="x" * 200,
+                    created_at=agora - timedelta(days=2),
+                    expires_at=agora - timedelta(days=1) if expirado else agora + timedelta(days=1),
+                )
+            )
+            if len(lote) == 10_000:
+                self._grava(lote)
+                lote = []
+        if lote:
+            self._grava(lote)
+        # Não deixa o checkpoint do WAL da carga cair em cima dos logins
+        with connections[ALIAS].cursor() as cursor:
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _grava(self, tokens):
+        with transaction.atomic(using=ALIAS):
+            criados = OutstandingToken.objects.using(ALIAS).bulk_create(tokens)
+            BlacklistedToken.objects.using(ALIAS).bulk_create(
+                [BlacklistedToken(token=t) for t in criados[1::10]]
+            )
+
+    def _logins(self, parar, latencias, erros):
+        try:
+            while not parar.is_set():
+                inicio = time.perf_counter()
+                try:
+                    with transaction.atomic(using=ALIAS):
+                        OutstandingToken.objects.using(ALIAS).create(
+                            user_id=self.user.id,
+                            jti=uuid.uuid4().hex,
+                            token="login",
+                            created_at=timezone.now(),
+                            expires_at=timezone.now() + timedelta(days=1),
+                        )
+                except OperationalError:
+                    erros.append(1)
+                latencias.append((time.perf_counter() - inicio) * 1000)
+                time.sleep(0.005)
+        finally:
+            connections[ALIAS].close()
+
+    def _mede(self, nome, purga):
+        self._popula()
+        parar = threading.Event()
+        latencias, erros = [], []
+        threads = [
+            threading.Thread(target=self._logins, args=(parar, latencias, erros))
+            for _ in range(LOGINS_PARALELOS)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)
+
+        inicio = time.perf_counter()
+        apagadas = purga()
+        duracao = time.perf_counter() - inicio
+
+        time.sleep(0.2)
+        parar.set()
+        for t in threads:
+            t.join()
+
+        latencias.sort()
+        p99 = latencias[int(len(latencias) * 0.99) - 1] if latencias else 0
+        return (
+            nome,
+            apagadas,
+            round(apagadas / duracao),
+            len(latencias),
+            round(statistics.median(latencias), 2) if latencias else 0,
+            round(p99, 2),
+            round(max(latencias, default=0), 2),
+            len(erros),
+        )
+
+    def test_purga_com_logins_concorrentes(self):
+        def delete_unico():
+            # Equivalente ao flushexpiredtokens do SimpleJWT
+            _, por_modelo = (
+                OutstandingToken.objects.using(ALIAS)
+                .filter(expires_at__lte=timezone.now())
+                .delete()
+            )
+            return sum(por_modelo.values())
+
+        def em_lotes():
+            total = purga_tokens(limite_expiracao(), using=ALIAS)
+            return total["outstanding"] + total["blacklisted"]
+
+        linhas = [
+            self._mede("delete único", delete_unico),
+            self._mede("lotes (core.retencao)", em_lotes),
+        ]
+        reporta(
+            f"Purga de {TOKENS} tokens com {LOGINS_PARALELOS} threads fazendo login",
+            linhas,
+            ["estratégia", "linhas", "linhas/s", "logins", "p50_ms", "p99_ms", "max_ms", "erros"],
+        )
+        self.assertEqual(linhas[1][-1], 0)
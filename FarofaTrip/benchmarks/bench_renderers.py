@@ -0,0 +1,107 @@
+import os
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Evento, Pedido, PedidoItem
+from core.renderers import ORJSONRenderer
+from core.serializers import EventoSerializer, PedidoSerializer
+
+from .utils import reporta
+
+
+User = get_user_model()
+
+LINHAS = int(os.environ.get("BENCH_LINHAS", 1000))
+REPETICOES = 5
+
+
+class RenderersBenchmark(TestCase):
+    """
+    Tempo para serializar e renderizar LINHAS eventos e pedidos (com 3
+    itens cada): serializer.data + JSONRenderer do DRF contra
+    serializer.data + ORJSONRenderer. Vale a menor de REPETICOES medições.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="bench", password="x")
+        data = date.today() + timedelta(days=30)
+        eventos = Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Local do evento",
+                    cidade="São Paulo",
+                    data=data,
+                    descricao="Descrição do evento " * 5,
+                    ingresso=Decimal("149.90"),
+                    excursao=Decimal("35.00"),
+                )
+                for i in range(LINHAS)
+            ]
+        )
+        pedidos = Pedido.objects.bulk_create(
+            [Pedido(usuario=user, valor_total=Decimal("554.70")) for _ in range(LINHAS)]
+        )
+        PedidoItem.objects.bulk_create(
+            [
+                PedidoItem(
+                    pedido=pedido,
+                    evento=eventos[(i + j) % LINHAS],
+                    quantidade=1,
+                    preco_ingresso=Decimal("149.90"),
+                    preco_excursao=Decimal("35.00"),
+                    subtotal=Decimal("184.90"),
+                )
+                for i, pedido in enumerate(pedidos)
+                for j in range(3)
+            ]
+        )
+
+    def _menor_ms(self, fn):
+        tempos = []
+        for _ in range(REPETICOES):
+            inicio = time.perf_counter()
+            fn()
+            tempos.append((time.perf_counter() - inicio) * 1000)
+        return round(min(tempos), 1)
+
+    def _compara(self, nome, instancias, serializer_class):
+        data = serializer_class(instancias, many=True).data
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+        serializa = self._menor_ms(lambda: serializer_class(instancias, many=True).data)
+        drf = self._menor_ms(lambda: JSONRenderer().render(data))
+        rapido = self._menor_ms(lambda: ORJSONRenderer().render(data))
+        return (
+            nome,
+            serializa,
+            drf,
+            rapido,
+            round(serializa + drf, 1),
+            round(serializa + rapido, 1),
+        )
+
+    def test_serializacao_por_mil_linhas(self):
+        eventos = list(Evento.objects.order_by("id"))
+        # Prefetch em blocos: IN com milhares de ids estoura o limite do SQLite
+        pedidos = list(
+            Pedido.objects.select_related("usuario")
+            .prefetch_related("itens__evento")
+            .order_by("id")
+            .iterator(chunk_size=500)
+        )
+        linhas = [
+            self._compara("Evento", eventos, EventoSerializer),
+            self._compara("Pedido", pedidos, PedidoSerializer),
+        ]
+        reporta(
+            f"Serialização de {LINHAS} linhas (ms)",
+            linhas,
+            ["model", "serializer", "JSONRenderer", "ORJSONRenderer", "total antes", "total depois"],
+        )
@@ -0,0 +1,59 @@
+import time
+from contextlib import contextmanager
+
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+
+
+def reporta(titulo, linhas, colunas):
+    """
+    Imprime uma tabela simples com os resultados de um benchmark.
+
+    - titulo: nome do benchmark.
+    - linhas: lista de tuplas com os valores de cada linha.
+    - colunas: nomes das colunas (mesma ordem das tuplas).
+    """
+    larguras = [
+        max(len(str(c)), *(len(str(linha[i])) for linha in linhas))
+        for i, c in enumerate(colunas)
+    ]
+    print()
+    print(f"== {titulo}")
+    print("  ".join(str(c).rjust(w) for c, w in zip(colunas, larguras)))
+    for linha in linhas:
+        print("  ".join(str(v).rjust(w) for v, w in zip(linha, larguras)))
+
+
+@contextmanager
+def mede():
+    """
+    Context manager que mede tempo (ms) e número de queries do bloco.
+
+    Uso:
+        with mede() as m:
+            ...
+        m["ms"], m["queries"]
+    """
+    resultado = {}
+    with CaptureQueriesContext(connection) as ctx:
+        inicio = time.perf_counter()
+        yield resultado
+        resultado["ms"] = round((time.perf_counter() - inicio) * 1000, 2)
+    resultado["queries"] = len(ctx.captured_queries)
+
+
+def registra_alias(alias, config):
+    """
+    Registra um banco extra em django.db.connections (ex.: um SQLite em
+    arquivo temporário) e retorna a função que o remove.
+    """
+    # configure_settings preenche os defaults (AUTOCOMMIT, TIME_ZONE...)
+    connections.settings[alias] = connections.configure_settings(
+        {"default": connections.settings["default"], alias: config}
+    )[alias]
+
+    def remove():
+        connections[alias].close()
+        del connections.settings[alias]
+
+    return remove
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Perfil, Evento, Pedido
+from .models import Perfil, Evento, Pedido, NotificacaoWhatsApp
 
 
 @admin.register(Perfil)
@@ -44,3 +44,21 @@ class PedidoAdmin(admin.ModelAdmin):
         "valor_total",
         "observacoes",
     )
+
+
+@admin.register(NotificacaoWhatsApp)
+class NotificacaoWhatsAppAdmin(admin.ModelAdmin):
+    """
+    Configura a interface de administração da fila de notificações de WhatsApp.
+    Permite acompanhar envios pendentes e mensagens em dead letter ('falhou').
+    """
+    list_display = (
+        "id",
+        "pedido",
+        "status",
+        "tentativas",
+        "proxima_tentativa_em",
+        "enviado_em",
+    )
+    list_filter = ("status",)
+    readonly_fields = ("criado_em", "enviado_em", "lote", "bloqueado_em")
@@ -7,6 +7,13 @@ class CoreConfig(AppConfig):
 
     - default_auto_field define o tipo padrão de chave primária.
     - name é o caminho da app dentro do projeto.
+    - ready() registra os signals da app (core.signals): caches,
+      índice de busca full-text após as migrations, PRAGMAs do SQLite em
+      cada conexão nova e filtro em memória da blacklist de refresh
+      tokens.
     """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,164 @@
+# FarofaTrip/core/authentication.py
+"""
+Autenticação JWT sem o SELECT em auth_user a cada request.
+
+- CachedJWTAuthentication: igual ao JWTAuthentication do SimpleJWT, mas
+  guarda o usuário em um cache LRU em memória (por processo), com TTL.
+  O cache do usuário é apagado no save/delete (core.signals), o que cobre
+  troca de senha, edição de perfil e desativação. Em outros processos
+  (outros workers do gunicorn) a mudança vale em até JWT_USER_CACHE_TTL
+  segundos.
+- ClaimsOnlyJWTAuthentication: não consulta o banco; request.user é um
+  TokenUser com os claims do token (id, is_active=True). Só serve para
+  views que usam apenas request.user.id.
+
+Configuração (settings):
+    JWT_USER_CACHE_SIZE   número máximo de usuários em cache (padrão: 1024)
+    JWT_USER_CACHE_TTL    segundos de validade de cada entrada (padrão: 60)
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication,
+    JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class CacheLRU:
+    """
+    Cache LRU com TTL, thread-safe, em memória do processo.
+
+    Tamanho e TTL podem ser callables (lidos a cada uso), para acompanhar
+    mudanças de settings nos testes.
+    """
+
+    def __init__(self, max_size, ttl):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size() if callable(self._max_size) else self._max_size
+
+    @property
+    def ttl(self):
+        return self._ttl() if callable(self._ttl) else self._ttl
+
+    def get(self, chave):
+        with self._lock:
+            entrada = self._dados.get(chave)
+            if entrada is None:
+                return None
+            expira_em, valor = entrada
+            if expira_em <= time.monotonic():
+                del self._dados[chave]
+                return None
+            self._dados.move_to_end(chave)
+            return valor
+
+    def set(self, chave, valor):
+        max_size = self.max_size
+        if max_size <= 0:
+            return
+        with self._lock:
+            self._dados[chave] = (time.monotonic() + self.ttl, valor)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > max_size:
+                self._dados.popitem(last=False)
+
+    def delete(self, chave):
+        with self._lock:
+            self._dados.pop(chave, None)
+
+    def delete_matching(self, predicado):
+        """
+        Remove as entradas cuja chave satisfaz predicado(chave).
+        """
+        with self._lock:
+            for chave in [c for c in self._dados if predicado(c)]:
+                del self._dados[chave]
+
+    def clear(self):
+        with self._lock:
+            self._dados.clear()
+
+    def __len__(self):
+        return len(self._dados)
+
+
+usuarios_em_cache = CacheLRU(
+    max_size=lambda: getattr(settings, "JWT_USER_CACHE_SIZE", 1024),
+    ttl=lambda: getattr(settings, "JWT_USER_CACHE_TTL", 60),
+)
+
+
+def invalida_usuario_em_cache(user_id):
+    user_id = str(user_id)
+    usuarios_em_cache.delete_matching(lambda chave: chave[0] == user_id)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication com o usuário resolvido pelo cache LRU.
+
+    Na primeira request o usuário vem do banco (com as verificações do
+    SimpleJWT); nas seguintes, do cache, repetindo as verificações de
+    usuário ativo e de revogação por troca de senha. Cada request recebe
+    uma cópia da instância, então alterações em request.user não vazam
+    para o cache.
+
+    A chave é (user_id, jti): uma entrada só atende o próprio token para
+    o qual o usuário foi carregado.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = str(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+        chave = (user_id, validated_token.get(api_settings.JTI_CLAIM))
+
+        user = usuarios_em_cache.get(chave)
+        if user is None:
+            user = super().get_user(validated_token)
+            usuarios_em_cache.set(chave, copy.copy(user))
+            return user
+
+        self.verifica_usuario(user, validated_token)
+        return copy.copy(user)
+
+    def verifica_usuario(self, user, validated_token):
+        """
+        Mesmas verificações do JWTAuthentication.get_user, sobre o
+        usuário em cache.
+        """
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+
+class ClaimsOnlyJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Modo só-claims: request.user é um TokenUser montado a partir do
+    token, sem nenhuma query. Use em authentication_classes de views
+    que só precisam do id do usuário.
+    """
@@ -0,0 +1,37 @@
+# FarofaTrip/core/backends.py
+"""
+Backend de autenticação por e-mail ou username.
+
+authenticate(email=..., password=...) busca e verifica o usuário em uma
+única query sobre LOWER(email), atendida pelo índice único
+core_user_email_lower_uniq (não existem dois usuários com o mesmo e-mail).
+Sem e-mail, segue o fluxo padrão do ModelBackend por username.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from .models import usuarios_por_email
+
+
+class EmailOrUsernameBackend(ModelBackend):
+    """
+    ModelBackend que também aceita o kwarg `email`.
+    """
+
+    def authenticate(self, request, username=None, password=None, email=None, **kwargs):
+        if email is None:
+            return super().authenticate(request, username=username, password=password, **kwargs)
+        if not email or password is None:
+            return None
+
+        UserModel = get_user_model()
+        try:
+            user = usuarios_por_email(email).get()
+        except UserModel.DoesNotExist:
+            # Mesmo custo de um login válido (não revela se o e-mail existe)
+            UserModel().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,234 @@
+# FarofaTrip/core/blacklist.py
+"""
+Filtro em memória da blacklist de refresh tokens (token_blacklist).
+
+O SimpleJWT consulta token_blacklist_blacklistedtoken a cada refresh e a
+cada logout. Aqui cada processo mantém um filtro de Bloom com os JTIs na
+blacklist:
+
+- o filtro é carregado na primeira verificação (ou em aquece(), chamado
+  no wsgi) e depois atualizado de forma incremental (linhas com id maior
+  que o último visto menos BLACKLIST_SYNC_MARGEM, padrão 1000, para
+  pegar ids commitados fora de ordem);
+- um token cujo JTI não está no filtro com certeza não está na blacklist:
+  o refresh não toca no banco;
+- um possível acerto (ou falso positivo) confirma no banco, com a
+  consulta original do SimpleJWT.
+
+Blacklists feitas neste processo entram no filtro na hora (post_save).
+As de outros processos são vistas quando a versão compartilhada no cache
+muda ou, no máximo, a cada BLACKLIST_SYNC_INTERVAL segundos (padrão: 5).
+"""
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .cache import incrementa_versao, versao
+
+NAMESPACE = "blacklist"
+CAPACIDADE_MINIMA = 10000
+TAXA_FALSO_POSITIVO = 0.01
+
+
+class FiltroBloom:
+    """
+    Filtro de Bloom simples sobre strings: sem falsos negativos, com
+    taxa de falsos positivos ~taxa até `capacidade` elementos.
+    """
+
+    def __init__(self, capacidade, taxa=TAXA_FALSO_POSITIVO):
+        self.capacidade = capacidade
+        self.bits = max(8, int(-capacidade * math.log(taxa) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacidade * math.log(2)))
+        self._dados = bytearray((self.bits + 7) // 8)
+        self.elementos = 0
+
+    def _posicoes(self, valor):
+        digest = hashlib.blake2b(valor.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, valor):
+        for pos in self._posicoes(valor):
+            self._dados[pos >> 3] |= 1 << (pos & 7)
+        self.elementos += 1
+
+    def __contains__(self, valor):
+        return all(self._dados[pos >> 3] & (1 << (pos & 7)) for pos in self._posicoes(valor))
+
+
+def intervalo_sincronizacao():
+    return getattr(settings, "BLACKLIST_SYNC_INTERVAL", 5)
+
+
+def margem_sincronizacao():
+    return getattr(settings, "BLACKLIST_SYNC_MARGEM", 1000)
+
+
+def versao_compartilhada():
+    return versao(NAMESPACE)
+
+
+def incrementa_versao_compartilhada():
+    incrementa_versao(NAMESPACE)
+
+
+class FiltroBlacklist:
+    """
+    Filtro de Bloom dos JTIs na blacklist, com carga inicial e
+    sincronização incremental a partir do banco.
+
+    A sincronização relê as últimas BLACKLIST_SYNC_MARGEM linhas abaixo
+    do maior id já visto: no PostgreSQL os ids da sequência podem ser
+    commitados fora de ordem, e uma linha de id menor que aparece depois
+    seria pulada por um simples id > ultimo_id (falso negativo: o token
+    na blacklist seria aceito). Os ids da margem já vistos ficam em
+    `recentes` para não contar a mesma linha duas vezes.
+
+    As consultas ao banco rodam fora de `_lock` (que só protege o
+    filtro); `_lock_sync` garante uma sincronização por vez, e as outras
+    threads seguem com o filtro atual em vez de esperar.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lock_sync = threading.Lock()
+        self.reinicia()
+
+    def reinicia(self):
+        """
+        Descarta o filtro; a próxima verificação recarrega do banco.
+        """
+        self.bloom = None
+        self.ultimo_id = 0
+        self.recentes = set()
+        self.versao = None
+        self.sincronizado_em = 0.0
+        self._adicionados = None
+
+    def _linhas(self, a_partir_de_id=0):
+        return (
+            BlacklistedToken.objects.filter(id__gt=a_partir_de_id)
+            .order_by("id")
+            .values_list("id", "token__jti")
+        )
+
+    def aquece(self):
+        """
+        Carga completa: dimensiona o filtro para o dobro das linhas atuais.
+        """
+        with self._lock_sync:
+            self._carrega()
+
+    def _carrega(self):
+        with self._lock:
+            # JTIs registrados por adiciona() durante a carga entram no novo filtro
+            self._adicionados = []
+        versao = versao_compartilhada()
+        total = BlacklistedToken.objects.count()
+        bloom = FiltroBloom(max(CAPACIDADE_MINIMA, 2 * total))
+        ids = []
+        for pk, jti in self._linhas().iterator(chunk_size=2000):
+            bloom.add(jti)
+            ids.append(pk)
+        ultimo_id = ids[-1] if ids else 0
+        with self._lock:
+            for jti in self._adicionados:
+                bloom.add(jti)
+            self._adicionados = None
+            self.bloom = bloom
+            self.ultimo_id = ultimo_id
+            self.recentes = {pk for pk in ids if pk > ultimo_id - margem_sincronizacao()}
+            self.versao = versao
+            self.sincronizado_em = time.monotonic()
+
+    def _sincroniza(self):
+        versao = versao_compartilhada()
+        linhas = list(self._linhas(max(0, self.ultimo_id - margem_sincronizacao())))
+        with self._lock:
+            for pk, jti in linhas:
+                if pk not in self.recentes:
+                    self.bloom.add(jti)
+                    self.recentes.add(pk)
+            self.ultimo_id = max([self.ultimo_id] + [pk for pk, _ in linhas])
+            limite = self.ultimo_id - margem_sincronizacao()
+            self.recentes = {pk for pk in self.recentes if pk > limite}
+            self.versao = versao
+            self.sincronizado_em = time.monotonic()
+            cheio = self.bloom.elementos > self.bloom.capacidade
+        if cheio:
+            # Acima da capacidade a taxa de falsos positivos sobe: refaz
+            self._carrega()
+
+    def _precisa_sincronizar(self):
+        vencido = time.monotonic() - self.sincronizado_em >= intervalo_sincronizacao()
+        return vencido or versao_compartilhada() != self.versao
+
+    def _atualiza(self):
+        if self.bloom is None:
+            # Sem filtro ainda: espera a carga (a própria ou a de outra thread)
+            with self._lock_sync:
+                if self.bloom is None:
+                    self._carrega()
+            return
+        if not self._precisa_sincronizar():
+            return
+        if not self._lock_sync.acquire(blocking=False):
+            # Outra thread já está sincronizando: usa o filtro atual
+            return
+        try:
+            if self._precisa_sincronizar():
+                self._sincroniza()
+        finally:
+            self._lock_sync.release()
+
+    def pode_conter(self, jti):
+        """
+        False: o JTI com certeza não está na blacklist.
+        True: talvez esteja (confirmar no banco).
+        """
+        self._atualiza()
+        with self._lock:
+            return jti in self.bloom
+
+    def adiciona(self, jti):
+        """
+        Registra um JTI recém-colocado na blacklist por este processo.
+        """
+        with self._lock:
+            if self.bloom is not None:
+                self.bloom.add(jti)
+            if self._adicionados is not None:
+                self._adicionados.append(jti)
+
+
+filtro_blacklist = FiltroBlacklist()
+
+
+def registra_blacklist(jti):
+    """
+    Token novo na blacklist (post_save de BlacklistedToken, em
+    core.signals): atualiza o filtro local e avisa os outros processos
+    pela versão no cache.
+    """
+    filtro_blacklist.adiciona(jti)
+    incrementa_versao_compartilhada()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    RefreshToken que só consulta a blacklist no banco quando o filtro
+    em memória indica um possível acerto.
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if filtro_blacklist.pode_conter(jti):
+            super().check_blacklist()
@@ -0,0 +1,215 @@
+# FarofaTrip/core/busca.py
+"""
+Busca textual de eventos com índice full-text.
+
+- SQLite: tabela virtual FTS5 `core_evento_fts` (external content sobre
+  core_evento), mantida por triggers, com tokenizer unicode61 e
+  remove_diacritics (busca sem acento: "sao" encontra "São").
+  Ranking por bm25().
+- PostgreSQL: índice GIN sobre to_tsvector('pt_unaccent', ...), uma
+  configuração de text search baseada em 'portuguese' + unaccent.
+  Ranking por ts_rank().
+- Outros bancos: mantém o SearchFilter padrão do DRF (icontains).
+
+Cada termo da busca vira um prefixo ("fest" encontra "Festival") e todos
+os termos precisam aparecer em algum dos campos (mesma regra do
+SearchFilter do DRF).
+"""
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+
+CAMPOS_BUSCA = ("nome", "cidade", "local", "descricao")
+TABELA_FTS = "core_evento_fts"
+CONFIG_PG = "pt_unaccent"
+INDICE_PG = "core_evento_busca_gin"
+
+_PALAVRA = re.compile(r"\w+", re.UNICODE)
+
+
+# --- Instalação do índice (usado pela migration e pelo post_migrate) ---
+
+def _sql_triggers_sqlite():
+    campos = ", ".join(CAMPOS_BUSCA)
+    novos = ", ".join(f"new.{c}" for c in CAMPOS_BUSCA)
+    antigos = ", ".join(f"old.{c}" for c in CAMPOS_BUSCA)
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {TABELA_FTS}_ai AFTER INSERT ON core_evento BEGIN
+            INSERT INTO {TABELA_FTS}(rowid, {campos}) VALUES (new.id, {novos});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {TABELA_FTS}_ad AFTER DELETE ON core_evento BEGIN
+            INSERT INTO {TABELA_FTS}({TABELA_FTS}, rowid, {campos})
+            VALUES ('delete', old.id, {antigos});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {TABELA_FTS}_au AFTER UPDATE ON core_evento BEGIN
+            INSERT INTO {TABELA_FTS}({TABELA_FTS}, rowid, {campos})
+            VALUES ('delete', old.id, {antigos});
+            INSERT INTO {TABELA_FTS}(rowid, {campos}) VALUES (new.id, {novos});
+        END
+        """,
+    ]
+
+
+def instala_indice_sqlite(cursor):
+    """
+    Cria (se preciso) a tabela FTS5 e os triggers, e reconstrói o índice.
+    Idempotente.
+    """
+    cursor.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {TABELA_FTS} USING fts5(
+            {", ".join(CAMPOS_BUSCA)},
+            content='core_evento',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    for sql in _sql_triggers_sqlite():
+        cursor.execute(sql)
+    cursor.execute(f"INSERT INTO {TABELA_FTS}({TABELA_FTS}) VALUES ('rebuild')")
+
+
+def remove_indice_sqlite(cursor):
+    for sufixo in ("ai", "ad", "au"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {TABELA_FTS}_{sufixo}")
+    cursor.execute(f"DROP TABLE IF EXISTS {TABELA_FTS}")
+
+
+def triggers_sqlite_instalados(cursor):
+    cursor.execute(
+        "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+        [f"{TABELA_FTS}_%"],
+    )
+    return cursor.fetchone()[0] == 3
+
+
+def _vetor_pg():
+    from django.contrib.postgres.search import SearchVector
+
+    return SearchVector(*CAMPOS_BUSCA, config=CONFIG_PG)
+
+
+def instala_indice_postgres(schema_editor, model):
+    """
+    Cria a extensão unaccent, a configuração pt_unaccent e o índice GIN.
+    """
+    from django.contrib.postgres.indexes import GinIndex
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    schema_editor.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{CONFIG_PG}') THEN
+                CREATE TEXT SEARCH CONFIGURATION {CONFIG_PG} (COPY = portuguese);
+                ALTER TEXT SEARCH CONFIGURATION {CONFIG_PG}
+                    ALTER MAPPING FOR hword, hword_part, word
+                    WITH unaccent, portuguese_stem;
+            END IF;
+        END
+        $$;
+        """
+    )
+    schema_editor.add_index(model, GinIndex(_vetor_pg(), name=INDICE_PG))
+
+
+def remove_indice_postgres(schema_editor, model):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDICE_PG}")
+
+
+def garante_indice_busca(using=DEFAULT_DB_ALIAS):
+    """
+    Chamada após as migrations (post_migrate, em core.signals): no
+    SQLite, migrations que recriam a tabela core_evento apagam os
+    triggers. Reinstala o índice se faltar algum.
+    """
+    conexao = connections[using]
+    if conexao.vendor != "sqlite":
+        return
+    tabelas = conexao.introspection.table_names()
+    if "core_evento" not in tabelas:
+        return
+    with conexao.cursor() as cursor:
+        if TABELA_FTS not in tabelas or not triggers_sqlite_instalados(cursor):
+            instala_indice_sqlite(cursor)
+
+
+# --- Consulta ---
+
+def termos_normalizados(termos):
+    """
+    Quebra os termos em palavras (descarta pontuação e operadores).
+    """
+    palavras = []
+    for termo in termos:
+        palavras.extend(_PALAVRA.findall(termo))
+    return palavras
+
+
+def consulta_fts5(palavras):
+    # Cada palavra entre aspas (sem operadores FTS) e como prefixo
+    return " ".join(f'"{p}"*' for p in palavras)
+
+
+def consulta_tsquery(palavras):
+    return " & ".join(f"{p}:*" for p in palavras)
+
+
+def busca_sqlite(queryset, palavras):
+    consulta = consulta_fts5(palavras)
+    ids = RawSQL(
+        f"SELECT rowid FROM {TABELA_FTS} WHERE {TABELA_FTS} MATCH %s", [consulta]
+    )
+    rank = RawSQL(
+        f"SELECT bm25({TABELA_FTS}) FROM {TABELA_FTS} "
+        f"WHERE {TABELA_FTS} MATCH %s AND rowid = core_evento.id",
+        [consulta],
+    )
+    # bm25: quanto menor, mais relevante
+    return queryset.filter(id__in=ids).annotate(busca_rank=rank), "busca_rank"
+
+
+def busca_postgres(queryset, palavras):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    consulta = SearchQuery(
+        consulta_tsquery(palavras), config=CONFIG_PG, search_type="raw"
+    )
+    qs = queryset.annotate(busca_vetor=_vetor_pg()).filter(busca_vetor=consulta)
+    return qs.annotate(busca_rank=SearchRank("busca_vetor", consulta)), "-busca_rank"
+
+
+BACKENDS = {
+    "sqlite": busca_sqlite,
+    "postgresql": busca_postgres,
+}
+
+
+class EventoSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter que usa o índice full-text do banco quando disponível.
+
+    Mantém o parâmetro ?search=. Sem ?ordering= explícito, os resultados
+    vêm ordenados por relevância (e depois por data e id). Deve ficar
+    depois do OrderingFilter em filter_backends.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        palavras = termos_normalizados(self.get_search_terms(request))
+        backend = BACKENDS.get(connection.vendor)
+        if not palavras or backend is None:
+            return super().filter_queryset(request, queryset, view)
+
+        qs, ordem_rank = backend(queryset, palavras)
+        if not request.query_params.get(filters.OrderingFilter.ordering_param):
+            qs = qs.order_by(ordem_rank, "data", "id")
+        return qs
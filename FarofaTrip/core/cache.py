@@ -0,0 +1,287 @@
+# FarofaTrip/core/cache.py
+"""
+Helpers de cache do core sobre o cache compartilhado (CACHES["default"]).
+
+- Chaves versionadas: chave(namespace, ...) inclui a versão atual do
+  namespace; incrementa_versao(namespace) invalida todas as chaves dele
+  de uma vez (as antigas expiram sozinhas pelo TTL).
+- Chaves por instância: chave_instancia(namespace, pk), apagadas
+  diretamente quando a instância muda.
+- Chaves por dono: chave(namespace_dono(namespace, pk), ...) versiona
+  as chaves de um dono (ex.: páginas do histórico de pedidos de um
+  usuário); incrementar a versão dele não afeta os demais.
+- obtem_ou_calcula / obtem_muitos_ou_calcula: get-or-compute com tipo
+  esperado; uma entrada de outro tipo (ex.: gravada por uma versão
+  antiga do código) é tratada como ausente e recalculada.
+- invalida_instancia: chamada pelos signals de post_save/post_delete
+  (core.signals) de Evento, Perfil (e User) e Pedido (e PedidoItem).
+  Apaga a chave da instância (preço do evento em core.precos, perfil de
+  GET /usuarios/me/) ou incrementa a versão do namespace do dono
+  (histórico de pedidos em GET /pedidos/).
+
+- obtem_com_revalidacao: get-or-compute para chaves quentes (catálogo),
+  com proteção contra stampede:
+    * single-flight: só quem obtém o lock da chave recalcula; os outros
+      recebem o valor antigo (stale-while-revalidate) ou, se não houver
+      nenhum, esperam brevemente pelo novo. O lock usa cache.add e só é
+      exclusivo entre processos com Redis ou Memcached (no
+      FileBasedCache o add não é atômico);
+    * expiração antecipada probabilística (XFetch): perto do fim do TTL,
+      uma request sorteada recalcula antes de a entrada expirar, com
+      probabilidade maior quanto mais caro foi o último cálculo;
+    * a versão do conteúdo fica dentro da entrada (e não na chave): uma
+      invalidação por versão também serve o valor antigo enquanto uma
+      única request recalcula.
+
+Configuração (settings):
+    CORE_CACHE_TIMEOUT       TTL padrão das entradas (padrão: 300 s)
+    CORE_CACHE_STALE_TTL     por quanto tempo, depois do TTL, o valor
+                             antigo ainda pode ser servido (padrão: 60 s)
+    CORE_CACHE_ESPERA        espera máxima por um recálculo em andamento
+                             quando não há valor antigo (padrão: 0.5 s)
+    CORE_CACHE_BETA          agressividade do XFetch; 0 desliga (padrão: 1.0)
+    CORE_CACHE_LOCK_TIMEOUT  validade do lock de recálculo (padrão: 10 s)
+
+A versão de cada namespace começa no relógio (ms): se a chave da versão
+for despejada do cache, o novo valor nunca coincide com uma versão
+antiga ainda em cache.
+"""
+import hashlib
+import math
+import random
+import re
+import time
+from operator import attrgetter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.utils import timezone
+
+
+# label do model -> (namespace, atributo com o id da instância no namespace):
+# o save/delete apaga chave_instancia(namespace, id)
+NAMESPACES_POR_MODELO = {
+    "core.evento": ("evento", "pk"),
+    "core.perfil": ("perfil", "user_id"),
+    settings.AUTH_USER_MODEL.lower(): ("perfil", "pk"),
+}
+
+# label do model -> (namespace, atributo com o id do dono): o save/delete
+# incrementa a versão de namespace_dono(namespace, id) depois do commit
+VERSOES_POR_MODELO = {
+    "core.pedido": ("pedidos", "usuario_id"),
+    "core.pedidoitem": ("pedidos", "pedido.usuario_id"),
+}
+
+TAMANHO_MAXIMO_CHAVE = 200
+_CHAVE_SEGURA = re.compile(r"^[\w.:,=@-]*$")
+_AUSENTE = object()
+
+
+def _versao_inicial():
+    return int(timezone.now().timestamp() * 1000)
+
+
+def chave_versao(namespace):
+    return f"{namespace}:versao"
+
+
+def versao(namespace):
+    """
+    Versão atual do namespace (criada na primeira leitura).
+    """
+    atual = cache.get(chave_versao(namespace))
+    if atual is None:
+        cache.add(chave_versao(namespace), _versao_inicial(), None)
+        atual = cache.get(chave_versao(namespace))
+    return atual
+
+
+def incrementa_versao(namespace):
+    """
+    Invalida todas as chaves versionadas do namespace.
+    """
+    try:
+        cache.incr(chave_versao(namespace))
+    except ValueError:
+        # Chave ainda não existe (ou foi despejada do cache)
+        cache.add(chave_versao(namespace), _versao_inicial(), None)
+
+
+def _parte_segura(texto):
+    # Memcached não aceita espaços/controle nem chaves com mais de 250 bytes
+    if len(texto) <= TAMANHO_MAXIMO_CHAVE and _CHAVE_SEGURA.match(texto):
+        return texto
+    return hashlib.md5(texto.encode("utf-8")).hexdigest()
+
+
+def chave(namespace, *partes):
+    """
+    Chave versionada: "<namespace>:v<versão>:<partes>".
+    """
+    resto = _parte_segura(":".join(str(p) for p in partes))
+    return f"{namespace}:v{versao(namespace)}:{resto}"
+
+
+def chave_instancia(namespace, pk):
+    return f"{namespace}:obj:{pk}"
+
+
+def namespace_dono(namespace, pk):
+    return f"{namespace}.{pk}"
+
+
+def obtem_ou_calcula(chave, calcula, tipo=None, timeout=None):
+    """
+    Devolve o valor em cache ou grava e devolve calcula().
+
+    Com `tipo`, um valor em cache de outro tipo é recalculado, e
+    calcula() precisa devolver esse tipo (senão TypeError). None também
+    fica em cache quando `tipo` não é informado.
+    """
+    valor = cache.get(chave, _AUSENTE)
+    if valor is not _AUSENTE and (tipo is None or isinstance(valor, tipo)):
+        return valor
+
+    valor = calcula()
+    if tipo is not None and not isinstance(valor, tipo):
+        raise TypeError(
+            f"{chave}: esperado {tipo.__name__}, calculado {type(valor).__name__}"
+        )
+    cache.set(chave, valor, timeout if timeout is not None else _timeout_padrao())
+    return valor
+
+
+def obtem_muitos_ou_calcula(chaves, calcula_faltando, tipo=None, timeout=None):
+    """
+    Versão em lote: `chaves` é {chave: id}; calcula_faltando(ids) devolve
+    {id: valor} para os ids sem entrada válida (os que ele não devolver
+    ficam de fora do resultado e não vão para o cache).
+
+    Retorna {id: valor} com um get_many e, se faltar algo, um set_many.
+    """
+    em_cache = cache.get_many(list(chaves))
+    valores = {
+        chaves[c]: valor
+        for c, valor in em_cache.items()
+        if tipo is None or isinstance(valor, tipo)
+    }
+
+    faltando = [pk for pk in chaves.values() if pk not in valores]
+    if faltando:
+        novos = calcula_faltando(faltando)
+        por_id = {pk: c for c, pk in chaves.items()}
+        cache.set_many(
+            {por_id[pk]: valor for pk, valor in novos.items()},
+            timeout if timeout is not None else _timeout_padrao(),
+        )
+        valores.update(novos)
+    return valores
+
+
+def _timeout_padrao():
+    return getattr(settings, "CORE_CACHE_TIMEOUT", 300)
+
+
+def chave_lock(chave):
+    return f"{chave}:lock"
+
+
+def _expira_antes(delta, restante, beta):
+    # XFetch: recalcula antes se delta * beta * -ln(U) >= tempo restante
+    if beta <= 0 or delta <= 0:
+        return False
+    return delta * beta * -math.log(1.0 - random.random()) >= restante
+
+
+def _grava_envelope(chave, calcula, versao, timeout, stale_ttl):
+    inicio = time.time()
+    valor = calcula()
+    fim = time.time()
+    envelope = {
+        "valor": valor,
+        "versao": versao,
+        "expira_em": fim + timeout,
+        "delta": fim - inicio,
+    }
+    cache.set(chave, envelope, timeout + stale_ttl)
+    return valor
+
+
+def obtem_com_revalidacao(chave, calcula, versao=None, timeout=None):
+    """
+    Devolve o valor de `chave`, recalculando com calcula() quando a
+    entrada não existe, expirou, é de outra `versao` ou foi sorteada
+    para expiração antecipada. Apenas um chamador por vez recalcula
+    (lock no cache); os demais recebem o valor antigo ou esperam até
+    CORE_CACHE_ESPERA segundos pelo novo. Se a espera acabar sem valor,
+    calcula sem lock (nunca falha por causa do cache).
+    """
+    timeout = timeout if timeout is not None else _timeout_padrao()
+    stale_ttl = getattr(settings, "CORE_CACHE_STALE_TTL", 60)
+    beta = getattr(settings, "CORE_CACHE_BETA", 1.0)
+
+    envelope = cache.get(chave)
+    if envelope is not None and envelope["versao"] == versao:
+        restante = envelope["expira_em"] - time.time()
+        if restante > 0 and not _expira_antes(envelope["delta"], restante, beta):
+            return envelope["valor"]
+
+    # O lock só é exclusivo se cache.add for atômico: LocMemCache (por
+    # processo), Redis e Memcached. No FileBasedCache o add é
+    # verificar-e-gravar sem trava entre processos, então workers que
+    # chegam juntos (antes de o primeiro gravar o lock) recalculam juntos.
+    lock = chave_lock(chave)
+    if cache.add(lock, 1, getattr(settings, "CORE_CACHE_LOCK_TIMEOUT", 10)):
+        try:
+            return _grava_envelope(chave, calcula, versao, timeout, stale_ttl)
+        finally:
+            cache.delete(lock)
+
+    if envelope is not None:
+        # Outro chamador já está recalculando: serve o valor antigo
+        return envelope["valor"]
+
+    limite = time.monotonic() + getattr(settings, "CORE_CACHE_ESPERA", 0.5)
+    intervalo = 0.01
+    while time.monotonic() < limite:
+        time.sleep(intervalo)
+        intervalo = min(intervalo * 2, 0.1)
+        envelope = cache.get(chave)
+        if envelope is not None and envelope["versao"] == versao:
+            return envelope["valor"]
+    return _grava_envelope(chave, calcula, versao, timeout, stale_ttl)
+
+
+def _id_no_namespace(instance, atributo):
+    try:
+        return attrgetter(atributo)(instance)
+    except ObjectDoesNotExist:
+        # Ex.: item de um pedido já apagado
+        return None
+
+
+def invalida_instancia(instance):
+    """
+    Apaga a chave da instância (NAMESPACES_POR_MODELO) ou incrementa a
+    versão do namespace do dono (VERSOES_POR_MODELO); models fora dos
+    dois mapas são ignorados.
+    """
+    label = instance._meta.label_lower
+    if label in NAMESPACES_POR_MODELO:
+        namespace, atributo = NAMESPACES_POR_MODELO[label]
+        pk = _id_no_namespace(instance, atributo)
+        if pk is not None:
+            cache.delete(chave_instancia(namespace, pk))
+    if label in VERSOES_POR_MODELO:
+        namespace, atributo = VERSOES_POR_MODELO[label]
+        pk = _id_no_namespace(instance, atributo)
+        if pk is not None:
+            # Depois do commit: o pedido é gravado antes dos itens na mesma
+            # transação, e uma leitura no meio gravaria a versão nova sem eles
+            transaction.on_commit(
+                lambda: incrementa_versao(namespace_dono(namespace, pk)),
+                using=instance._state.db,
+            )
@@ -0,0 +1,93 @@
+# FarofaTrip/core/campos.py
+"""
+Campos esparsos nas respostas da API: ?fields= e ?expand=.
+
+- ?fields=id,nome,data   devolve só esses campos (na ordem do serializer);
+- ?expand=itens          inclui campos aninhados junto com ?fields=
+                         (só os listados em Meta.campos_expansiveis).
+
+Sem ?fields= a resposta é a completa, como antes. Nomes desconhecidos
+respondem 400.
+
+O serializer recebe a seleção em `campos` (CamposEsparsosMixin) e as
+views a usam também para estreitar o SQL: .only() nas colunas dos
+campos pedidos, projeção menor na leitura compilada e prefetch dos
+aninhados só quando pedidos.
+"""
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+PARAM_CAMPOS = "fields"
+PARAM_EXPANDIR = "expand"
+
+
+def nomes_do_parametro(query_params, parametro):
+    """
+    Lê ?param=a,b (ou repetido) e retorna os nomes sem repetição.
+    """
+    nomes = (
+        parte.strip()
+        for valor in query_params.getlist(parametro)
+        for parte in valor.split(",")
+    )
+    return list(dict.fromkeys(nome for nome in nomes if nome))
+
+
+class CamposEsparsosMixin:
+    """
+    Serializer que aceita campos=[...] no construtor e mantém só esses.
+
+    Meta.campos_expansiveis lista os campos aninhados que podem ser
+    pedidos por ?expand=.
+    """
+
+    def __init__(self, *args, campos=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if campos is not None:
+            for nome in set(self.fields) - set(campos):
+                self.fields.pop(nome)
+
+
+def campos_da_request(request, serializer_class):
+    """
+    Seleção de campos pedida na request, validada contra o serializer,
+    ou None quando a request não restringe os campos.
+    """
+    pedidos = nomes_do_parametro(request.query_params, PARAM_CAMPOS)
+    expandir = nomes_do_parametro(request.query_params, PARAM_EXPANDIR)
+    if not pedidos:
+        return None
+
+    disponiveis = [
+        nome for nome, campo in serializer_class().fields.items() if not campo.write_only
+    ]
+    expansiveis = getattr(serializer_class.Meta, "campos_expansiveis", ())
+
+    erros = {}
+    desconhecidos = [nome for nome in pedidos if nome not in disponiveis]
+    if desconhecidos:
+        erros[PARAM_CAMPOS] = [f"Campos desconhecidos: {', '.join(desconhecidos)}."]
+    nao_expansiveis = [nome for nome in expandir if nome not in expansiveis]
+    if nao_expansiveis:
+        erros[PARAM_EXPANDIR] = [f"Campos não expansíveis: {', '.join(nao_expansiveis)}."]
+    if erros:
+        raise ValidationError(erros)
+
+    selecionados = set(pedidos) | set(expandir)
+    return tuple(nome for nome in disponiveis if nome in selecionados)
+
+
+def colunas_dos_campos(serializer_class, campos):
+    """
+    Colunas do model usadas pelos campos selecionados (para .only()),
+    sempre com a PK. Campos aninhados (many=True) não entram.
+    """
+    serializer = serializer_class(campos=campos)
+    model = serializer.Meta.model
+    colunas = {model._meta.pk.name}
+    for campo in serializer.fields.values():
+        if isinstance(campo, serializers.ListSerializer) or campo.source == "*":
+            continue
+        colunas.add(campo.source_attrs[0])
+    return sorted(colunas)
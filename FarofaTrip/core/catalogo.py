@@ -0,0 +1,151 @@
+# FarofaTrip/core/catalogo.py
+"""
+Cache versionado do catálogo de eventos (EventoViewSet.list).
+
+- A chave do cache vem dos parâmetros normalizados da listagem
+  (scope, search, ordering e paginação). A versão do catálogo fica
+  dentro da entrada (core.cache.obtem_com_revalidacao): uma versão nova
+  recalcula a entrada uma única vez, enquanto as requests concorrentes
+  recebem a anterior.
+- A versão é incrementada pelos signals de save/delete de Evento e
+  inclui a data local (America/Sao_Paulo), então a virada do dia também
+  invalida o catálogo: eventos de "hoje" passam para o escopo "past".
+- Cada entrada guarda também ETag e Last-Modified, usados para responder
+  304 quando o FrontEnd revalida.
+- A busca em lote (/eventos/batch/?ids=) usa a mesma versão, com uma
+  chave por conjunto de IDs.
+"""
+import hashlib
+from datetime import datetime, time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .cache import incrementa_versao, versao
+from .campos import PARAM_CAMPOS, PARAM_EXPANDIR, nomes_do_parametro
+
+NAMESPACE = "catalogo"
+CHAVE_MODIFICADO_EM = "catalogo:modificado_em"
+TIMEOUT_DEFAULT = 5 * 60  # segundos
+
+# Parâmetros que mudam o resultado da listagem, com seus valores padrão
+PARAMETROS_LISTAGEM = {
+    "scope": "future",
+    "search": "",
+    "ordering": "",
+    "cursor": "",
+    "page_size": "",
+    "count": "",
+}
+
+# Headers da listagem que fazem parte da resposta em cache (paginação)
+HEADERS_CACHEADOS = ("Link", "X-Page-Size", "X-Count-Estimate")
+
+
+def timeout_catalogo():
+    return getattr(settings, "CATALOGO_CACHE_TIMEOUT", TIMEOUT_DEFAULT)
+
+
+def versao_catalogo():
+    """
+    Versão atual do catálogo: contador de alterações + data local.
+    """
+    return f"{versao(NAMESPACE)}.{timezone.localdate().isoformat()}"
+
+
+def incrementa_versao_catalogo():
+    """
+    Invalida todas as entradas do catálogo (chamado pelos signals de Evento).
+    """
+    incrementa_versao(NAMESPACE)
+    cache.set(CHAVE_MODIFICADO_EM, timezone.now(), None)
+
+
+def ultima_modificacao():
+    """
+    Momento da última alteração do catálogo, considerando a virada do dia.
+    """
+    meia_noite = timezone.make_aware(
+        datetime.combine(timezone.localdate(), time.min)
+    )
+    modificado_em = cache.get(CHAVE_MODIFICADO_EM)
+    if modificado_em is None:
+        return meia_noite
+    return max(modificado_em, meia_noite)
+
+
+def normaliza_parametros(query_params):
+    """
+    Normaliza os parâmetros da listagem para a chave do cache:
+    remove espaços extras, ignora maiúsculas/minúsculas onde o resultado
+    não depende disso e aplica os valores padrão.
+    """
+    normalizados = {}
+    for nome, padrao in PARAMETROS_LISTAGEM.items():
+        valor = " ".join((query_params.get(nome) or "").split())
+        if nome in ("scope", "search", "count"):
+            valor = valor.lower()
+        normalizados[nome] = valor or padrao
+    return normalizados
+
+
+def _chave(prefixo, request, partes):
+    # Inclui o host (as URLs das imagens são absolutas) e o formato de
+    # resposta negociado.
+    partes = [
+        request.build_absolute_uri("/"),
+        getattr(request.accepted_renderer, "format", ""),
+    ] + list(partes)
+    digest = hashlib.md5("|".join(partes).encode("utf-8")).hexdigest()
+    return f"catalogo:{prefixo}:{digest}"
+
+
+def _partes_campos(request):
+    # ?fields= / ?expand= (core.campos): a ordem dos nomes não muda a resposta
+    return [
+        f"{nome}={','.join(sorted(nomes_do_parametro(request.query_params, nome)))}"
+        for nome in (PARAM_CAMPOS, PARAM_EXPANDIR)
+    ]
+
+
+def chave_catalogo(request):
+    """
+    Monta a chave de cache da listagem para esta request.
+    """
+    parametros = normaliza_parametros(request.query_params)
+    return _chave(
+        "lista",
+        request,
+        [f"{nome}={valor}" for nome, valor in sorted(parametros.items())]
+        + _partes_campos(request),
+    )
+
+
+def chave_lote(request, ids):
+    """
+    Chave de cache da busca em lote: a mesma para qualquer ordem ou
+    repetição dos IDs.
+    """
+    return _chave(
+        "lote",
+        request,
+        [",".join(sorted({str(pk) for pk in ids}))] + _partes_campos(request),
+    )
+
+
+def monta_entrada(chave, versao, data, headers=None, variantes=None):
+    """
+    Entrada de cache: dados serializados, headers de paginação,
+    validadores HTTP (o ETag muda a cada versão do catálogo) e, se
+    houver, o corpo renderizado já comprimido (core.compressao).
+    """
+    headers = headers or {}
+    etag = hashlib.md5(f"{versao}|{chave}".encode("utf-8")).hexdigest()
+    return {
+        "data": data,
+        "headers": {nome: headers[nome] for nome in HEADERS_CACHEADOS if nome in headers},
+        "etag": f'"{etag}"',
+        "last_modified": ultima_modificacao(),
+        "variantes": variantes,
+    }
@@ -0,0 +1,157 @@
+# FarofaTrip/core/compressao.py
+"""
+Compressão negociada (brotli/gzip) das respostas da API.
+
+CompressaoMiddleware comprime as respostas de COMPRESSAO_PREFIXOS com
+tipo comprimível (JSON, texto) e corpo de pelo menos
+COMPRESSAO_TAMANHO_MINIMO bytes, na codificação preferida pelo
+Accept-Encoding do cliente: "br" (se o pacote brotli estiver instalado)
+ou "gzip". Respostas pequenas, streaming ou já codificadas passam sem
+alteração. Imagens (media) já são comprimidas e ficam de fora pelo tipo.
+
+Respostas cacheáveis (catálogo de eventos) não precisam ser comprimidas
+a cada request: variantes_comprimidas(corpo) calcula todas as variantes
+uma vez, a entrada do cache as guarda junto com o corpo, e a view as
+anexa à resposta em `variantes_comprimidas`. O middleware usa a variante
+pronta quando o corpo renderizado é o mesmo da entrada.
+
+O gzip é gerado com mtime=0: a mesma entrada produz sempre os mesmos
+bytes. O ETag de uma resposta comprimida vira fraco (W/"..."), como no
+GZipMiddleware do Django; If-None-Match compara ETags fracos.
+
+Configuração (settings):
+    COMPRESSAO_PREFIXOS         prefixos de path (padrão: ("/api/",))
+    COMPRESSAO_TAMANHO_MINIMO   bytes (padrão: 1024)
+    COMPRESSAO_NIVEL_GZIP       1-9 (padrão: 6)
+    COMPRESSAO_NIVEL_BROTLI     0-11 (padrão: 5)
+"""
+import gzip
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+
+TIPOS_COMPRIMIVEIS = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def codificacoes_disponiveis():
+    """
+    Codificações suportadas, da preferida para a menos preferida.
+    """
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def comprime(corpo, codificacao):
+    if codificacao == "br":
+        return brotli.compress(
+            corpo, quality=getattr(settings, "COMPRESSAO_NIVEL_BROTLI", 5)
+        )
+    return gzip.compress(
+        corpo, compresslevel=getattr(settings, "COMPRESSAO_NIVEL_GZIP", 6), mtime=0
+    )
+
+
+def tamanho_minimo():
+    return getattr(settings, "COMPRESSAO_TAMANHO_MINIMO", 1024)
+
+
+def variantes_comprimidas(corpo):
+    """
+    {"corpo": corpo, "<codificação>": bytes, ...} para guardar no cache,
+    ou None se o corpo for pequeno demais para ser comprimido.
+    """
+    if len(corpo) < tamanho_minimo():
+        return None
+    variantes = {"corpo": corpo}
+    for codificacao in codificacoes_disponiveis():
+        variantes[codificacao] = comprime(corpo, codificacao)
+    return variantes
+
+
+def escolhe_codificacao(accept_encoding):
+    """
+    Codificação disponível com maior q no Accept-Encoding (empate: a
+    preferida do servidor), ou None.
+    """
+    pesos = {}
+    for parte in (accept_encoding or "").split(","):
+        nome, _, parametros = parte.partition(";")
+        nome = nome.strip().lower()
+        if not nome:
+            continue
+        q = 1.0
+        for parametro in parametros.split(";"):
+            chave, _, valor = parametro.partition("=")
+            if chave.strip().lower() == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        pesos[nome] = q
+
+    melhor, melhor_q = None, 0.0
+    for codificacao in codificacoes_disponiveis():
+        q = pesos.get(codificacao, pesos.get("*", 0.0))
+        if q > melhor_q:
+            melhor, melhor_q = codificacao, q
+    return melhor
+
+
+def _comprimivel(content_type):
+    tipo = content_type.split(";")[0].strip().lower()
+    return tipo.startswith(TIPOS_COMPRIMIVEIS) or tipo.endswith("+json")
+
+
+class CompressaoMiddleware:
+    """
+    Comprime as respostas da API conforme o Accept-Encoding.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefixos = tuple(getattr(settings, "COMPRESSAO_PREFIXOS", ("/api/",)))
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not request.path.startswith(self.prefixos):
+            return response
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or not _comprimivel(response.get("Content-Type", ""))
+            or len(response.content) < tamanho_minimo()
+        ):
+            return response
+
+        # A resposta depende do Accept-Encoding mesmo quando não é comprimida
+        patch_vary_headers(response, ("Accept-Encoding",))
+        codificacao = escolhe_codificacao(request.META.get("HTTP_ACCEPT_ENCODING"))
+        if codificacao is None:
+            return response
+
+        variantes = getattr(response, "variantes_comprimidas", None)
+        if variantes and codificacao in variantes and variantes["corpo"] == response.content:
+            comprimido = variantes[codificacao]
+        else:
+            comprimido = comprime(response.content, codificacao)
+        if len(comprimido) >= len(response.content):
+            return response
+
+        response.content = comprimido
+        response["Content-Length"] = str(len(comprimido))
+        response["Content-Encoding"] = codificacao
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
@@ -1,5 +1,5 @@
 from django import forms
-from .models import Perfil, Evento
+from .models import Perfil, Evento, usuarios_por_email
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
@@ -48,8 +48,9 @@ class LoginForm(forms.ModelForm):
     def clean(self):
         """
         Valida o par (email, password):
-        - verifica se existe usuário com o e-mail informado
-        - autentica a senha
+        - autentica pelo e-mail e senha
+        - em caso de falha, informa se o e-mail não existe ou se a senha
+          está incorreta
         - salva o usuário autenticado em self.user
         """
         cleaned_data = super().clean()
@@ -57,17 +58,12 @@ class LoginForm(forms.ModelForm):
         password = cleaned_data.get('password')
 
         if email and password:
-            try:
-                # Busca o usuário por e-mail, ignorando maiúsculas/minúsculas
-                user_obj = User.objects.get(email__iexact=email)
-            except User.DoesNotExist:
-                raise ValidationError("Usuário com esse e-mail não encontrado.")
-            except User.MultipleObjectsReturned:
-                raise ValidationError("Há mais de um usuário com este e-mail. Contate o suporte.")
-
-            # Autentica usando o username do usuário encontrado
-            user = authenticate(username=user_obj.username, password=password)
+            # Busca e verifica o usuário em uma query (core.backends);
+            # o e-mail é único, ignorando maiúsculas/minúsculas
+            user = authenticate(email=email, password=password)
             if user is None:
+                if not usuarios_por_email(email).exists():
+                    raise ValidationError("Usuário com esse e-mail não encontrado.")
                 raise ValidationError("Senha incorreta para o e-mail informado.")
 
             # Guarda o usuário autenticado para uso posterior na view
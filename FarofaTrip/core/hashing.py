@@ -0,0 +1,244 @@
+# FarofaTrip/core/hashing.py
+"""
+Hash de senhas em um pool de threads limitado.
+
+O PBKDF2 consome ~centenas de ms de CPU por senha. Sem limite, uma rajada
+de cadastros/logins ocupa todos os workers e atrasa endpoints baratos
+(ex.: listagem de eventos). Aqui todo hash passa pelo PasswordHasher
+PBKDF2LimitadoPasswordHasher, que:
+
+- executa o PBKDF2 em um ThreadPoolExecutor com HASHING_WORKERS threads
+  (o hashlib libera o GIL durante o cálculo);
+- aceita no máximo HASHING_MAX_PENDENTES hashes em andamento no nó,
+  somando todos os processos; acima disso responde 503 com Retry-After
+  na hora (HashingOcupado).
+
+O limite vale entre processos (VagasEntreProcessos: uma vaga é um flock
+em um de N arquivos de HASHING_LOCK_DIR). Com os workers síncronos do
+gunicorn cada processo calcula um hash por vez; sem o limite do nó,
+todos os workers poderiam ficar presos no PBKDF2 ao mesmo tempo. Em
+sistemas sem fcntl (Windows) o limite volta a ser por processo.
+
+Views do Django fora do DRF (admin, formulários) que esbarram no limite
+respondem 503 pelo HashingOcupadoMiddleware, em vez de 500.
+
+Como o algoritmo continua "pbkdf2_sha256", os hashes já gravados seguem
+válidos. O número de iterações pode ser ajustado por
+PASSWORD_HASH_ITERATIONS (ver o comando `calibrar_hash`).
+
+Configuração (settings):
+    HASHING_WORKERS         threads de hash por processo (padrão: número de CPUs)
+    HASHING_MAX_PENDENTES   hashes simultâneos no nó (padrão: número de CPUs)
+    HASHING_LOCK_DIR        diretório dos arquivos de vaga
+                            (padrão: <tmp>/farofatrip-hash)
+    HASHING_RETRY_AFTER     segundos sugeridos no Retry-After (padrão: 1)
+    PASSWORD_HASH_ITERATIONS  iterações do PBKDF2 (padrão: o do Django)
+"""
+import os
+import random
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.signals import setting_changed
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class HashingOcupado(APIException):
+    """
+    Pool de hash cheio: 503 com Retry-After (o exception handler do DRF
+    usa o atributo `wait`).
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Servidor ocupado. Tente novamente em instantes."
+    default_code = "hashing_ocupado"
+
+    def __init__(self, wait=1, detail=None, code=None):
+        super().__init__(detail, code)
+        self.wait = wait
+
+
+class VagasEntreProcessos:
+    """
+    Semáforo não bloqueante compartilhado pelos processos do nó: `total`
+    arquivos em `diretorio`, e cada vaga é um flock exclusivo em um
+    deles. O kernel solta o lock se o processo morrer.
+
+    Mesma interface usada do threading.BoundedSemaphore
+    (acquire(blocking=False) / release(), na mesma thread).
+    """
+
+    def __init__(self, diretorio, total):
+        os.makedirs(diretorio, exist_ok=True)
+        self.caminhos = [os.path.join(diretorio, f"vaga-{i}.lock") for i in range(total)]
+        self._local = threading.local()
+
+    def acquire(self, blocking=False):
+        if blocking:
+            raise ValueError("VagasEntreProcessos só suporta acquire(blocking=False).")
+        # Começa em um arquivo sorteado para espalhar as tentativas
+        inicio = random.randrange(len(self.caminhos))
+        for caminho in self.caminhos[inicio:] + self.caminhos[:inicio]:
+            fd = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            if not hasattr(self._local, "fds"):
+                self._local.fds = []
+            self._local.fds.append(fd)
+            return True
+        return False
+
+    def release(self):
+        fd = self._local.fds.pop()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+def _vagas(max_pendentes):
+    if fcntl is None:
+        return threading.BoundedSemaphore(max_pendentes)
+    diretorio = getattr(settings, "HASHING_LOCK_DIR", None) or os.path.join(
+        tempfile.gettempdir(), "farofatrip-hash"
+    )
+    return VagasEntreProcessos(diretorio, max_pendentes)
+
+
+class ExecutorHash:
+    """
+    ThreadPoolExecutor com limite de tarefas pendentes no nó.
+    """
+
+    def __init__(self, workers, max_pendentes, retry_after):
+        self.workers = workers
+        self.max_pendentes = max_pendentes
+        self.retry_after = retry_after
+        self.vagas = _vagas(max_pendentes)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash")
+
+    def executa(self, fn, *args):
+        """
+        Executa fn(*args) no pool e espera o resultado.
+        Sem vaga livre, levanta HashingOcupado sem esperar.
+        """
+        if not self.vagas.acquire(blocking=False):
+            raise HashingOcupado(wait=self.retry_after)
+        try:
+            return self._pool.submit(_no_pool, fn, *args).result()
+        finally:
+            self.vagas.release()
+
+    def encerra(self):
+        self._pool.shutdown(wait=False)
+
+
+_local = threading.local()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _no_pool(fn, *args):
+    _local.no_pool = True
+    try:
+        return fn(*args)
+    finally:
+        _local.no_pool = False
+
+
+def executor_hash():
+    """
+    Executor do processo, criado na primeira utilização.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = getattr(settings, "HASHING_WORKERS", None) or os.cpu_count() or 2
+            _executor = ExecutorHash(
+                workers=workers,
+                max_pendentes=(
+                    getattr(settings, "HASHING_MAX_PENDENTES", None) or os.cpu_count() or 2
+                ),
+                retry_after=getattr(settings, "HASHING_RETRY_AFTER", 1),
+            )
+        return _executor
+
+
+def reinicia_executor(**kwargs):
+    """
+    Descarta o executor atual (o próximo hash cria outro com os settings
+    atuais). Ligado ao setting_changed para os testes.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.encerra()
+        _executor = None
+
+
+def _reinicia_se_hashing(setting, **kwargs):
+    if setting.startswith("HASHING_"):
+        reinicia_executor()
+
+
+setting_changed.connect(_reinicia_se_hashing)
+
+
+def executa_hash(fn, *args):
+    # Chamadas aninhadas (verify -> encode) já estão em uma thread do pool
+    if getattr(_local, "no_pool", False):
+        return fn(*args)
+    return executor_hash().executa(fn, *args)
+
+
+class PBKDF2LimitadoPasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 do Django com o cálculo no pool limitado.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, "PASSWORD_HASH_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+    def encode(self, password, salt, iterations=None):
+        return executa_hash(super().encode, password, salt, iterations)
+
+    def verify(self, password, encoded):
+        return executa_hash(super().verify, password, encoded)
+
+
+class HashingOcupadoMiddleware:
+    """
+    HashingOcupado fora do DRF (login do admin, formulários do Django):
+    503 com Retry-After em vez de 500. Nas views da API quem responde é
+    o exception handler do DRF.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, HashingOcupado):
+            return None
+        response = HttpResponse(
+            str(exception.detail),
+            status=exception.status_code,
+            content_type="text/plain; charset=utf-8",
+        )
+        response["Retry-After"] = str(exception.wait)
+        return response
@@ -0,0 +1,278 @@
+# FarofaTrip/core/leitura.py
+"""
+Leitura compilada para as listagens (EventoViewSet.list e
+PedidoViewSet.list).
+
+O ModelSerializer do DRF cria objetos de campo e chama
+to_representation campo a campo, linha a linha, sobre instâncias do
+model. Aqui a mesma saída é montada a partir de um .values():
+
+- LeituraCompilada lê os campos do serializer uma única vez e descobre
+  a projeção (source "evento.nome" vira "evento__nome") e o conversor de
+  cada campo;
+- gera uma função Python (exec) que monta todos os dicts de uma página
+  com uma list comprehension, chamando conversor só onde o DRF faz algo
+  além de devolver o valor;
+- serializers aninhados com many=True (ex.: itens do pedido) viram uma
+  segunda query .values() filtrada pelas PKs da página.
+
+Campos que a leitura não sabe reproduzir (SerializerMethodField,
+source="*", relações sem ser PK, to_representation sobrescrito no
+serializer) levantam ImproperlyConfigured na compilação: a saída é
+sempre idêntica à do serializer, ou a leitura não é usada.
+"""
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import ForeignObjectRel
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import ISO_8601, api_settings
+
+
+def _conversor_data(campo):
+    if getattr(campo, "format", api_settings.DATE_FORMAT) == ISO_8601:
+        return lambda contexto: _isoformat
+    return lambda contexto: campo.to_representation
+
+
+def _isoformat(valor):
+    return valor.isoformat()
+
+
+def _conversor_arquivo(campo, campo_model):
+    storage = campo_model.storage
+    usa_url = getattr(campo, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+
+    def fabrica(contexto):
+        request = contexto.get("request")
+
+        def converte(nome):
+            # Mesmo fluxo de FileField.to_representation sobre o nome gravado
+            if not nome:
+                return None
+            if not usa_url:
+                return nome
+            url = storage.url(nome)
+            if request is not None:
+                return request.build_absolute_uri(url)
+            return url
+
+        return converte
+
+    return fabrica
+
+
+# Campos cujo to_representation é uma conversão simples (classe exata:
+# subclasses podem ter to_representation próprio)
+CONVERSORES_SIMPLES = {
+    serializers.IntegerField: int,
+    serializers.CharField: str,
+    serializers.EmailField: str,
+}
+
+# Campos com to_representation do DRF chamado sobre o valor do .values()
+CONVERSORES_DO_CAMPO = (
+    serializers.DecimalField,
+    serializers.DateTimeField,
+    serializers.ChoiceField,
+    serializers.FloatField,
+    serializers.UUIDField,
+)
+
+
+class LeituraCompilada:
+    """
+    Leitura de listagens por .values() com a mesma saída de
+    serializer_class(many=True).data.
+
+    A compilação acontece no primeiro uso (os serializers dependem dos
+    apps carregados). `campos` restringe os campos (serializers com
+    core.campos.CamposEsparsosMixin); seleciona() guarda uma leitura
+    compilada por seleção.
+    """
+
+    def __init__(self, serializer_class, campos=None):
+        self.serializer_class = serializer_class
+        self.campos_selecionados = campos
+        self._compilada = False
+        self._lock = threading.Lock()
+        self._selecoes = {}
+
+    def seleciona(self, campos):
+        """
+        Leitura compilada só com `campos` (None: a leitura completa).
+        """
+        if campos is None:
+            return self
+        chave = tuple(campos)
+        leitura = self._selecoes.get(chave)
+        if leitura is None:
+            leitura = self._selecoes.setdefault(
+                chave, LeituraCompilada(self.serializer_class, chave)
+            )
+        return leitura
+
+    # --- Compilação ---
+
+    def _compila(self):
+        if self._compilada:
+            return
+        with self._lock:
+            if self._compilada:
+                return
+            if self.campos_selecionados is None:
+                serializer = self.serializer_class()
+            else:
+                serializer = self.serializer_class(campos=self.campos_selecionados)
+            if type(serializer).to_representation is not serializers.Serializer.to_representation:
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__} sobrescreve to_representation."
+                )
+            self.model = serializer.Meta.model
+            self.pk = self.model._meta.pk.attname
+
+            self.campos = [self.pk]
+            itens = []  # (chave, caminho, tipo, extra)
+            for nome, campo in serializer.fields.items():
+                if campo.write_only:
+                    continue
+                itens.append(self._compila_campo(nome, campo))
+
+            self.fabricas = [extra for _, _, tipo, extra in itens if tipo == "conversor"]
+            self.filhos = [extra for _, _, tipo, extra in itens if tipo == "filhos"]
+            self._monta = _gera_funcao(self.serializer_class.__name__, self.pk, itens)
+            self._compilada = True
+
+    def _compila_campo(self, nome, campo):
+        if campo.source == "*" or isinstance(campo, serializers.SerializerMethodField):
+            raise ImproperlyConfigured(f"Campo {nome!r} não é suportado pela leitura compilada.")
+
+        if isinstance(campo, serializers.ListSerializer):
+            return nome, None, "filhos", self._compila_filhos(nome, campo)
+
+        caminho = "__".join(campo.source_attrs)
+        campo_model = self._campo_model(campo.source_attrs)
+        if caminho not in self.campos:
+            self.campos.append(caminho)
+
+        tipo_campo = type(campo)
+        if tipo_campo in CONVERSORES_SIMPLES:
+            conversor = CONVERSORES_SIMPLES[tipo_campo]
+            return nome, caminho, "conversor", lambda contexto: conversor
+        if tipo_campo is serializers.DateField:
+            return nome, caminho, "conversor", _conversor_data(campo)
+        if tipo_campo in (serializers.ImageField, serializers.FileField):
+            return nome, caminho, "conversor", _conversor_arquivo(campo, campo_model)
+        if tipo_campo is PrimaryKeyRelatedField and campo.pk_field is None:
+            # .values() de uma FK já devolve a PK
+            return nome, caminho, "direto", None
+        if tipo_campo in CONVERSORES_DO_CAMPO:
+            return nome, caminho, "conversor", lambda contexto: campo.to_representation
+        raise ImproperlyConfigured(
+            f"Campo {nome!r} ({tipo_campo.__name__}) não é suportado pela leitura compilada."
+        )
+
+    def _campo_model(self, source_attrs):
+        model = self.model
+        campo = None
+        for attr in source_attrs:
+            campo = model._meta.get_field(attr)
+            if campo.is_relation:
+                model = campo.related_model
+        return campo
+
+    def _compila_filhos(self, nome, campo):
+        if type(campo).to_representation is not serializers.ListSerializer.to_representation:
+            raise ImproperlyConfigured(f"{nome!r}: ListSerializer com to_representation próprio.")
+        relacao = self.model._meta.get_field(campo.source)
+        if not isinstance(relacao, ForeignObjectRel) or not relacao.one_to_many:
+            raise ImproperlyConfigured(f"{nome!r}: apenas relações reversas de FK são suportadas.")
+        return _Filhos(
+            LeituraCompilada(type(campo.child)),
+            relacao.related_model,
+            relacao.field.name,
+            relacao.field.attname,
+        )
+
+    # --- Uso ---
+
+    def consulta(self, queryset, extras=()):
+        """
+        Projeção do queryset com os campos da leitura (mais `extras`,
+        ex.: colunas de ordenação usadas pelo cursor da paginação).
+        """
+        self._compila()
+        campos = list(self.campos) + [c for c in extras if c not in self.campos]
+        # prefetch/select_related não se aplicam a .values()
+        return queryset.prefetch_related(None).values(*campos)
+
+    def representa(self, linhas, contexto=None):
+        """
+        Lista de dicts idêntica a serializer_class(instâncias, many=True).data.
+        """
+        self._compila()
+        contexto = contexto or {}
+        linhas = list(linhas)
+        conversores = [fabrica(contexto) for fabrica in self.fabricas]
+        pks = [linha[self.pk] for linha in linhas]
+        filhos = [filho.agrupa(pks, contexto) for filho in self.filhos]
+        return self._monta(linhas, conversores, filhos)
+
+
+class _Filhos:
+    """
+    Serializer aninhado many=True sobre uma FK reversa.
+    """
+
+    def __init__(self, leitura, model, nome_fk, attname_fk):
+        self.leitura = leitura
+        self.model = model
+        self.nome_fk = nome_fk
+        self.attname_fk = attname_fk
+
+    def agrupa(self, pks, contexto):
+        if not pks:
+            return {}
+        linhas = list(
+            self.leitura.consulta(
+                self.model._default_manager.filter(**{f"{self.nome_fk}__in": pks}),
+                [self.attname_fk],
+            )
+        )
+        dados = self.leitura.representa(linhas, contexto)
+        por_pai = {}
+        for linha, dado in zip(linhas, dados):
+            por_pai.setdefault(linha[self.attname_fk], []).append(dado)
+        return por_pai
+
+
+def _gera_funcao(nome, pk, itens):
+    """
+    Gera monta(linhas, conversores, filhos) -> [dict, ...] com uma
+    expressão por campo.
+    """
+    expressoes = []
+    i_conv = i_filho = 0
+    for chave, caminho, tipo, _ in itens:
+        if tipo == "direto":
+            valor = f"r[{caminho!r}]"
+        elif tipo == "conversor":
+            # O DRF não chama to_representation para None
+            valor = f"(None if r[{caminho!r}] is None else c{i_conv}(r[{caminho!r}]))"
+            i_conv += 1
+        else:
+            valor = f"f{i_filho}.get(r[{pk!r}], [])"
+            i_filho += 1
+        expressoes.append(f"{chave!r}: {valor}")
+
+    atribuicoes = [f"    c{i} = conversores[{i}]" for i in range(i_conv)]
+    atribuicoes += [f"    f{i} = filhos[{i}]" for i in range(i_filho)]
+    fonte = "\n".join(
+        ["def monta(linhas, conversores, filhos):"]
+        + atribuicoes
+        + ["    return [{" + ", ".join(expressoes) + "} for r in linhas]"]
+    )
+    namespace = {}
+    exec(compile(fonte, f"<leitura {nome}>", "exec"), namespace)
+    return namespace["monta"]
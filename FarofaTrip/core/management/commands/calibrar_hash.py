@@ -0,0 +1,71 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+
+from core.hashing import executor_hash
+
+
+class Command(BaseCommand):
+    """
+    Mede o PBKDF2 nesta máquina e sugere PASSWORD_HASH_ITERATIONS.
+
+    Exemplos:
+        python manage.py calibrar_hash                 # alvo de 250 ms por hash
+        python manage.py calibrar_hash --alvo-ms 150
+    """
+    help = "Mede o custo do PBKDF2 e escolhe o número de iterações para uma latência alvo."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--alvo-ms", type=float, default=250.0,
+            help="Latência desejada de um hash (ms).",
+        )
+        parser.add_argument(
+            "--amostras", type=int, default=3,
+            help="Medições por número de iterações (vale a menor).",
+        )
+        parser.add_argument(
+            "--minimo", type=int, default=PBKDF2PasswordHasher.iterations,
+            help=(
+                "Menor número de iterações aceito (nunca abaixo do padrão do "
+                f"Django, {PBKDF2PasswordHasher.iterations})."
+            ),
+        )
+
+    def mede(self, iteracoes, amostras):
+        hasher = PBKDF2PasswordHasher()
+        salt = hasher.salt()
+        tempos = []
+        for _ in range(amostras):
+            inicio = time.perf_counter()
+            hasher.encode("calibracao-da-senha", salt, iteracoes)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+        return min(tempos)
+
+    def handle(self, *args, **options):
+        alvo = options["alvo_ms"]
+        amostras = options["amostras"]
+        # Menos iterações que o padrão do Django enfraquece os hashes
+        minimo = max(options["minimo"], PBKDF2PasswordHasher.iterations)
+
+        # Estimativa linear a partir de uma medição curta
+        base = 50_000
+        ms_por_iteracao = self.mede(base, amostras) / base
+        iteracoes = max(minimo, int(alvo / ms_por_iteracao) // 10_000 * 10_000)
+
+        ms = self.mede(iteracoes, amostras)
+        # Ajuste fino com a medição real
+        if ms > alvo and iteracoes > minimo:
+            iteracoes = max(minimo, int(iteracoes * alvo / ms) // 10_000 * 10_000)
+            ms = self.mede(iteracoes, amostras)
+
+        workers = executor_hash().workers
+        atual = getattr(settings, "PASSWORD_HASH_ITERATIONS", PBKDF2PasswordHasher.iterations)
+        self.stdout.write(f"iterações atuais: {atual}")
+        self.stdout.write(
+            f"sugestão: {iteracoes} iterações -> {ms:.1f} ms por hash "
+            f"(~{workers * 1000 / ms:.0f} hashes/s com {workers} workers)"
+        )
+        self.stdout.write(f"PASSWORD_HASH_ITERATIONS = {iteracoes}")
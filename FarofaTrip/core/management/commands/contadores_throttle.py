@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.throttling import (
+    cache_compartilhado,
+    contadores_throttle,
+    escopos_configurados,
+    zera_contadores_throttle,
+)
+
+
+class Command(BaseCommand):
+    """
+    Mostra quantas requests cada escopo de throttle rejeitou.
+    Requer um cache compartilhado entre processos (CACHE_BACKEND; sem
+    DEBUG o padrão já é o cache em arquivo).
+
+    Exemplos:
+        python manage.py contadores_throttle           # login_ip=3 login_conta=12 ...
+        python manage.py contadores_throttle --zerar   # mostra e zera
+    """
+    help = "Mostra (e opcionalmente zera) os contadores de requests rejeitadas por throttle."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--zerar", action="store_true",
+            help="Zera os contadores depois de mostrar.",
+        )
+
+    def handle(self, *args, **options):
+        if not cache_compartilhado():
+            raise CommandError(
+                "O cache do throttling é local a cada processo (LocMemCache, o padrão com DEBUG): os "
+                "contadores não são gravados. Use CACHE_BACKEND=file, redis ou memcached."
+            )
+        escopos = escopos_configurados()
+        contadores = contadores_throttle(escopos)
+        self.stdout.write(" ".join(f"{e}={n}" for e, n in contadores.items()))
+        self.stdout.write(f"total={sum(contadores.values())}")
+        if options["zerar"]:
+            zera_contadores_throttle(escopos)
@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.notificacoes import processa_fila
+
+
+class Command(BaseCommand):
+    """
+    Worker da fila de notificações de WhatsApp.
+
+    Exemplos:
+        python manage.py enviar_notificacoes            # esvazia a fila e sai
+        python manage.py enviar_notificacoes --loop     # roda continuamente
+    """
+    help = "Envia as notificações de WhatsApp pendentes (outbox) com retry e backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=4,
+            help="Número de threads de envio (e tamanho do pool HTTP).",
+        )
+        parser.add_argument(
+            "--lote", type=int, default=50,
+            help="Quantidade de mensagens reservadas por lote.",
+        )
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Continua rodando e consultando a fila a cada --intervalo segundos.",
+        )
+        parser.add_argument(
+            "--intervalo", type=float, default=5.0,
+            help="Segundos de espera entre consultas no modo --loop.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total = processa_fila(
+                workers=options["workers"],
+                tamanho_lote=options["lote"],
+            )
+            if any(total.values()):
+                self.stdout.write(
+                    f"enviadas={total['enviadas']} "
+                    f"reagendadas={total['reagendadas']} "
+                    f"falhas={total['falhas']}"
+                )
+
+            if not options["loop"]:
+                break
+            time.sleep(options["intervalo"])
@@ -0,0 +1,72 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.retencao import estima_purga, limite_expiracao, purga_tokens
+
+
+class Command(BaseCommand):
+    """
+    Limpeza dos refresh tokens expirados (OutstandingToken/BlacklistedToken).
+
+    Exemplos:
+        python manage.py purgar_tokens --dry-run      # só estima
+        python manage.py purgar_tokens                # apaga e sai
+        python manage.py purgar_tokens --loop         # roda a cada --intervalo
+    """
+    help = "Apaga em lotes os tokens JWT expirados e suas entradas na blacklist."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lote", type=int, default=1000,
+            help="Tokens apagados por transação.",
+        )
+        parser.add_argument(
+            "--pausa", type=float, default=0.05,
+            help="Segundos de espera entre lotes (libera o lock de escrita).",
+        )
+        parser.add_argument(
+            "--reter-dias", type=int, default=0,
+            help="Mantém os tokens expirados há menos de N dias.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Apenas conta as linhas que seriam apagadas.",
+        )
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Continua rodando e purgando a cada --intervalo segundos.",
+        )
+        parser.add_argument(
+            "--intervalo", type=float, default=3600.0,
+            help="Segundos de espera entre execuções no modo --loop.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            antes_de = limite_expiracao(options["reter_dias"])
+            if options["dry_run"]:
+                estimativa = estima_purga(antes_de, options["lote"])
+                self.stdout.write(
+                    f"dry-run: outstanding={estimativa['outstanding']} "
+                    f"blacklisted={estimativa['blacklisted']} "
+                    f"lotes={estimativa['lotes']}"
+                )
+                break
+
+            total = purga_tokens(
+                antes_de,
+                lote=options["lote"],
+                pausa=options["pausa"],
+            )
+            self.stdout.write(
+                f"outstanding={total['outstanding']} "
+                f"blacklisted={total['blacklisted']} "
+                f"lotes={total['lotes']} "
+                f"segundos={total['segundos']} "
+                f"linhas/s={total['linhas_por_segundo']}"
+            )
+
+            if not options["loop"]:
+                break
+            time.sleep(options["intervalo"])
@@ -0,0 +1,86 @@
+# FarofaTrip/core/middleware.py
+"""
+Cadeia de middleware por prefixo de path.
+
+A API (/api/) autentica por JWT (core.authentication) e não usa sessão,
+CSRF (as APIViews do DRF já são csrf_exempt), mensagens nem
+X-Frame-Options; esses middlewares existem para o admin (Jazzmin).
+
+ForaDaApiMiddleware ocupa o lugar deles em MIDDLEWARE e monta,
+uma vez, a cadeia dos middlewares listados em MIDDLEWARE_FORA_DA_API:
+
+- requests de API_PREFIXOS seguem direto para a view;
+- as demais (admin, media) passam pela cadeia completa, inclusive pelos
+  hooks process_view/process_exception/process_template_response (o
+  CsrfViewMiddleware valida o token em process_view), na mesma ordem em
+  que o Django os chamaria com os middlewares direto em MIDDLEWARE.
+
+Configuração (settings):
+    MIDDLEWARE_FORA_DA_API  caminhos dos middlewares só fora da API
+    API_PREFIXOS            prefixos de path da API (padrão: ("/api/",))
+"""
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+
+def eh_api(request):
+    return request.path_info.startswith(tuple(getattr(settings, "API_PREFIXOS", ("/api/",))))
+
+
+class ForaDaApiMiddleware:
+    """
+    Aplica MIDDLEWARE_FORA_DA_API só às requests fora da API.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.process_view_hooks = []
+        self.process_template_response_hooks = []
+        self.process_exception_hooks = []
+
+        # Mesmo encadeamento do BaseHandler.load_middleware (síncrono)
+        handler = convert_exception_to_response(get_response)
+        for caminho in reversed(getattr(settings, "MIDDLEWARE_FORA_DA_API", [])):
+            try:
+                instancia = import_string(caminho)(handler)
+            except MiddlewareNotUsed:
+                continue
+            if hasattr(instancia, "process_view"):
+                self.process_view_hooks.insert(0, instancia.process_view)
+            if hasattr(instancia, "process_template_response"):
+                self.process_template_response_hooks.append(instancia.process_template_response)
+            if hasattr(instancia, "process_exception"):
+                self.process_exception_hooks.append(instancia.process_exception)
+            handler = convert_exception_to_response(instancia)
+        self.cadeia = handler
+
+    def __call__(self, request):
+        if eh_api(request):
+            return self.get_response(request)
+        return self.cadeia(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if eh_api(request):
+            return None
+        for hook in self.process_view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if not eh_api(request):
+            for hook in self.process_template_response_hooks:
+                response = hook(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        if eh_api(request):
+            return None
+        for hook in self.process_exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
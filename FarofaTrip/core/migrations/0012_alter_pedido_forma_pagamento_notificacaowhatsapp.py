@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_alter_pedidoitem_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pedido',
+            name='forma_pagamento',
+            field=models.CharField(blank=True, choices=[('cartao', 'Cartão'), ('pix', 'PIX'), ('boleto', 'Boleto')], max_length=20, null=True),
+        ),
+        migrations.CreateModel(
+            name='NotificacaoWhatsApp',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('destino', models.CharField(max_length=20)),
+                ('corpo', models.TextField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pendente', 'Pendente'), ('enviando', 'Enviando'), ('enviado', 'Enviado'), ('falhou', 'Falhou')], default='pendente', max_length=20)),
+                ('tentativas', models.PositiveIntegerField(default=0)),
+                ('proxima_tentativa_em', models.DateTimeField(default=django.utils.timezone.now)),
+                ('bloqueado_em', models.DateTimeField(blank=True, null=True)),
+                ('lote', models.UUIDField(blank=True, null=True)),
+                ('ultimo_erro', models.TextField(blank=True, null=True)),
+                ('criado_em', models.DateTimeField(auto_now_add=True)),
+                ('enviado_em', models.DateTimeField(blank=True, null=True)),
+                ('pedido', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notificacoes', to='core.pedido')),
+            ],
+            options={
+                'verbose_name': 'Notificação WhatsApp',
+                'verbose_name_plural': 'Notificações WhatsApp',
+                'ordering': ['proxima_tentativa_em', 'id'],
+                'indexes': [models.Index(fields=['status', 'proxima_tentativa_em'], name='core_notif_status_prox_idx')],
+            },
+        ),
+    ]
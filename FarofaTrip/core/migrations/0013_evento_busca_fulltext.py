@@ -0,0 +1,107 @@
+from django.db import migrations
+
+
+# SQL congelado desta migration (não importa core.busca, que pode mudar)
+CAMPOS = ("nome", "cidade", "local", "descricao")
+CONFIG_PG = "pt_unaccent"
+INDICE_PG = "core_evento_busca_gin"
+
+SQLITE_INSTALA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS core_evento_fts USING fts5(
+        nome, cidade, local, descricao,
+        content='core_evento',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS core_evento_fts_ai AFTER INSERT ON core_evento BEGIN
+        INSERT INTO core_evento_fts(rowid, nome, cidade, local, descricao)
+        VALUES (new.id, new.nome, new.cidade, new.local, new.descricao);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS core_evento_fts_ad AFTER DELETE ON core_evento BEGIN
+        INSERT INTO core_evento_fts(core_evento_fts, rowid, nome, cidade, local, descricao)
+        VALUES ('delete', old.id, old.nome, old.cidade, old.local, old.descricao);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS core_evento_fts_au AFTER UPDATE ON core_evento BEGIN
+        INSERT INTO core_evento_fts(core_evento_fts, rowid, nome, cidade, local, descricao)
+        VALUES ('delete', old.id, old.nome, old.cidade, old.local, old.descricao);
+        INSERT INTO core_evento_fts(rowid, nome, cidade, local, descricao)
+        VALUES (new.id, new.nome, new.cidade, new.local, new.descricao);
+    END
+    """,
+    "INSERT INTO core_evento_fts(core_evento_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REMOVE = [
+    "DROP TRIGGER IF EXISTS core_evento_fts_ai",
+    "DROP TRIGGER IF EXISTS core_evento_fts_ad",
+    "DROP TRIGGER IF EXISTS core_evento_fts_au",
+    "DROP TABLE IF EXISTS core_evento_fts",
+]
+
+PG_CONFIGURACAO = """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'pt_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION pt_unaccent (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION pt_unaccent
+                ALTER MAPPING FOR hword, hword_part, word
+                WITH unaccent, portuguese_stem;
+        END IF;
+    END
+    $$;
+"""
+
+
+def _indice_pg():
+    # django.contrib.postgres exige o psycopg: só importa no PostgreSQL
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector(*CAMPOS, config=CONFIG_PG), name=INDICE_PG)
+
+
+def instala(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            for sql in SQLITE_INSTALA:
+                cursor.execute(sql)
+    elif vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+        schema_editor.execute(PG_CONFIGURACAO)
+        schema_editor.add_index(apps.get_model("core", "Evento"), _indice_pg())
+
+
+def remove(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            for sql in SQLITE_REMOVE:
+                cursor.execute(sql)
+    elif vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {INDICE_PG}")
+
+
+class Migration(migrations.Migration):
+    """
+    Índice full-text da busca de eventos (ver core/busca.py):
+    FTS5 + triggers no SQLite, GIN sobre tsvector no PostgreSQL.
+
+    O SQL fica copiado aqui: a migration reproduz o índice como era
+    nesta versão, mesmo que core.busca mude depois.
+    """
+
+    dependencies = [
+        ('core', '0012_alter_pedido_forma_pagamento_notificacaowhatsapp'),
+    ]
+
+    operations = [
+        migrations.RunPython(instala, remove),
+    ]
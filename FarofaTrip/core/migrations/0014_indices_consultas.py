@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_evento_busca_fulltext'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='evento',
+            index=models.Index(fields=['data', 'id'], name='core_evento_data_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pedido',
+            index=models.Index(fields=['usuario', '-criado_em', '-id'], name='core_pedido_usuario_criado_idx'),
+        ),
+    ]
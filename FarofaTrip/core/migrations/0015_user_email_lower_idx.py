@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+INDICE_EMAIL = models.Index(Lower("email"), name="core_user_email_lower_idx")
+
+
+def cria_indice(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.add_index(User, INDICE_EMAIL)
+
+
+def remove_indice(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.remove_index(User, INDICE_EMAIL)
+
+
+class Migration(migrations.Migration):
+    """
+    Índice funcional em LOWER(email) na tabela de usuários, usado pelo
+    login/registro por e-mail (core.models.usuarios_por_email).
+
+    O model de usuário pertence ao django.contrib.auth, por isso o
+    índice é criado via RunPython em vez de Meta.indexes.
+    """
+
+    dependencies = [
+        ('core', '0014_indices_consultas'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(cria_indice, remove_indice),
+    ]
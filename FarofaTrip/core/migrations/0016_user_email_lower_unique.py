@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import Lower
+
+
+INDICE_EMAIL = models.Index(Lower("email"), name="core_user_email_lower_idx")
+UNICO_EMAIL = models.UniqueConstraint(
+    Lower("email"),
+    condition=~Q(email=""),
+    name="core_user_email_lower_uniq",
+)
+
+
+def cria_unico(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    duplicados = list(
+        User.objects.using(schema_editor.connection.alias)
+        .exclude(email="")
+        .annotate(email_normalizado=Lower("email"))
+        .values("email_normalizado")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("email_normalizado", flat=True)
+    )
+    if duplicados:
+        raise RuntimeError(
+            "Há usuários com e-mail repetido; ajuste antes de migrar: "
+            + ", ".join(sorted(duplicados))
+        )
+    schema_editor.remove_index(User, INDICE_EMAIL)
+    schema_editor.add_constraint(User, UNICO_EMAIL)
+
+
+def remove_unico(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.remove_constraint(User, UNICO_EMAIL)
+    schema_editor.add_index(User, INDICE_EMAIL)
+
+
+class Migration(migrations.Migration):
+    """
+    Troca o índice em LOWER(email) por um índice único (parcial: e-mails
+    vazios continuam permitidos), para que login e registro por e-mail
+    nunca encontrem dois usuários.
+
+    Falha com a lista de e-mails repetidos se o banco já tiver duplicatas.
+    """
+
+    dependencies = [
+        ('core', '0015_user_email_lower_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(cria_unico, remove_unico),
+    ]
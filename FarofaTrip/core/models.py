@@ -1,7 +1,28 @@
 import uuid
 from decimal import Decimal
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+from django.db.models.lookups import Exact
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+
+def usuarios_por_email(email, queryset=None):
+    """
+    Filtra usuários pelo e-mail sem diferenciar maiúsculas/minúsculas.
+
+    Gera WHERE LOWER(email) = LOWER(%s) AND NOT (email = ''), que usa o
+    índice único parcial core_user_email_lower_uniq (email__iexact não
+    usa: vira LIKE no SQLite e UPPER() no PostgreSQL).
+    """
+    if queryset is None:
+        queryset = get_user_model()._default_manager.all()
+    return queryset.filter(
+        Exact(Lower("email"), Lower(Value((email or "").strip()))),
+        ~Q(email=""),
+    )
 
 
 class Perfil(models.Model):
@@ -58,6 +79,12 @@ class Evento(models.Model):
     def __str__(self):
         return self.nome
 
+    class Meta:
+        indexes = [
+            # Catálogo: filtro por data + ordenação/paginação por (data, id)
+            models.Index(fields=["data", "id"], name="core_evento_data_id_idx"),
+        ]
+
 
 class Pedido(models.Model):
     """
@@ -125,6 +152,13 @@ class Pedido(models.Model):
         ordering = ["-criado_em"]
         verbose_name = "Pedido"
         verbose_name_plural = "Pedidos"
+        indexes = [
+            # Histórico do usuário: WHERE usuario_id = ? ORDER BY criado_em DESC, id DESC
+            models.Index(
+                fields=["usuario", "-criado_em", "-id"],
+                name="core_pedido_usuario_criado_idx",
+            ),
+        ]
 
 
 class PedidoItem(models.Model):
@@ -187,3 +221,68 @@ class PedidoItem(models.Model):
 
     def __str__(self):
         return f"{self.quantidade}x {self.evento.nome} (Pedido #{self.pedido_id})"
+
+
+class NotificacaoWhatsApp(models.Model):
+    """
+    Mensagem de WhatsApp pendente de envio (outbox).
+
+    É gravada na mesma transação do Pedido e enviada depois pelo
+    comando `enviar_notificacoes`, fora do ciclo da request.
+
+    - pedido: pedido que originou a notificação.
+    - destino: número de destino (E.164).
+    - corpo: texto enviado; preenchido na primeira tentativa de envio.
+    - status: pendente, enviando, enviado ou falhou (dead letter).
+    - tentativas / proxima_tentativa_em: controle de retry com backoff.
+    - bloqueado_em: quando um worker reservou a mensagem.
+    - ultimo_erro: mensagem do último erro de envio.
+    """
+    STATUS_PENDENTE = "pendente"
+    STATUS_ENVIANDO = "enviando"
+    STATUS_ENVIADO = "enviado"
+    STATUS_FALHOU = "falhou"
+
+    STATUS_CHOICES = (
+        (STATUS_PENDENTE, "Pendente"),
+        (STATUS_ENVIANDO, "Enviando"),
+        (STATUS_ENVIADO, "Enviado"),
+        (STATUS_FALHOU, "Falhou"),
+    )
+
+    pedido = models.ForeignKey(
+        Pedido,
+        on_delete=models.CASCADE,
+        related_name="notificacoes",
+    )
+    destino = models.CharField(max_length=20)
+    corpo = models.TextField(null=True, blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDENTE,
+    )
+    tentativas = models.PositiveIntegerField(default=0)
+    proxima_tentativa_em = models.DateTimeField(default=timezone.now)
+    bloqueado_em = models.DateTimeField(null=True, blank=True)
+    lote = models.UUIDField(null=True, blank=True)
+    ultimo_erro = models.TextField(null=True, blank=True)
+
+    criado_em = models.DateTimeField(auto_now_add=True)
+    enviado_em = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Notificação do pedido #{self.pedido_id} - {self.status}"
+
+    class Meta:
+        ordering = ["proxima_tentativa_em", "id"]
+        verbose_name = "Notificação WhatsApp"
+        verbose_name_plural = "Notificações WhatsApp"
+        indexes = [
+            # Consulta do worker: mensagens de um status vencidas por data
+            models.Index(
+                fields=["status", "proxima_tentativa_em"],
+                name="core_notif_status_prox_idx",
+            ),
+        ]
@@ -0,0 +1,249 @@
+# FarofaTrip/core/notificacoes.py
+"""
+Fila (outbox) de notificações de WhatsApp dos pedidos.
+
+Fluxo:
+- enfileira_notificacao_pedido() grava uma NotificacaoWhatsApp na mesma
+  transação do Pedido (só um INSERT, nenhuma chamada HTTP na request).
+- o comando `python manage.py enviar_notificacoes` reserva lotes de
+  mensagens vencidas e as envia em paralelo (thread pool + requests.Session
+  compartilhada), com retry e backoff exponencial.
+- mensagens que esgotam as tentativas (ou recebem erro permanente da API)
+  ficam com status 'falhou' (dead letter) para análise/reenvio manual.
+"""
+import logging
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
+from .models import NotificacaoWhatsApp, Pedido
+from .whatsapp import format_order_messages, get_whatsapp_config, post_whatsapp_message
+
+
+logger = logging.getLogger(__name__)
+
+# Valores padrão; podem ser sobrescritos no settings.py
+MAX_TENTATIVAS_DEFAULT = 6
+BACKOFF_BASE_DEFAULT = 30        # segundos
+BACKOFF_MAX_DEFAULT = 60 * 60    # segundos
+TIMEOUT_ENVIO_DEFAULT = 10       # segundos
+RESERVA_EXPIRA_DEFAULT = 5 * 60  # segundos
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enfileira_notificacao_pedido(pedido: Pedido):
+    """
+    Grava a notificação de WhatsApp do pedido na fila.
+
+    Deve ser chamada dentro da transação que cria o Pedido: se a
+    transação for desfeita, a notificação some junto.
+    Retorna None (sem gravar nada) se o WhatsApp não estiver configurado.
+    """
+    config = get_whatsapp_config()
+    if config is None:
+        return None
+
+    return NotificacaoWhatsApp.objects.create(
+        pedido=pedido,
+        destino=config["to_number"],
+    )
+
+
+def calcula_backoff(tentativas: int) -> timedelta:
+    """
+    Intervalo até a próxima tentativa: base * 2^(tentativas-1),
+    limitado a WHATSAPP_BACKOFF_MAX, com jitter de até 10%.
+    """
+    base = _setting("WHATSAPP_BACKOFF_BASE", BACKOFF_BASE_DEFAULT)
+    maximo = _setting("WHATSAPP_BACKOFF_MAX", BACKOFF_MAX_DEFAULT)
+    segundos = min(base * (2 ** max(tentativas - 1, 0)), maximo)
+    segundos += random.uniform(0, segundos * 0.1)
+    return timedelta(seconds=segundos)
+
+
+def erro_permanente(exc: Exception) -> bool:
+    """
+    Indica se o erro não adianta ser repetido (4xx, exceto 408 e 429).
+    """
+    resp = getattr(exc, "response", None)
+    if resp is None:
+        return False
+    return 400 <= resp.status_code < 500 and resp.status_code not in (408, 429)
+
+
+def cria_sessao(pool_size: int) -> requests.Session:
+    """
+    Cria uma requests.Session com pool de conexões do tamanho do thread pool,
+    para reaproveitar conexões HTTP/TLS entre os envios.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def reserva_lote(tamanho: int):
+    """
+    Reserva até `tamanho` notificações vencidas para este worker.
+
+    Usa um UPDATE condicional marcando as linhas com um id de lote, o que
+    evita que dois workers enviem a mesma mensagem. Reservas antigas
+    (worker que morreu no meio do envio) voltam a ficar disponíveis após
+    WHATSAPP_RESERVA_EXPIRA segundos.
+    """
+    agora = timezone.now()
+    expira = agora - timedelta(
+        seconds=_setting("WHATSAPP_RESERVA_EXPIRA", RESERVA_EXPIRA_DEFAULT)
+    )
+    disponiveis = Q(
+        status=NotificacaoWhatsApp.STATUS_PENDENTE,
+        proxima_tentativa_em__lte=agora,
+    ) | Q(
+        status=NotificacaoWhatsApp.STATUS_ENVIANDO,
+        bloqueado_em__lt=expira,
+    )
+
+    ids = list(
+        NotificacaoWhatsApp.objects.filter(disponiveis)
+        .order_by("proxima_tentativa_em", "id")
+        .values_list("id", flat=True)[:tamanho]
+    )
+    if not ids:
+        return []
+
+    lote = uuid.uuid4()
+    NotificacaoWhatsApp.objects.filter(disponiveis, id__in=ids).update(
+        status=NotificacaoWhatsApp.STATUS_ENVIANDO,
+        bloqueado_em=agora,
+        lote=lote,
+    )
+    return list(NotificacaoWhatsApp.objects.filter(lote=lote))
+
+
+def _registra_sucesso(notificacao):
+    notificacao.status = NotificacaoWhatsApp.STATUS_ENVIADO
+    notificacao.tentativas += 1
+    notificacao.enviado_em = timezone.now()
+    notificacao.ultimo_erro = None
+    notificacao.bloqueado_em = None
+    notificacao.lote = None
+
+
+def _registra_falha(notificacao, exc):
+    notificacao.tentativas += 1
+    notificacao.ultimo_erro = str(exc)[:2000]
+    notificacao.bloqueado_em = None
+    notificacao.lote = None
+
+    max_tentativas = _setting("WHATSAPP_MAX_TENTATIVAS", MAX_TENTATIVAS_DEFAULT)
+    if erro_permanente(exc) or notificacao.tentativas >= max_tentativas:
+        notificacao.status = NotificacaoWhatsApp.STATUS_FALHOU
+        logger.error(
+            "Notificação #%s do pedido #%s foi para dead letter: %s",
+            notificacao.id, notificacao.pedido_id, exc,
+        )
+    else:
+        notificacao.status = NotificacaoWhatsApp.STATUS_PENDENTE
+        notificacao.proxima_tentativa_em = timezone.now() + calcula_backoff(
+            notificacao.tentativas
+        )
+
+
+def processa_lote(session, executor, tamanho: int = 50) -> dict:
+    """
+    Reserva um lote, envia as mensagens em paralelo e grava o resultado.
+
+    As chamadas HTTP rodam no executor; toda escrita no banco é feita
+    nesta thread. Retorna um dicionário com os contadores do lote.
+    """
+    resultado = {"enviadas": 0, "reagendadas": 0, "falhas": 0}
+
+    config = get_whatsapp_config()
+    if config is None:
+        return resultado
+
+    notificacoes = reserva_lote(tamanho)
+    if not notificacoes:
+        return resultado
+
+    timeout = _setting("WHATSAPP_TIMEOUT", TIMEOUT_ENVIO_DEFAULT)
+
+    # O texto é montado uma única vez (em lote) e reaproveitado nos retries
+    sem_corpo = [n for n in notificacoes if not n.corpo]
+    if sem_corpo:
+        textos = format_order_messages({n.pedido_id for n in sem_corpo})
+        for notificacao in sem_corpo:
+            notificacao.corpo = textos.get(notificacao.pedido_id, "")
+
+    futuros = {
+        executor.submit(
+            post_whatsapp_message,
+            config,
+            notificacao.corpo,
+            to_number=notificacao.destino,
+            session=session,
+            timeout=timeout,
+        ): notificacao
+        for notificacao in notificacoes
+    }
+
+    for futuro, notificacao in futuros.items():
+        try:
+            futuro.result()
+        except Exception as exc:
+            _registra_falha(notificacao, exc)
+            if notificacao.status == NotificacaoWhatsApp.STATUS_FALHOU:
+                resultado["falhas"] += 1
+            else:
+                resultado["reagendadas"] += 1
+        else:
+            _registra_sucesso(notificacao)
+            resultado["enviadas"] += 1
+
+    NotificacaoWhatsApp.objects.bulk_update(
+        notificacoes,
+        [
+            "status",
+            "corpo",
+            "tentativas",
+            "proxima_tentativa_em",
+            "bloqueado_em",
+            "lote",
+            "ultimo_erro",
+            "enviado_em",
+        ],
+    )
+    return resultado
+
+
+def processa_fila(workers: int = 4, tamanho_lote: int = 50, max_lotes=None) -> dict:
+    """
+    Processa lotes até a fila de mensagens vencidas esvaziar
+    (ou até `max_lotes`). Retorna os contadores acumulados.
+    """
+    total = {"enviadas": 0, "reagendadas": 0, "falhas": 0}
+    session = cria_sessao(workers)
+    lotes = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while max_lotes is None or lotes < max_lotes:
+                resultado = processa_lote(session, executor, tamanho_lote)
+                lotes += 1
+                for chave, valor in resultado.items():
+                    total[chave] += valor
+                if not any(resultado.values()):
+                    break
+    finally:
+        session.close()
+    return total
@@ -0,0 +1,241 @@
+# FarofaTrip/core/pagination.py
+"""
+Paginação por cursor (keyset) para as listagens da API.
+
+- O corpo da resposta continua sendo uma lista JSON (compatível com o
+  FrontEnd); a navegação vai nos headers:
+    Link: <...?cursor=...>; rel="next"
+    X-Page-Size: 50
+    X-Count-Estimate: 123 | 1000+   (apenas com ?count=1)
+- O cursor guarda os valores das colunas de ordenação da última linha,
+  e a próxima página é buscada com WHERE (col1, col2) > (v1, v2) usando
+  o índice, sem OFFSET.
+- A contagem é opcional e limitada a `max_count` linhas: nunca roda um
+  COUNT(*) completo na tabela.
+"""
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _valor_para_cursor(valor):
+    if isinstance(valor, (date, datetime, time)):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return str(valor)
+    return valor
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação keyset com cursor opaco e ordenação estável.
+
+    - ordering: colunas da ordenação padrão (a última deve ser única).
+    - page_size / max_page_size: tamanho padrão e máximo da página.
+    - max_count: limite da contagem estimada.
+
+    Se a view usar OrderingFilter, a ordenação escolhida pelo cliente é
+    respeitada e recebe a PK como desempate.
+    """
+    ordering = ("id",)
+    page_size = 50
+    max_page_size = 100
+    max_count = 1000
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    count_query_param = "count"
+
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering_fields = self.get_ordering(queryset)
+        self.count = self.get_count_estimate(queryset, request)
+
+        qs = queryset.order_by(*self.ordering_fields)
+        cursor = self.decode_cursor(request, queryset.model)
+        if cursor is not None:
+            qs = qs.filter(self.build_keyset_filter(cursor))
+
+        rows = list(qs[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        self.next_cursor = None
+        if self.has_next and rows:
+            self.next_cursor = self.encode_cursor(rows[-1])
+        return rows
+
+    def get_paginated_response(self, data):
+        headers = {"X-Page-Size": str(self.page_size)}
+        next_link = self.get_next_link()
+        if next_link:
+            headers["Link"] = f'<{next_link}>; rel="next"'
+        if self.count is not None:
+            headers["X-Count-Estimate"] = self.count
+        return Response(data, headers=headers)
+
+    def get_page_size(self, request):
+        try:
+            valor = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if valor <= 0:
+            return self.page_size
+        return min(valor, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """
+        Ordenação usada no keyset: a do queryset (ex.: OrderingFilter)
+        ou a padrão da classe, sempre terminando na PK.
+        """
+        campos = [
+            campo for campo in queryset.query.order_by
+            if isinstance(campo, str) and campo.lstrip("-") and campo != "?"
+        ] or list(self.ordering)
+
+        pk = queryset.model._meta.pk.name
+        nomes = [campo.lstrip("-") for campo in campos]
+        if pk not in nomes and "pk" not in nomes:
+            direcao = "-" if campos[0].startswith("-") else ""
+            campos.append(f"{direcao}{pk}")
+        # Campos depois da PK não mudam a ordem
+        for i, nome in enumerate(campo.lstrip("-") for campo in campos):
+            if nome in (pk, "pk"):
+                return tuple(campos[: i + 1])
+        return tuple(campos)
+
+    def get_count_estimate(self, queryset, request):
+        """
+        Contagem opcional (?count=1), limitada a max_count linhas.
+        Retorna "N" ou "max_count+" quando houver mais linhas.
+        """
+        pedido = (request.query_params.get(self.count_query_param) or "").lower()
+        if pedido not in ("1", "true", "estimate"):
+            return None
+        total = queryset.order_by()[: self.max_count + 1].count()
+        if total > self.max_count:
+            return f"{self.max_count}+"
+        return str(total)
+
+    def encode_cursor(self, row):
+        # row é uma instância ou um dict de .values() (core.leitura)
+        if isinstance(row, dict):
+            valores = [row[campo.lstrip("-")] for campo in self.ordering_fields]
+        else:
+            valores = [getattr(row, campo.lstrip("-")) for campo in self.ordering_fields]
+        valores = [_valor_para_cursor(valor) for valor in valores]
+        bruto = json.dumps(valores, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(bruto).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            valores = json.loads(base64.urlsafe_b64decode(encoded + padding))
+            if not isinstance(valores, list) or len(valores) != len(self.ordering_fields):
+                raise ValueError
+            return [
+                self.parse_cursor_value(model, campo.lstrip("-"), valor)
+                for campo, valor in zip(self.ordering_fields, valores)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def parse_cursor_value(self, model, nome, valor):
+        """
+        Converte o valor do cursor para o tipo do campo. Anotações (ex.:
+        relevância da busca) não são campos do model e mantêm o valor JSON.
+        """
+        try:
+            campo = model._meta.get_field(nome)
+        except FieldDoesNotExist:
+            if not isinstance(valor, (int, float, str)):
+                raise ValueError(nome)
+            return valor
+        return campo.to_python(valor)
+
+    def build_keyset_filter(self, valores):
+        """
+        Monta (c1 > v1) OR (c1 = v1 AND c2 > v2) OR ..., respeitando a
+        direção de cada coluna.
+        """
+        filtro = Q()
+        iguais = {}
+        for campo, valor in zip(self.ordering_fields, valores):
+            nome = campo.lstrip("-")
+            operador = "lt" if campo.startswith("-") else "gt"
+            filtro |= Q(**iguais, **{f"{nome}__{operador}": valor})
+            iguais[nome] = valor
+        return filtro
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.count_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor da próxima página (header Link).",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Itens por página (máximo {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Inclui X-Count-Estimate (limitado a {self.max_count}).",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+
+class EventoPagination(KeysetPagination):
+    """
+    Catálogo de eventos: ordenado por (data, id).
+    """
+    ordering = ("data", "id")
+    page_size = 50
+    max_page_size = 100
+
+
+class PedidoPagination(KeysetPagination):
+    """
+    Histórico de pedidos: do mais recente para o mais antigo, (criado_em, id).
+    """
+    ordering = ("-criado_em", "-id")
+    page_size = 20
+    max_page_size = 50
+
+
+class UsuarioPagination(KeysetPagination):
+    """
+    Perfis de usuário: ordenados por id.
+    """
+    ordering = ("id",)
+    page_size = 50
+    max_page_size = 100
@@ -0,0 +1,87 @@
+# FarofaTrip/core/precos.py
+"""
+Precificação dos itens de pedido e cache de preços dos eventos.
+
+- precifica_itens() é o único cálculo de preços: usado tanto na criação
+  do pedido (PedidoSerializer.create) quanto na cotação do carrinho
+  (POST /pedidos/quote/).
+- precos_eventos() busca nome/ingresso/excursão de vários eventos com
+  cache por evento (TTL curto) e uma única query para os que faltarem.
+  A entrada é a da instância do evento (core.cache.chave_instancia),
+  apagada no save/delete por core.cache.invalida_instancia.
+"""
+from collections import namedtuple
+from decimal import Decimal
+
+from django.conf import settings
+
+from .cache import chave_instancia, obtem_muitos_ou_calcula
+from .models import Evento
+
+
+TIMEOUT_DEFAULT = 60  # segundos
+
+# Dados do evento necessários para precificar (mesmos atributos do model)
+PrecoEvento = namedtuple("PrecoEvento", ["id", "nome", "ingresso", "excursao"])
+
+
+def timeout_precos():
+    return getattr(settings, "PRECOS_CACHE_TIMEOUT", TIMEOUT_DEFAULT)
+
+
+def precos_eventos(ids):
+    """
+    Retorna {id: PrecoEvento} para os IDs existentes.
+    """
+    def calcula(faltando):
+        return {
+            linha[0]: PrecoEvento(*linha)
+            for linha in Evento.objects.filter(id__in=faltando).values_list(
+                "id", "nome", "ingresso", "excursao"
+            )
+        }
+
+    return obtem_muitos_ou_calcula(
+        {chave_instancia("evento", pk): pk for pk in ids}, calcula, PrecoEvento, timeout_precos()
+    )
+
+
+def precifica_itens(itens_data):
+    """
+    Calcula os itens de um carrinho/pedido.
+
+    Cada item tem "evento" (Evento ou PrecoEvento), "quantidade" e,
+    opcionalmente, "preco_ingresso"/"preco_excursao"; sem preço no item,
+    vale o preço do evento.
+
+    Retorna (linhas, total), onde cada linha tem evento, quantidade,
+    preco_ingresso, preco_excursao e subtotal.
+    """
+    linhas = []
+    total = Decimal("0.00")
+
+    for item_data in itens_data:
+        evento = item_data["evento"]
+        quantidade = item_data.get("quantidade", 1)
+
+        preco_ingresso = item_data.get("preco_ingresso")
+        if preco_ingresso is None:
+            preco_ingresso = evento.ingresso
+
+        preco_excursao = item_data.get("preco_excursao")
+        if preco_excursao is None:
+            preco_excursao = evento.excursao
+
+        subtotal = (preco_ingresso + preco_excursao) * quantidade
+        linhas.append(
+            {
+                "evento": evento,
+                "quantidade": quantidade,
+                "preco_ingresso": preco_ingresso,
+                "preco_excursao": preco_excursao,
+                "subtotal": subtotal,
+            }
+        )
+        total += subtotal
+
+    return linhas, total
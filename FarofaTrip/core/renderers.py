@@ -0,0 +1,132 @@
+# FarofaTrip/core/renderers.py
+"""
+Renderer e parser JSON sobre o orjson.
+
+- ORJSONRenderer: mesma saída do JSONRenderer do DRF (UTF-8, sem
+  espaços), com serialização em C. Tipos que o orjson não conhece
+  (Decimal, datas/horas, lazy strings, QuerySet...) passam pelo
+  encoders.JSONEncoder do DRF, então Decimal continua saindo como
+  string e datetime no formato do DRF. Accept com indent usa
+  indentação de 2 espaços (única suportada pelo orjson). U+2028/U+2029
+  saem escapados, como no DRF. O que o orjson não representa igual
+  (inteiros acima de 64 bits, NaN/Infinity, que ele escreveria como
+  null) volta para o JSONRenderer do DRF, com o mesmo resultado: a
+  saída dele ou o mesmo erro (ValueError/TypeError).
+- ORJSONParser: orjson.loads no corpo application/json. O que o orjson
+  não lê igual ao JSONParser do DRF vai para ele: charset declarado
+  diferente de UTF-8, inteiros longos (acima de 64 bits o orjson
+  devolve um float, com perda) e documentos que o orjson recusa (ex.:
+  1e400, que o DRF lê como inf; JSON inválido recebe o ParseError do
+  DRF).
+
+Sem o orjson instalado, as duas classes se comportam exatamente como o
+JSONRenderer/JSONParser do DRF.
+"""
+import codecs
+import math
+import re
+from io import BytesIO
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+
+_encoder = JSONEncoder()
+
+# Inteiro com 19+ dígitos pode passar de 64 bits; no texto de strings ou
+# decimais o fallback é só desnecessário, não errado
+_NUMERO_LONGO = re.compile(rb"\d{19,}")
+
+OPCOES = 0
+if orjson is not None:
+    # Datas/horas e chaves não-string com o mesmo formato do DRF
+    OPCOES = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    valor = _encoder.default(obj)
+    if isinstance(valor, float) and not math.isfinite(valor):
+        # Ex.: Decimal("NaN"); cai no JSONRenderer do DRF, que recusa
+        raise ValueError("float não finito")
+    return valor
+
+
+def _eh_utf8(encoding):
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _tem_float_nao_finito(obj):
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(
+            _tem_float_nao_finito(chave) or _tem_float_nao_finito(valor)
+            for chave, valor in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return any(_tem_float_nao_finito(item) for item in obj)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer com orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        opcoes = OPCOES
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            opcoes |= orjson.OPT_INDENT_2
+        try:
+            saida = orjson.dumps(data, default=_default, option=opcoes)
+        except orjson.JSONEncodeError:
+            # Inteiro acima de 64 bits ou tipo desconhecido
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # O orjson escreve NaN/Infinity como null; o DRF recusa (ValueError)
+        if b"null" in saida and _tem_float_nao_finito(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Separadores de linha/parágrafo quebram JavaScript embutido
+        if b"\xe2\x80" in saida:
+            saida = saida.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return saida
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser com orjson.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if not _eh_utf8(encoding):
+            return super().parse(stream, media_type, parser_context)
+
+        corpo = stream.read()
+        if _NUMERO_LONGO.search(corpo):
+            return super().parse(BytesIO(corpo), media_type, parser_context)
+        try:
+            return orjson.loads(corpo)
+        except orjson.JSONDecodeError:
+            return super().parse(BytesIO(corpo), media_type, parser_context)
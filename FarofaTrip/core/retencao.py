@@ -0,0 +1,111 @@
+# FarofaTrip/core/retencao.py
+"""
+Retenção das tabelas de tokens do SimpleJWT (token_blacklist).
+
+Cada login grava um OutstandingToken e cada logout um BlacklistedToken;
+depois que o refresh token expira, as duas linhas não servem para mais
+nada. purga_tokens() apaga os tokens expirados em lotes pequenos, cada
+um na sua transação curta, para não segurar o lock de escrita do SQLite
+enquanto logins acontecem.
+
+Usado pelo comando `purgar_tokens` (manual ou agendado com --loop).
+"""
+import time
+from datetime import timedelta
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+def limite_expiracao(reter_dias=0, agora=None):
+    """
+    Tokens com expires_at antes deste momento podem ser apagados.
+    """
+    agora = agora or timezone.now()
+    return agora - timedelta(days=reter_dias)
+
+
+def tokens_expirados(antes_de, using=DEFAULT_DB_ALIAS):
+    return OutstandingToken.objects.using(using).filter(expires_at__lt=antes_de)
+
+
+def estima_purga(antes_de, lote, using=DEFAULT_DB_ALIAS):
+    """
+    Estimativa para o --dry-run: quantas linhas e quantos lotes.
+    """
+    expirados = tokens_expirados(antes_de, using).count()
+    na_blacklist = (
+        BlacklistedToken.objects.using(using)
+        .filter(token__expires_at__lt=antes_de)
+        .count()
+    )
+    return {
+        "outstanding": expirados,
+        "blacklisted": na_blacklist,
+        "lotes": -(-expirados // lote) if lote else 0,
+    }
+
+
+def purga_lote(antes_de, lote, using=DEFAULT_DB_ALIAS):
+    """
+    Apaga até `lote` tokens expirados (os mais antigos primeiro) e suas
+    entradas na blacklist, em uma transação. Retorna (outstanding, blacklisted).
+    """
+    with transaction.atomic(using=using):
+        ids = list(
+            tokens_expirados(antes_de, using)
+            .order_by("id")
+            .values_list("id", flat=True)[:lote]
+        )
+        if not ids:
+            return 0, 0
+        blacklisted = _delete_por_ids(BlacklistedToken, "token_id", ids, using)
+        outstanding = _delete_por_ids(OutstandingToken, "id", ids, using)
+    return outstanding, blacklisted
+
+
+def _delete_por_ids(model, coluna, ids, using):
+    # DELETE direto: o QuerySet.delete() carregaria cada OutstandingToken
+    # para resolver o CASCADE, que aqui já foi tratado à mão.
+    conexao = connections[using]
+    tabela = conexao.ops.quote_name(model._meta.db_table)
+    marcadores = ", ".join(["%s"] * len(ids))
+    with conexao.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {tabela} WHERE {conexao.ops.quote_name(coluna)} IN ({marcadores})",
+            ids,
+        )
+        return cursor.rowcount
+
+
+def purga_tokens(antes_de, lote=1000, pausa=0.05, max_lotes=None, using=DEFAULT_DB_ALIAS):
+    """
+    Apaga os tokens expirados antes de `antes_de` em lotes de `lote`,
+    dormindo `pausa` segundos entre eles (deixa os logins passarem).
+
+    Retorna {"outstanding", "blacklisted", "lotes", "segundos", "linhas_por_segundo"}.
+    """
+    total = {"outstanding": 0, "blacklisted": 0, "lotes": 0}
+    inicio = time.perf_counter()
+
+    while max_lotes is None or total["lotes"] < max_lotes:
+        outstanding, blacklisted = purga_lote(antes_de, lote, using)
+        if not outstanding:
+            break
+        total["outstanding"] += outstanding
+        total["blacklisted"] += blacklisted
+        total["lotes"] += 1
+        if outstanding < lote:
+            break
+        if pausa:
+            time.sleep(pausa)
+
+    segundos = time.perf_counter() - inicio
+    linhas = total["outstanding"] + total["blacklisted"]
+    total["segundos"] = round(segundos, 3)
+    total["linhas_por_segundo"] = round(linhas / segundos, 1) if segundos else 0.0
+    return total
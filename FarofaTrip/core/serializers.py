@@ -1,10 +1,18 @@
 from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.models import update_last_login
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers, exceptions
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
 from django.db import transaction
-from .models import Perfil, Evento, Pedido, PedidoItem
-from decimal import Decimal
+from .blacklist import FilteredRefreshToken
+from .campos import CamposEsparsosMixin
+from .models import Perfil, Evento, Pedido, PedidoItem, usuarios_por_email
+from .notificacoes import enfileira_notificacao_pedido
+from .precos import precifica_itens, precos_eventos
 from django.contrib.auth.password_validation import validate_password
 
 
@@ -30,25 +38,30 @@ class EmailOrUsernameTokenObtainPairSerializer(TokenObtainPairSerializer):
 
     def validate(self, attrs):
         """
-        Se o username não for enviado mas o e-mail for,
-        tenta resolver o username a partir do e-mail informado.
+        Se o username não for enviado mas o e-mail for, autentica pelo
+        e-mail (core.backends.EmailOrUsernameBackend): o usuário é
+        buscado e verificado em uma única query.
         """
-        username_field = self.username_field
-        username = attrs.get(username_field)
+        username = attrs.get(self.username_field)
         email = attrs.get("email")
 
-        if not username and email:
-            try:
-                user = User.objects.get(email__iexact=email)
-                # Preenche o username no payload para o fluxo padrão do SimpleJWT
-                attrs[username_field] = getattr(user, username_field)
-            except User.DoesNotExist:
-                # Mantém a mensagem padrão de credenciais inválidas
-                raise exceptions.AuthenticationFailed(
-                    "No active account found with the given credentials"
-                )
+        if username or not email:
+            return super().validate(attrs)
 
-        return super().validate(attrs)
+        self.user = authenticate(
+            self.context.get("request"), email=email, password=attrs["password"]
+        )
+        if not api_settings.USER_AUTHENTICATION_RULE(self.user):
+            # Mantém a mensagem padrão de credenciais inválidas
+            raise exceptions.AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+
+        # Mesmo payload do TokenObtainPairSerializer.validate
+        refresh = self.get_token(self.user)
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, self.user)
+        return {"refresh": str(refresh), "access": str(refresh.access_token)}
 
 
 User = get_user_model()
@@ -95,7 +108,7 @@ class RegisterSerializer(serializers.Serializer):
         """
         Garante que o e-mail seja único.
         """
-        if User.objects.filter(email__iexact=value).exists():
+        if usuarios_por_email(value).exists():
             raise serializers.ValidationError("E-mail já cadastrado.")
         return value
 
@@ -158,6 +171,15 @@ class RegisterSerializer(serializers.Serializer):
         return user
     
 
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh do SimpleJWT com a verificação de blacklist passando pelo
+    filtro em memória (core.blacklist): o banco só é consultado em um
+    possível acerto.
+    """
+    token_class = FilteredRefreshToken
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """
     Serializer para troca de senha do usuário autenticado.
@@ -243,6 +265,17 @@ class PerfilSerializer(serializers.ModelSerializer):
             "endereco",
         ]
 
+    def validate_email(self, value):
+        """
+        O e-mail é único entre os usuários (ignorando maiúsculas).
+        """
+        outros = usuarios_por_email(value)
+        if self.instance is not None:
+            outros = outros.exclude(pk=self.instance.user_id)
+        if value and outros.exists():
+            raise serializers.ValidationError("E-mail já cadastrado.")
+        return value
+
     def update(self, instance, validated_data):
         """
         Atualiza tanto o Perfil quanto o User relacionado, se enviado.
@@ -282,15 +315,78 @@ class PerfilSerializer(serializers.ModelSerializer):
         return perfil
 
 
-class EventoSerializer(serializers.ModelSerializer):
+class EventoSerializer(CamposEsparsosMixin, serializers.ModelSerializer):
     """
     Serializer padrão para o modelo Evento.
+    Aceita ?fields= nas leituras (core.campos).
     """
     class Meta:
         model = Evento
         fields = "__all__"
 
 
+class EventoIdField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField que resolve o Evento a partir do mapa
+    pré-carregado pelo PedidoItemListSerializer, sem SELECT por item.
+
+    Fora de uma lista (serializer de item usado sozinho), mantém o
+    comportamento padrão do DRF.
+    """
+
+    def to_internal_value(self, data):
+        lista = getattr(self.parent, "parent", None)
+        eventos = getattr(lista, "eventos_por_id", None)
+        if eventos is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        evento = eventos.get(pk)
+        if evento is None:
+            self.fail("does_not_exist", pk_value=data)
+        return evento
+
+
+class PedidoItemListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer dos itens de pedido.
+
+    Carrega todos os Eventos referenciados com uma única query (id__in)
+    antes de validar os itens. O mapa fica em `eventos_por_id` e é usado
+    tanto na validação (EventoIdField) quanto no cálculo de preços,
+    e IDs inexistentes são rejeitados na mesma passada.
+    """
+
+    def to_internal_value(self, data):
+        ids = set()
+        if isinstance(data, list):
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                valor = item.get("evento_id")
+                if isinstance(valor, bool):
+                    continue
+                try:
+                    pk = int(valor)
+                except (TypeError, ValueError):
+                    continue
+                # Fora do intervalo de um BigAutoField nunca existe no banco
+                if 0 < pk < 2**63:
+                    ids.add(pk)
+
+        self.eventos_por_id = self.carrega_eventos(ids) if ids else {}
+        return super().to_internal_value(data)
+
+    def carrega_eventos(self, ids):
+        return Evento.objects.in_bulk(ids)
+
+
 class PedidoItemSerializer(serializers.ModelSerializer):
     """
     Serializer para itens de pedido.
@@ -298,7 +394,7 @@ class PedidoItemSerializer(serializers.ModelSerializer):
     - evento_id: usado para escrever (FK).
     - evento_nome: usado apenas para leitura.
     """
-    evento_id = serializers.PrimaryKeyRelatedField(
+    evento_id = EventoIdField(
         queryset=Evento.objects.all(),
         source="evento",
         write_only=True,
@@ -334,11 +430,13 @@ class PedidoItemSerializer(serializers.ModelSerializer):
             "subtotal",
         ]
         read_only_fields = ["id", "subtotal", "evento_nome"]
+        list_serializer_class = PedidoItemListSerializer
 
 
-class PedidoSerializer(serializers.ModelSerializer):
+class PedidoSerializer(CamposEsparsosMixin, serializers.ModelSerializer):
     """
     Serializer do Pedido, incluindo uma lista de itens aninhados.
+    Aceita ?fields= / ?expand=itens nas leituras (core.campos).
 
     A criação do pedido calcula o valor_total a partir dos itens.
     """
@@ -363,15 +461,21 @@ class PedidoSerializer(serializers.ModelSerializer):
             "valor_total",
             "criado_em",
         ]
+        # Com ?fields=, os itens só vêm se pedidos (fields ou expand)
+        campos_expansiveis = ["itens"]
 
+    @transaction.atomic
     def create(self, validated_data):
         """
-        Cria o Pedido + seus PedidoItem(s):
+        Cria o Pedido + seus PedidoItem(s) em uma única transação:
 
         - Atribui o usuário autenticado ao pedido, se existir.
         - Usa os preços do evento como padrão caso não venham no payload.
-        - Calcula subtotal de cada item e o valor_total do pedido.
+        - Calcula subtotal de cada item e o valor_total do pedido em memória.
         - Define status como 'pago' se houver forma_pagamento, senão 'pendente'.
+        - Grava o cabeçalho uma única vez (já com o total) e todos os
+          itens com um único bulk_create.
+        - Enfileira a notificação de WhatsApp do pedido.
         """
         itens_data = validated_data.pop("itens", [])
 
@@ -385,38 +489,78 @@ class PedidoSerializer(serializers.ModelSerializer):
         # Segurança: remove qualquer campo 'perfil' que venha indevidamente no payload
         validated_data.pop("perfil", None)
 
+        # Mesmo cálculo da cotação do carrinho (core.precos).
+        # bulk_create não chama PedidoItem.save(), por isso o subtotal
+        # vem sempre preenchido daqui.
+        linhas, total = precifica_itens(itens_data)
+        itens = [PedidoItem(**linha) for linha in linhas]
+
+        validated_data["valor_total"] = total
+        validated_data["status"] = (
+            "pago" if validated_data.get("forma_pagamento") else "pendente"
+        )
+
         pedido = Pedido.objects.create(**validated_data)
 
-        total = Decimal("0.00")
+        for item in itens:
+            item.pedido = pedido
+        PedidoItem.objects.bulk_create(itens)
 
-        for item_data in itens_data:
-            evento = item_data["evento"]
-            quantidade = item_data.get("quantidade", 1)
+        # Notificação de WhatsApp vai para a fila na mesma transação;
+        # o envio acontece fora da request (comando enviar_notificacoes).
+        enfileira_notificacao_pedido(pedido)
 
-            # Se o preço não for enviado, usa o preço do modelo Evento
-            preco_ingresso = item_data.get("preco_ingresso")
-            if preco_ingresso is None:
-                preco_ingresso = evento.ingresso
+        return pedido
 
-            preco_excursao = item_data.get("preco_excursao")
-            if preco_excursao is None:
-                preco_excursao = evento.excursao
 
-            subtotal = (preco_ingresso + preco_excursao) * quantidade
+class CotacaoItemListSerializer(PedidoItemListSerializer):
+    """
+    Itens da cotação: os eventos vêm do cache de preços (core.precos),
+    sem ir ao banco quando os preços já estão em cache.
+    """
 
-            PedidoItem.objects.create(
-                pedido=pedido,
-                evento=evento,
-                quantidade=quantidade,
-                preco_ingresso=preco_ingresso,
-                preco_excursao=preco_excursao,
-                subtotal=subtotal,
-            )
+    def carrega_eventos(self, ids):
+        return precos_eventos(ids)
 
-            total += subtotal
 
-        pedido.valor_total = total
-        pedido.status = "pago" if pedido.forma_pagamento else "pendente"
-        pedido.save()
+class CotacaoItemSerializer(PedidoItemSerializer):
+    """
+    Item de carrinho para cotação: mesmos campos de entrada do item de pedido.
+    """
 
-        return pedido
+    class Meta(PedidoItemSerializer.Meta):
+        list_serializer_class = CotacaoItemListSerializer
+
+
+class CotacaoSerializer(serializers.Serializer):
+    """
+    Cotação do carrinho (POST /pedidos/quote/), sem gravar nada.
+
+    Usa o mesmo cálculo de PedidoSerializer.create (precifica_itens) e
+    devolve o subtotal de cada linha e o valor_total.
+    """
+    itens = CotacaoItemSerializer(many=True, allow_empty=False)
+
+    def cota(self):
+        """
+        Calcula a cotação dos itens validados.
+        """
+        linhas, total = precifica_itens(self.validated_data["itens"])
+        return {"itens": linhas, "valor_total": total}
+
+    def to_representation(self, cotacao):
+        valor = serializers.DecimalField(max_digits=12, decimal_places=2)
+        return {
+            "itens": [
+                {
+                    "evento_id": linha["evento"].id,
+                    "evento_nome": linha["evento"].nome,
+                    "quantidade": linha["quantidade"],
+                    "preco_ingresso": valor.to_representation(linha["preco_ingresso"]),
+                    "preco_excursao": valor.to_representation(linha["preco_excursao"]),
+                    "subtotal": valor.to_representation(linha["subtotal"]),
+                }
+                for linha in cotacao["itens"]
+            ],
+            "valor_total": valor.to_representation(cotacao["valor_total"]),
+        }
@@ -0,0 +1,82 @@
+# FarofaTrip/core/signals.py
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import invalida_usuario_em_cache
+from .blacklist import registra_blacklist
+from .busca import garante_indice_busca
+from .cache import invalida_instancia
+from .catalogo import incrementa_versao_catalogo
+from .models import Evento, Pedido, PedidoItem, Perfil
+from .sqlite import aplica_pragmas
+
+
+@receiver(post_save, sender=Evento)
+@receiver(post_delete, sender=Evento)
+def invalida_catalogo(sender, **kwargs):
+    """
+    Qualquer alteração em Evento invalida o cache do catálogo.
+    """
+    incrementa_versao_catalogo()
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalida_usuario_autenticado(sender, instance, **kwargs):
+    """
+    Troca de senha, edição ou desativação do usuário apagam sua entrada
+    no cache da autenticação JWT.
+    """
+    invalida_usuario_em_cache(instance.pk)
+
+
+@receiver(post_save, sender=Evento)
+@receiver(post_delete, sender=Evento)
+@receiver(post_save, sender=Perfil)
+@receiver(post_delete, sender=Perfil)
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+@receiver(post_save, sender=Pedido)
+@receiver(post_delete, sender=Pedido)
+@receiver(post_save, sender=PedidoItem)
+@receiver(post_delete, sender=PedidoItem)
+def invalida_cache_core(sender, instance, update_fields=None, **kwargs):
+    """
+    Apaga as entradas da instância em core.cache: preço do evento
+    (core.precos), perfil de /usuarios/me/ e histórico de pedidos do
+    usuário. O login (update_last_login) não muda nenhuma delas.
+    """
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    invalida_instancia(instance)
+
+
+@receiver(connection_created, dispatch_uid="core.sqlite.aplica_pragmas")
+def aplica_pragmas_sqlite(sender, connection, **kwargs):
+    """
+    Cada conexão nova do SQLite recebe os PRAGMAs do alias (core.sqlite).
+    """
+    aplica_pragmas(connection)
+
+
+@receiver(post_migrate)
+def reinstala_indice_busca(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Depois das migrations do core, garante o índice full-text (core.busca).
+    """
+    if sender.name == "core":
+        garante_indice_busca(using)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def atualiza_filtro_blacklist(sender, instance, created, **kwargs):
+    """
+    Refresh token novo na blacklist entra no filtro em memória
+    (core.blacklist).
+    """
+    if created:
+        registra_blacklist(instance.token.jti)
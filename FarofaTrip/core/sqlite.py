@@ -0,0 +1,56 @@
+# FarofaTrip/core/sqlite.py
+"""
+Ajustes de concorrência do SQLite aplicados a cada conexão nova.
+
+Os PRAGMAs vêm da chave "PRAGMAS" do alias em settings.DATABASES
+(montada por FarofaTrip/database.py, que define os valores padrão em
+PRAGMAS_PADRAO), por exemplo:
+
+    DATABASES["default"]["PRAGMAS"] = {
+        "busy_timeout": 20000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        ...
+    }
+
+Aliases sem "PRAGMAS" (ou de outros bancos) não são alterados. O BEGIN
+IMMEDIATE das transações de escrita é configurado pelo próprio Django
+(OPTIONS["transaction_mode"]).
+"""
+import re
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+_IDENTIFICADOR = re.compile(r"^[A-Za-z_]+$")
+
+
+def sql_pragma(nome, valor):
+    """
+    Monta "PRAGMA nome=valor". Só aceita nomes/valores simples, já que
+    PRAGMA não aceita parâmetros.
+    """
+    if not _IDENTIFICADOR.match(nome):
+        raise ImproperlyConfigured(f"PRAGMA inválido: {nome!r}")
+    if isinstance(valor, bool) or not isinstance(valor, (int, str)):
+        raise ImproperlyConfigured(f"Valor inválido para PRAGMA {nome}: {valor!r}")
+    if isinstance(valor, str) and not _IDENTIFICADOR.match(valor):
+        raise ImproperlyConfigured(f"Valor inválido para PRAGMA {nome}: {valor!r}")
+    return f"PRAGMA {nome}={valor}"
+
+
+def aplica_pragmas(connection):
+    """
+    Executa os PRAGMAs do alias na conexão nova (ligada ao
+    connection_created em core.signals). Um valor None desliga o PRAGMA
+    correspondente.
+    """
+    if connection.vendor != "sqlite":
+        return
+    pragmas = connection.settings_dict.get("PRAGMAS") or {}
+    comandos = [sql_pragma(nome, valor) for nome, valor in pragmas.items() if valor is not None]
+    if not comandos:
+        return
+    with connection.cursor() as cursor:
+        for comando in comandos:
+            cursor.execute(comando)
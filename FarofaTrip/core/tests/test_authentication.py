@@ -0,0 +1,169 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import (
+    CacheLRU,
+    CachedJWTAuthentication,
+    ClaimsOnlyJWTAuthentication,
+    usuarios_em_cache,
+)
+
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    """
+    Testes da autenticação JWT com cache do usuário.
+
+    Cobre:
+    - requests seguintes sem SELECT em auth_user
+    - invalidação na troca de senha, edição e desativação
+    - cópia isolada de request.user por request
+    - modo só-claims (TokenUser, sem queries).
+    """
+
+    def setUp(self):
+        usuarios_em_cache.clear()
+        self.user = User.objects.create_user(
+            username="cliente", email="cliente@example.com", password="StrongPass123!"
+        )
+        self.access = str(AccessToken.for_user(self.user))
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        self.url = reverse("pedido-list")
+
+    def _selects_de_usuario(self, url=None):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url or self.url)
+        selects = [q["sql"] for q in ctx.captured_queries if 'FROM "auth_user" WHERE' in q["sql"]]
+        return resp, selects
+
+    def test_segunda_request_usa_cache(self):
+        """
+        Só a primeira request com o token busca o usuário no banco.
+        """
+        resp, selects = self._selects_de_usuario()
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(selects), 1)
+
+        resp, selects = self._selects_de_usuario()
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(selects, [])
+
+    def test_troca_de_senha_invalida_cache(self):
+        """
+        ChangePasswordSerializer.save grava o usuário e apaga o cache.
+        """
+        self._selects_de_usuario()
+        resp = self.client.post(
+            reverse("api_change_password"),
+            {
+                "old_password": "StrongPass123!",
+                "new_password": "OutraSenha456!",
+                "new_password_confirm": "OutraSenha456!",
+            },
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        _, selects = self._selects_de_usuario()
+        self.assertEqual(len(selects), 1)
+
+    def test_desativacao_bloqueia_proxima_request(self):
+        """
+        Usuário desativado perde o acesso na request seguinte.
+        """
+        self._selects_de_usuario()
+        self.user.is_active = False
+        self.user.save()
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_edicao_do_usuario_reflete_na_proxima_request(self):
+        """
+        Dados alterados do usuário não ficam presos no cache.
+        """
+        self._selects_de_usuario()
+        self.user.first_name = "Novo"
+        self.user.save()
+
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        user, _ = CachedJWTAuthentication().authenticate(request)
+        self.assertEqual(user.first_name, "Novo")
+
+    def test_request_user_e_uma_copia(self):
+        """
+        Alterar request.user em uma request não altera o usuário em cache.
+        """
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        auth = CachedJWTAuthentication()
+        primeiro, _ = auth.authenticate(request)
+        primeiro.first_name = "Alterado"
+        segundo, _ = auth.authenticate(request)
+
+        self.assertEqual(segundo.first_name, "")
+        self.assertIsNot(primeiro, segundo)
+
+    def test_modo_so_claims_sem_queries(self):
+        """
+        ClaimsOnlyJWTAuthentication monta um TokenUser sem ir ao banco.
+        """
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        with self.assertNumQueries(0):
+            user, _ = ClaimsOnlyJWTAuthentication().authenticate(request)
+        self.assertIsInstance(user, TokenUser)
+        self.assertEqual(int(user.id), self.user.id)
+        self.assertTrue(user.is_authenticated)
+
+
+class CacheLRUTests(SimpleTestCase):
+    """
+    Testes do CacheLRU: limite de tamanho, TTL e invalidação por predicado.
+    """
+
+    def test_remove_o_menos_usado(self):
+        """
+        Acima do limite, sai a entrada acessada há mais tempo.
+        """
+        lru = CacheLRU(max_size=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(len(lru), 2)
+
+    def test_entrada_expira_apos_ttl(self):
+        """
+        Entradas mais velhas que o TTL não são retornadas.
+        """
+        lru = CacheLRU(max_size=10, ttl=5)
+        with mock.patch("core.authentication.time.monotonic", return_value=100.0):
+            lru.set("a", 1)
+        with mock.patch("core.authentication.time.monotonic", return_value=104.0):
+            self.assertEqual(lru.get("a"), 1)
+        with mock.patch("core.authentication.time.monotonic", return_value=105.0):
+            self.assertIsNone(lru.get("a"))
+
+    def test_delete_matching(self):
+        """
+        Remove todas as entradas de um usuário (chaves (user_id, jti)).
+        """
+        lru = CacheLRU(max_size=10, ttl=60)
+        lru.set(("1", "x"), "u1")
+        lru.set(("1", "y"), "u1")
+        lru.set(("2", "z"), "u2")
+        lru.delete_matching(lambda chave: chave[0] == "1")
+        self.assertEqual(len(lru), 1)
+        self.assertEqual(lru.get(("2", "z")), "u2")
@@ -0,0 +1,104 @@
+from django.contrib.auth import authenticate, get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models import Perfil
+from core.serializers import PerfilSerializer
+
+
+User = get_user_model()
+
+
+def _selects_de_usuario(ctx):
+    return [q for q in ctx.captured_queries if q["sql"].startswith("SELECT") and '"auth_user"' in q["sql"]]
+
+
+class EmailOrUsernameBackendTests(TestCase):
+    """
+    Testes do backend de autenticação por e-mail (core.backends).
+
+    Cobre:
+    - login por e-mail com uma única query, sem diferenciar maiúsculas
+    - senha errada, e-mail inexistente e usuário inativo
+    - login por username continua funcionando.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cliente", email="Cliente@Example.com", password="StrongPass123!"
+        )
+
+    def test_email_autentica_em_uma_query(self):
+        """
+        O usuário é buscado e verificado em um único SELECT.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            user = authenticate(email=" cliente@EXAMPLE.com", password="StrongPass123!")
+        self.assertEqual(user, self.user)
+        self.assertEqual(len(_selects_de_usuario(ctx)), 1)
+
+    def test_senha_errada_ou_email_inexistente(self):
+        self.assertIsNone(authenticate(email="cliente@example.com", password="errada"))
+        self.assertIsNone(authenticate(email="outro@example.com", password="StrongPass123!"))
+        self.assertIsNone(authenticate(email="", password="StrongPass123!"))
+
+    def test_usuario_inativo_nao_autentica(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(authenticate(email="cliente@example.com", password="StrongPass123!"))
+
+    def test_username_continua_funcionando(self):
+        self.assertEqual(
+            authenticate(username="cliente", password="StrongPass123!"), self.user
+        )
+
+
+class LoginPorEmailTests(APITestCase):
+    """
+    Testes do login JWT por e-mail e da unicidade do e-mail na edição do perfil.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cliente", email="cliente@example.com", password="StrongPass123!"
+        )
+        self.url = reverse("api_login")
+
+    def test_login_por_email_busca_usuario_uma_vez(self):
+        """
+        Antes eram dois SELECTs (e-mail → username → authenticate).
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(
+                self.url,
+                {"email": "CLIENTE@example.com", "password": "StrongPass123!"},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn("access", resp.data)
+        self.assertIn("refresh", resp.data)
+        self.assertEqual(len(_selects_de_usuario(ctx)), 1)
+
+    def test_login_por_email_com_senha_errada(self):
+        resp = self.client.post(
+            self.url, {"email": "cliente@example.com", "password": "errada"}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_perfil_nao_aceita_email_de_outro_usuario(self):
+        """
+        Trocar o e-mail para um já usado (em outra caixa) é erro de validação.
+        """
+        outro = User.objects.create_user(username="outro", email="outro@example.com")
+        perfil = Perfil.objects.create(user=outro, cpf="12345678901")
+
+        serializer = PerfilSerializer(perfil, data={"email": "CLIENTE@example.com"}, partial=True)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("email", serializer.errors)
+
+        serializer = PerfilSerializer(perfil, data={"email": "OUTRO@example.com"}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
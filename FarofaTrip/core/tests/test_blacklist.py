@@ -0,0 +1,173 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.blacklist import (
+    FiltroBloom,
+    filtro_blacklist,
+    incrementa_versao_compartilhada,
+)
+
+
+User = get_user_model()
+
+
+class FiltroBlacklistTests(APITestCase):
+    """
+    Testes do filtro em memória da blacklist de refresh tokens.
+
+    Cobre:
+    - refresh de token válido sem consultar a tabela de blacklist
+    - token em logout recusado no refresh seguinte
+    - blacklist feita por outro processo vista pela versão no cache
+      ou pelo intervalo de sincronização
+    - ids commitados fora de ordem (margem de sincronização)
+    - sincronização concorrente sem bloquear as requests.
+    """
+
+    def setUp(self):
+        cache.clear()
+        filtro_blacklist.reinicia()
+        self.user = User.objects.create_user(
+            username="cliente", email="cliente@example.com", password="StrongPass123!"
+        )
+        self.refresh_url = reverse("api_refresh")
+
+    def _refresh(self, refresh):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(self.refresh_url, {"refresh": str(refresh)}, format="json")
+        consultas = [
+            q["sql"] for q in ctx.captured_queries
+            if "token_blacklist_blacklistedtoken" in q["sql"]
+        ]
+        return resp, consultas
+
+    def _blacklist_por_outro_processo(self, refresh):
+        """
+        Grava a blacklist sem signals, como faria outro worker.
+        """
+        token = OutstandingToken.objects.get(jti=refresh["jti"])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+
+    def test_refresh_valido_nao_consulta_blacklist(self):
+        """
+        Um JTI fora do filtro dispensa o SELECT na blacklist.
+        """
+        filtro_blacklist.aquece()
+        resp, consultas = self._refresh(RefreshToken.for_user(self.user))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(consultas, [])
+
+    def test_logout_bloqueia_refresh(self):
+        """
+        O token colocado na blacklist pelo logout é recusado e a
+        confirmação vai ao banco.
+        """
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        resp = self.client.post(reverse("api_logout"), {"refresh": str(refresh)}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_205_RESET_CONTENT)
+        # Consome o aviso de versão do próprio logout (sincronização)
+        filtro_blacklist.pode_conter(refresh["jti"])
+
+        resp, consultas = self._refresh(refresh)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(len(consultas), 1)
+
+    def test_blacklist_de_outro_processo_via_versao(self):
+        """
+        Mudança na versão compartilhada força a sincronização incremental.
+        """
+        refresh = RefreshToken.for_user(self.user)
+        filtro_blacklist.aquece()
+        self._blacklist_por_outro_processo(refresh)
+        incrementa_versao_compartilhada()
+
+        resp, _ = self._refresh(refresh)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(BLACKLIST_SYNC_INTERVAL=0)
+    def test_blacklist_de_outro_processo_via_intervalo(self):
+        """
+        Sem aviso pelo cache, o intervalo de sincronização garante a atualização.
+        """
+        refresh = RefreshToken.for_user(self.user)
+        filtro_blacklist.aquece()
+        self._blacklist_por_outro_processo(refresh)
+
+        resp, _ = self._refresh(refresh)
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_carga_inicial_inclui_blacklist_existente(self):
+        """
+        aquece() carrega os JTIs já na blacklist.
+        """
+        refresh = RefreshToken.for_user(self.user)
+        self._blacklist_por_outro_processo(refresh)
+        filtro_blacklist.aquece()
+        self.assertTrue(filtro_blacklist.pode_conter(refresh["jti"]))
+
+
+    def test_id_commitado_fora_de_ordem(self):
+        """
+        Linha com id menor que o último visto (commit tardio no
+        PostgreSQL) entra no filtro pela margem de sincronização, sem
+        contar duas vezes as linhas já vistas.
+        """
+        primeiro = RefreshToken.for_user(self.user)
+        token = OutstandingToken.objects.get(jti=primeiro["jti"])
+        BlacklistedToken.objects.create(id=50, token=token)
+        filtro_blacklist.aquece()
+
+        tardio = RefreshToken.for_user(self.user)
+        token = OutstandingToken.objects.get(jti=tardio["jti"])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(id=10, token=token)])
+        incrementa_versao_compartilhada()
+
+        self.assertTrue(filtro_blacklist.pode_conter(tardio["jti"]))
+        incrementa_versao_compartilhada()
+        filtro_blacklist.pode_conter(tardio["jti"])
+        self.assertEqual(filtro_blacklist.bloom.elementos, 2)
+
+    def test_sincronizacao_em_andamento_nao_bloqueia(self):
+        """
+        Enquanto outra thread sincroniza, a verificação usa o filtro
+        atual sem ir ao banco.
+        """
+        filtro_blacklist.aquece()
+        incrementa_versao_compartilhada()
+        with filtro_blacklist._lock_sync:
+            with self.assertNumQueries(0):
+                self.assertFalse(filtro_blacklist.pode_conter("jti-qualquer"))
+
+
+class FiltroBloomTests(SimpleTestCase):
+    """
+    Testes do FiltroBloom: sem falsos negativos e poucos falsos positivos.
+    """
+
+    def test_sem_falsos_negativos(self):
+        bloom = FiltroBloom(1000)
+        valores = [uuid.uuid4().hex for _ in range(1000)]
+        for valor in valores:
+            bloom.add(valor)
+        self.assertTrue(all(valor in bloom for valor in valores))
+
+    def test_taxa_de_falsos_positivos(self):
+        bloom = FiltroBloom(1000, taxa=0.01)
+        for _ in range(1000):
+            bloom.add(uuid.uuid4().hex)
+        falsos = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+        self.assertLess(falsos, 300)
@@ -0,0 +1,315 @@
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.cache import (
+    chave,
+    chave_instancia,
+    chave_lock,
+    incrementa_versao,
+    namespace_dono,
+    obtem_com_revalidacao,
+    obtem_muitos_ou_calcula,
+    obtem_ou_calcula,
+    versao,
+)
+from core.models import Evento, Pedido, PedidoItem, Perfil
+
+
+User = get_user_model()
+
+
+class CacheHelpersTests(TestCase):
+    """
+    Testes dos helpers de core.cache.
+
+    Cobre:
+    - chaves versionadas e invalidação por namespace
+    - get-or-compute com tipo esperado (simples e em lote)
+    - invalidação por signals de Evento, Perfil/User e Pedido/PedidoItem
+      (e nada no login).
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_chave_versionada_muda_ao_incrementar(self):
+        """
+        Incrementar a versão gera chaves novas; partes inseguras viram hash.
+        """
+        antiga = chave("evento", "lista", "future")
+        self.assertEqual(antiga, f"evento:v{versao('evento')}:lista:future")
+        incrementa_versao("evento")
+        self.assertNotEqual(chave("evento", "lista", "future"), antiga)
+        self.assertNotIn(" ", chave("evento", "busca com espaço"))
+
+    def test_obtem_ou_calcula_respeita_tipo(self):
+        """
+        Calcula uma vez; valor em cache de outro tipo é recalculado.
+        """
+        chamadas = []
+
+        def calcula():
+            chamadas.append(1)
+            return {"total": 3}
+
+        self.assertEqual(obtem_ou_calcula("t:dict", calcula, dict), {"total": 3})
+        self.assertEqual(obtem_ou_calcula("t:dict", calcula, dict), {"total": 3})
+        self.assertEqual(len(chamadas), 1)
+
+        cache.set("t:dict", ["formato antigo"])
+        self.assertEqual(obtem_ou_calcula("t:dict", calcula, dict), {"total": 3})
+        self.assertEqual(len(chamadas), 2)
+
+        with self.assertRaises(TypeError):
+            obtem_ou_calcula("t:int", lambda: "3", int)
+
+    def test_obtem_muitos_ou_calcula_so_calcula_faltando(self):
+        """
+        Um get_many; calcula_faltando recebe só os ids sem entrada.
+        """
+        cache.set("n:1", 10)
+        pedidos = []
+
+        def calcula(ids):
+            pedidos.append(list(ids))
+            return {pk: pk * 10 for pk in ids if pk != 3}
+
+        chaves = {f"n:{pk}": pk for pk in (1, 2, 3)}
+        self.assertEqual(obtem_muitos_ou_calcula(chaves, calcula, int), {1: 10, 2: 20})
+        self.assertEqual(pedidos, [[2, 3]])
+        self.assertEqual(cache.get("n:2"), 20)
+        self.assertIsNone(cache.get("n:3"))
+
+    def test_signals_invalidam_por_modelo(self):
+        """
+        Salvar Evento, User ou Perfil apaga a entrada da instância;
+        salvar Pedido ou PedidoItem incrementa, depois do commit, a versão
+        do histórico do dono. O login (só last_login) não invalida nada.
+        """
+        evento = Evento.objects.create(
+            nome="Show",
+            local="Arena",
+            cidade="Recife",
+            data=date.today() + timedelta(days=10),
+            descricao="Descrição",
+            ingresso=Decimal("50.00"),
+        )
+        user = User.objects.create_user(username="cliente", password="x")
+        perfil = Perfil.objects.create(user=user, cpf="12345678901")
+        outro = User.objects.create_user(username="outro", password="x")
+        pedido = Pedido.objects.create(usuario=user, valor_total=Decimal("0.00"))
+        item = PedidoItem.objects.create(pedido=pedido, evento=evento, quantidade=1)
+
+        casos = [
+            ("evento", evento.pk, lambda: evento.save()),
+            ("perfil", user.pk, lambda: user.save()),
+            ("perfil", user.pk, lambda: perfil.save()),
+        ]
+        for namespace, pk, altera in casos:
+            with self.subTest(namespace=namespace):
+                cache.set(chave_instancia(namespace, pk), "valor")
+                altera()
+                self.assertIsNone(cache.get(chave_instancia(namespace, pk)))
+
+        cache.set(chave_instancia("perfil", user.pk), "valor")
+        update_last_login(None, user)
+        self.assertEqual(cache.get(chave_instancia("perfil", user.pk)), "valor")
+
+        historico = namespace_dono("pedidos", user.pk)
+        for altera in (pedido.save, item.save):
+            with self.subTest(altera=altera):
+                antes = versao(historico)
+                outro_antes = versao(namespace_dono("pedidos", outro.pk))
+                with self.captureOnCommitCallbacks(execute=True):
+                    altera()
+                    self.assertEqual(versao(historico), antes)
+                self.assertGreater(versao(historico), antes)
+                self.assertEqual(versao(namespace_dono("pedidos", outro.pk)), outro_antes)
+
+
+class LeiturasEmCacheTests(APITestCase):
+    """
+    Testes das leituras por usuário servidas por core.cache.
+
+    Cobre:
+    - GET /usuarios/me/ sem queries na segunda request e atualizado
+      depois do PATCH
+    - páginas de GET /pedidos/ em cache por usuário, invalidadas por um
+      pedido novo.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cliente", email="cliente@example.com", password="StrongPass123!"
+        )
+        Perfil.objects.create(user=self.user, cpf="12345678901")
+        self.client.force_authenticate(self.user)
+
+    def test_perfil_do_usuario_em_cache(self):
+        """
+        A segunda leitura do perfil não consulta o banco; o PATCH apaga a
+        entrada e a leitura seguinte já traz o valor novo.
+        """
+        url = reverse("usuario-me")
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            resp = self.client.get(url)
+        self.assertEqual(resp.data["username"], "cliente")
+
+        resp = self.client.patch(url, {"first_name": "Maria"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(url).data["first_name"], "Maria")
+
+    def test_historico_de_pedidos_em_cache(self):
+        """
+        Cada página fica em cache com os headers de paginação; um pedido
+        novo do usuário invalida o histórico dele.
+        """
+        for _ in range(3):
+            Pedido.objects.create(usuario=self.user)
+        url = reverse("pedido-list")
+        primeira = self.client.get(url, {"page_size": 2})
+        with self.assertNumQueries(0):
+            resp = self.client.get(url, {"page_size": 2})
+        self.assertEqual(resp.data, primeira.data)
+        self.assertEqual(resp["Link"], primeira["Link"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            novo = Pedido.objects.create(usuario=self.user)
+        resp = self.client.get(url, {"page_size": 2})
+        self.assertEqual(resp.data[0]["id"], novo.pk)
+
+
+class RevalidacaoTests(SimpleTestCase):
+    """
+    Testes de obtem_com_revalidacao (single-flight + stale-while-revalidate).
+
+    Cobre:
+    - valor antigo servido enquanto outro chamador recalcula
+    - espera pelo recálculo quando não há valor antigo
+    - um único recálculo com várias threads concorrentes
+    - expiração antecipada probabilística.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def contador(self, valor="novo", custo=0.0):
+        chamadas = []
+        lock = threading.Lock()
+
+        def calcula():
+            with lock:
+                chamadas.append(1)
+            time.sleep(custo)
+            return valor
+
+        return calcula, chamadas
+
+    def test_versao_nova_serve_antigo_enquanto_outro_recalcula(self):
+        """
+        Com o lock de recálculo ocupado, a versão anterior é devolvida;
+        livre, o chamador recalcula.
+        """
+        obtem_com_revalidacao("k", lambda: "antigo", versao=1)
+        calcula, chamadas = self.contador()
+
+        cache.add(chave_lock("k"), 1)
+        self.assertEqual(obtem_com_revalidacao("k", calcula, versao=2), "antigo")
+        self.assertEqual(chamadas, [])
+
+        cache.delete(chave_lock("k"))
+        self.assertEqual(obtem_com_revalidacao("k", calcula, versao=2), "novo")
+        self.assertEqual(obtem_com_revalidacao("k", calcula, versao=2), "novo")
+        self.assertEqual(len(chamadas), 1)
+
+    def test_ttl_vencido_serve_antigo_durante_recalculo(self):
+        """
+        Depois do TTL (e dentro do stale TTL) a entrada ainda serve quem
+        não conseguiu o lock.
+        """
+        obtem_com_revalidacao("k", lambda: "antigo", versao=1, timeout=1)
+        cache.add(chave_lock("k"), 1)
+        with mock.patch("core.cache.time.time", return_value=time.time() + 5):
+            self.assertEqual(obtem_com_revalidacao("k", lambda: "novo", versao=1), "antigo")
+
+    @override_settings(CORE_CACHE_ESPERA=2)
+    def test_sem_valor_antigo_espera_o_recalculo(self):
+        """
+        Sem entrada nenhuma, quem não tem o lock espera o valor novo em
+        vez de recalcular.
+        """
+        cache.add(chave_lock("k"), 1)
+        threading.Timer(0.1, lambda: cache.set("k", {
+            "valor": "do outro", "versao": 1, "expira_em": time.time() + 60, "delta": 0.1,
+        })).start()
+        calcula, chamadas = self.contador()
+        self.assertEqual(obtem_com_revalidacao("k", calcula, versao=1), "do outro")
+        self.assertEqual(chamadas, [])
+
+    @override_settings(CORE_CACHE_ESPERA=0.05)
+    def test_espera_esgotada_calcula_sem_lock(self):
+        """
+        Se o recálculo do outro não termina a tempo, calcula mesmo assim.
+        """
+        cache.add(chave_lock("k"), 1)
+        self.assertEqual(obtem_com_revalidacao("k", lambda: "proprio", versao=1), "proprio")
+
+    def test_threads_concorrentes_recalculam_uma_vez(self):
+        """
+        16 threads pedindo a mesma chave vazia: um recálculo só.
+        """
+        calcula, chamadas = self.contador(custo=0.05)
+        resultados = []
+        threads = [
+            threading.Thread(
+                target=lambda: resultados.append(obtem_com_revalidacao("k", calcula, versao=1))
+            )
+            for _ in range(16)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(resultados, ["novo"] * 16)
+        self.assertEqual(len(chamadas), 1)
+
+    def test_expiracao_antecipada_probabilistica(self):
+        """
+        Perto do fim do TTL, o sorteio pode antecipar o recálculo (mais
+        provável quanto mais caro o último cálculo); com
+        CORE_CACHE_BETA=0 isso não acontece.
+        """
+        antigo, _ = self.contador("antigo", custo=0.01)
+        obtem_com_revalidacao("k", antigo, versao=1, timeout=10)
+        calcula, chamadas = self.contador()
+        daqui_a_pouco = time.time() + 9.9
+
+        with mock.patch("core.cache.time.time", return_value=daqui_a_pouco), \
+                mock.patch("core.cache.random.random", return_value=0.5):
+            self.assertEqual(obtem_com_revalidacao("k", calcula, versao=1), "antigo")
+
+        with override_settings(CORE_CACHE_BETA=0), \
+                mock.patch("core.cache.time.time", return_value=daqui_a_pouco), \
+                mock.patch("core.cache.random.random", return_value=1 - 1e-12):
+            self.assertEqual(obtem_com_revalidacao("k", calcula, versao=1), "antigo")
+
+        with mock.patch("core.cache.time.time", return_value=daqui_a_pouco), \
+                mock.patch("core.cache.random.random", return_value=1 - 1e-12):
+            self.assertEqual(obtem_com_revalidacao("k", calcula, versao=1), "novo")
+        self.assertEqual(len(chamadas), 1)
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from FarofaTrip.cache import cache_config
+
+
+BASE_DIR = Path("/srv/farofatrip")
+
+
+class CacheConfigTests(SimpleTestCase):
+    """
+    Testes da configuração de caches por variáveis de ambiente
+    (FarofaTrip/cache.py).
+
+    Cobre:
+    - padrão em memória com DEBUG, em arquivo sem DEBUG
+    - backend em arquivo e backends por socket local
+    - CACHE_BACKEND inválido.
+    """
+
+    def test_padrao_e_memoria_local(self):
+        """
+        Sem variáveis e com DEBUG, o cache fica em memória do processo.
+        """
+        caches = cache_config(BASE_DIR, environ={}, debug=True)
+        self.assertEqual(set(caches), {"default"})
+        self.assertEqual(
+            caches["default"]["BACKEND"], "django.core.cache.backends.locmem.LocMemCache"
+        )
+        self.assertEqual(caches["default"]["KEY_PREFIX"], "farofatrip")
+        self.assertEqual(caches["default"]["OPTIONS"]["MAX_ENTRIES"], 5000)
+
+    def test_padrao_sem_debug_e_compartilhado(self):
+        """
+        Sem DEBUG o padrão é o cache em arquivo: o throttling e os seus
+        contadores valem para todos os workers.
+        """
+        caches = cache_config(BASE_DIR, environ={})
+        self.assertEqual(
+            caches["default"]["BACKEND"], "django.core.cache.backends.filebased.FileBasedCache"
+        )
+        local = cache_config(BASE_DIR, environ={"CACHE_BACKEND": "local"})
+        self.assertEqual(
+            local["default"]["BACKEND"], "django.core.cache.backends.locmem.LocMemCache"
+        )
+
+    def test_backend_em_arquivo(self):
+        """
+        CACHE_BACKEND=file grava em BASE_DIR/.cache, compartilhado entre workers.
+        """
+        caches = cache_config(BASE_DIR, environ={"CACHE_BACKEND": "file"})
+        self.assertEqual(
+            caches["default"]["BACKEND"], "django.core.cache.backends.filebased.FileBasedCache"
+        )
+        self.assertEqual(caches["default"]["LOCATION"], "/srv/farofatrip/.cache")
+
+    def test_backends_por_socket_local(self):
+        """
+        Redis e memcached usam socket unix por padrão ou CACHE_LOCATION.
+        """
+        redis = cache_config(BASE_DIR, environ={"CACHE_BACKEND": "redis"})["default"]
+        self.assertEqual(redis["LOCATION"], "unix:///run/redis/redis.sock")
+        memcached = cache_config(
+            BASE_DIR,
+            environ={"CACHE_BACKEND": "memcached", "CACHE_LOCATION": "unix:/tmp/mc.sock"},
+        )["default"]
+        self.assertEqual(memcached["LOCATION"], "unix:/tmp/mc.sock")
+        self.assertNotIn("OPTIONS", memcached)
+
+    def test_backend_invalido(self):
+        """
+        Backend desconhecido falha na carga dos settings.
+        """
+        with self.assertRaises(ValueError):
+            cache_config(BASE_DIR, environ={"CACHE_BACKEND": "disco"})
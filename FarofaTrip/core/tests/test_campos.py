@@ -0,0 +1,150 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from core.campos import colunas_dos_campos
+from core.catalogo import chave_catalogo, chave_lote
+from core.models import Evento, Pedido, PedidoItem
+from core.serializers import EventoSerializer, PedidoSerializer
+
+
+User = get_user_model()
+
+
+class CamposEsparsosTests(APITestCase):
+    """
+    Testes de ?fields= / ?expand= (core.campos).
+
+    Cobre:
+    - listagem e detalhe de eventos só com os campos pedidos, via .only()
+    - campos desconhecidos ou não expansíveis respondem 400
+    - pedidos sem itens não buscam os itens; ?expand=itens os inclui
+    - chaves do catálogo distintas por seleção de campos.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cliente", password="StrongPass123!")
+        hoje = date.today()
+        self.eventos = [
+            Evento.objects.create(
+                nome=f"Evento {i}",
+                local="Arena",
+                cidade="Recife",
+                data=hoje + timedelta(days=i + 1),
+                descricao="Descrição longa " * 20,
+                ingresso=Decimal("99.90"),
+                excursao=Decimal("0"),
+            )
+            for i in range(3)
+        ]
+        for i in range(2):
+            pedido = Pedido.objects.create(usuario=self.user, valor_total=Decimal("99.90"))
+            PedidoItem.objects.create(
+                pedido=pedido,
+                evento=self.eventos[i],
+                quantidade=1,
+                preco_ingresso=Decimal("99.90"),
+                preco_excursao=Decimal("0"),
+            )
+        self.client.force_authenticate(self.user)
+
+    def test_listagem_de_eventos_com_campos(self):
+        """
+        Só os campos pedidos, na ordem do serializer, e só as colunas deles no SQL.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(reverse("evento-list"), {"fields": "nome,id, data"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            resp.json()[0],
+            {"id": self.eventos[0].id, "nome": "Evento 0", "data": self.eventos[0].data.isoformat()},
+        )
+        sql = next(q["sql"] for q in queries.captured_queries if '"core_evento"' in q["sql"])
+        self.assertNotIn('"descricao"', sql)
+
+    def test_detalhe_de_evento_usa_only(self):
+        """
+        O retrieve adia as colunas fora da seleção.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(
+                reverse("evento-detail", args=[self.eventos[0].id]), {"fields": "id,cidade"}
+            )
+        self.assertEqual(resp.json(), {"id": self.eventos[0].id, "cidade": "Recife"})
+        self.assertTrue(all('"descricao"' not in q["sql"] for q in queries.captured_queries))
+
+    def test_campos_invalidos_respondem_400(self):
+        """
+        Campo desconhecido em fields e campo não expansível em expand.
+        """
+        resp = self.client.get(reverse("evento-list"), {"fields": "id,senha"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", resp.json())
+
+        resp = self.client.get(reverse("pedido-list"), {"fields": "id", "expand": "usuario"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("expand", resp.json())
+
+    def test_pedidos_sem_itens_nao_buscam_itens(self):
+        """
+        fields=id,status: uma query só, sem a tabela de itens.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(reverse("pedido-list"), {"fields": "id,status"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(resp.json()[0]), {"id", "status"})
+        self.assertFalse(
+            any("core_pedidoitem" in q["sql"] for q in queries.captured_queries)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(
+                reverse("pedido-detail", args=[resp.json()[0]["id"]]), {"fields": "id,status"}
+            )
+        self.assertEqual(set(resp.json()), {"id", "status"})
+        self.assertFalse(
+            any("core_pedidoitem" in q["sql"] for q in queries.captured_queries)
+        )
+
+    def test_expand_inclui_itens(self):
+        """
+        expand=itens traz os itens junto com os campos pedidos.
+        """
+        resp = self.client.get(reverse("pedido-list"), {"fields": "id", "expand": "itens"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(resp.json()[0]), {"id", "itens"})
+        self.assertEqual(len(resp.json()[0]["itens"]), 1)
+
+    def test_colunas_dos_campos(self):
+        """
+        PK sempre incluída; aninhados fora; FK pelo nome do campo.
+        """
+        self.assertEqual(colunas_dos_campos(EventoSerializer, ("nome",)), ["id", "nome"])
+        self.assertEqual(
+            colunas_dos_campos(PedidoSerializer, ("usuario", "itens")), ["id", "usuario"]
+        )
+
+    def test_chaves_do_catalogo_por_campos(self):
+        """
+        A ordem dos campos não muda a chave; seleções diferentes, sim.
+        """
+        factory = APIRequestFactory()
+
+        def chaves(params):
+            request = Request(factory.get("/api/eventos/", params))
+            request.accepted_renderer = JSONRenderer()
+            return chave_catalogo(request), chave_lote(request, [1, 2])
+
+        self.assertEqual(chaves({"fields": "id,nome"}), chaves({"fields": "nome, id"}))
+        self.assertNotEqual(chaves({"fields": "id,nome"}), chaves({}))
+        self.assertNotEqual(chaves({"fields": "id"}), chaves({"fields": "id,nome"}))
@@ -0,0 +1,130 @@
+import gzip
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import compressao
+from core.compressao import escolhe_codificacao, variantes_comprimidas
+from core.models import Evento
+
+
+class EscolheCodificacaoTests(SimpleTestCase):
+    """
+    Testes da negociação do Accept-Encoding (core.compressao).
+
+    Cobre:
+    - preferência do servidor em empate, q maior vence, q=0 recusa
+    - curinga e cabeçalho ausente
+    - variantes só acima do tamanho mínimo, com gzip determinístico.
+    """
+
+    def test_negociacao(self):
+        """
+        gzip quando brotli não está disponível ou é recusado.
+        """
+        with mock.patch.object(compressao, "brotli", None):
+            self.assertEqual(escolhe_codificacao("gzip, deflate, br"), "gzip")
+            self.assertIsNone(escolhe_codificacao("gzip;q=0, br"))
+            self.assertEqual(escolhe_codificacao("*"), "gzip")
+            self.assertIsNone(escolhe_codificacao(""))
+            self.assertIsNone(escolhe_codificacao(None))
+            self.assertIsNone(escolhe_codificacao("identity"))
+
+    @skipUnless(compressao.brotli is not None, "brotli não instalado")
+    def test_negociacao_com_brotli(self):
+        """
+        br é a preferida em empate; q explícito decide.
+        """
+        self.assertEqual(escolhe_codificacao("gzip, br"), "br")
+        self.assertEqual(escolhe_codificacao("br;q=0.5, gzip"), "gzip")
+
+    @override_settings(COMPRESSAO_TAMANHO_MINIMO=100)
+    def test_variantes(self):
+        """
+        Corpo pequeno não tem variantes; o gzip é o mesmo a cada chamada.
+        """
+        self.assertIsNone(variantes_comprimidas(b"{}"))
+        corpo = b'{"nome": "Evento"}' * 20
+        variantes = variantes_comprimidas(corpo)
+        self.assertEqual(variantes["corpo"], corpo)
+        self.assertEqual(gzip.decompress(variantes["gzip"]), corpo)
+        self.assertEqual(variantes_comprimidas(corpo)["gzip"], variantes["gzip"])
+
+
+@override_settings(COMPRESSAO_TAMANHO_MINIMO=200)
+class CompressaoMiddlewareTests(APITestCase):
+    """
+    Testes do CompressaoMiddleware.
+
+    Cobre:
+    - listagem grande comprimida com gzip, Vary e ETag fraco
+    - sem Accept-Encoding ou abaixo do limite, sem compressão
+    - variantes do catálogo reaproveitadas do cache sem recomprimir
+    - revalidação com o ETag fraco responde 304.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.list_url = reverse("evento-list")
+        for i in range(10):
+            Evento.objects.create(
+                nome=f"Evento {i}",
+                local="Arena",
+                cidade="Recife",
+                data=date.today() + timedelta(days=i + 1),
+                descricao="Descrição do evento " * 10,
+                ingresso=Decimal("99.90"),
+                excursao=Decimal("0"),
+            )
+
+    def test_listagem_comprimida(self):
+        """
+        gzip negociado: corpo menor, mesmo JSON depois de descomprimir.
+        """
+        sem = self.client.get(self.list_url)
+        self.assertNotIn("Content-Encoding", sem)
+        self.assertIn("Accept-Encoding", sem["Vary"])
+
+        com = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(com.status_code, status.HTTP_200_OK)
+        self.assertEqual(com["Content-Encoding"], "gzip")
+        self.assertLess(len(com.content), len(sem.content))
+        self.assertEqual(int(com["Content-Length"]), len(com.content))
+        self.assertEqual(gzip.decompress(com.content), sem.content)
+        self.assertEqual(com["ETag"], "W/" + sem["ETag"])
+
+    def test_resposta_pequena_nao_comprimida(self):
+        """
+        Corpo abaixo de COMPRESSAO_TAMANHO_MINIMO sai como está.
+        """
+        resp = self.client.get(
+            self.list_url, {"fields": "id", "page_size": 1}, HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertNotIn("Content-Encoding", resp)
+        self.assertEqual(len(json.loads(resp.content)), 1)
+
+    def test_variantes_do_catalogo_reaproveitadas(self):
+        """
+        Na segunda request o corpo comprimido vem do cache.
+        """
+        self.client.get(self.list_url, HTTP_ACCEPT_ENCODING="gzip")
+        with mock.patch.object(compressao, "comprime", side_effect=AssertionError):
+            resp = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+
+    def test_revalidacao_com_etag_fraco(self):
+        """
+        If-None-Match com o ETag da resposta comprimida responde 304.
+        """
+        resp = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING="gzip")
+        revalida = self.client.get(
+            self.list_url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=resp["ETag"]
+        )
+        self.assertEqual(revalida.status_code, status.HTTP_304_NOT_MODIFIED)
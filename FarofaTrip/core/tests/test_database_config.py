@@ -0,0 +1,102 @@
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from FarofaTrip.database import database_config
+
+
+BASE_DIR = Path("/srv/farofatrip")
+
+
+class DatabaseConfigTests(SimpleTestCase):
+    """
+    Testes da configuração de banco por variáveis de ambiente
+    (FarofaTrip/database.py).
+
+    Cobre:
+    - perfil SQLite ajustado (padrão) e SQLite sem ajustes
+    - perfil PostgreSQL com conexões persistentes
+    - perfil PostgreSQL com pool do psycopg
+    - DB_ENGINE inválido.
+    """
+
+    def test_padrao_e_sqlite_ajustado(self):
+        """
+        Sem variáveis, usa db.sqlite3 com WAL, synchronous=NORMAL e BEGIN IMMEDIATE.
+        """
+        config = database_config(BASE_DIR, environ={})
+
+        self.assertEqual(config["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual(config["NAME"], BASE_DIR / "db.sqlite3")
+        self.assertEqual(config["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(config["OPTIONS"]["timeout"], 20)
+        pragmas = config["PRAGMAS"]
+        self.assertEqual(pragmas["journal_mode"], "WAL")
+        self.assertEqual(pragmas["synchronous"], "NORMAL")
+        self.assertEqual(pragmas["busy_timeout"], 20000)
+        self.assertIn("mmap_size", pragmas)
+
+    def test_sqlite_parametros_por_ambiente(self):
+        """
+        Caminho, busy timeout e mmap podem ser ajustados por variável.
+        """
+        config = database_config(
+            BASE_DIR,
+            environ={
+                "SQLITE_PATH": "/data/app.db",
+                "SQLITE_BUSY_TIMEOUT": "5",
+                "SQLITE_MMAP_SIZE": "0",
+            },
+        )
+        self.assertEqual(config["NAME"], "/data/app.db")
+        self.assertEqual(config["OPTIONS"]["timeout"], 5)
+        self.assertEqual(config["PRAGMAS"]["busy_timeout"], 5000)
+        self.assertEqual(config["PRAGMAS"]["mmap_size"], 0)
+
+    def test_sqlite_sem_ajustes(self):
+        """
+        SQLITE_TUNED=0 volta à configuração padrão do Django.
+        """
+        config = database_config(BASE_DIR, environ={"SQLITE_TUNED": "0"})
+        self.assertEqual(config["OPTIONS"], {})
+        self.assertNotIn("PRAGMAS", config)
+
+    def test_postgresql_com_conexoes_persistentes(self):
+        """
+        DB_ENGINE=postgresql usa CONN_MAX_AGE e health checks.
+        """
+        config = database_config(
+            BASE_DIR,
+            environ={
+                "DB_ENGINE": "postgresql",
+                "DB_NAME": "farofa",
+                "DB_HOST": "db",
+                "DB_CONN_MAX_AGE": "120",
+            },
+        )
+        self.assertEqual(config["ENGINE"], "django.db.backends.postgresql")
+        self.assertEqual(config["NAME"], "farofa")
+        self.assertEqual(config["HOST"], "db")
+        self.assertEqual(config["CONN_MAX_AGE"], 120)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+        self.assertNotIn("pool", config["OPTIONS"])
+
+    def test_postgresql_com_pool(self):
+        """
+        DB_POOL=1 ativa o pool do psycopg e desliga CONN_MAX_AGE.
+        """
+        config = database_config(
+            BASE_DIR,
+            environ={"DB_ENGINE": "postgres", "DB_POOL": "1", "DB_POOL_MAX_SIZE": "20"},
+        )
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(
+            config["OPTIONS"]["pool"], {"min_size": 2, "max_size": 20, "timeout": 10}
+        )
+
+    def test_engine_desconhecido(self):
+        """
+        Um DB_ENGINE inválido falha cedo, na carga do settings.
+        """
+        with self.assertRaises(ValueError):
+            database_config(BASE_DIR, environ={"DB_ENGINE": "mongodb"})
@@ -0,0 +1,133 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models import Evento
+
+
+class EventoBatchTests(APITestCase):
+    """
+    Testes da busca de eventos em lote (GET /eventos/batch/?ids=).
+
+    Cobre:
+    - vários eventos em uma única query
+    - eventos passados retornados para IDs explícitos
+    - IDs inexistentes em "nao_encontrados"
+    - cache por conjunto de IDs e invalidação por save
+    - validação do parâmetro ids (malformados em "nao_encontrados").
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("evento-batch")
+        hoje = date.today()
+        self.futuro = self._cria_evento("Festival Futuro", hoje + timedelta(days=5))
+        self.outro = self._cria_evento("Rave Futura", hoje + timedelta(days=9))
+        self.passado = self._cria_evento("Festival Passado", hoje - timedelta(days=5))
+
+    def _cria_evento(self, nome, data):
+        return Evento.objects.create(
+            nome=nome,
+            local="Local",
+            cidade="Cidade",
+            data=data,
+            descricao="Descrição",
+            ingresso=Decimal("80.00"),
+        )
+
+    def _ids(self, *ids):
+        return {"ids": ",".join(str(pk) for pk in ids)}
+
+    def test_retorna_varios_eventos_em_uma_query(self):
+        """
+        Todos os eventos pedidos vêm de uma única consulta id__in.
+        """
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.url, self._ids(self.outro.id, self.futuro.id))
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [e["id"] for e in resp.data["eventos"]],
+            sorted([self.futuro.id, self.outro.id]),
+        )
+        self.assertEqual(resp.data["nao_encontrados"], [])
+        self.assertEqual(resp.data["eventos"][0]["ingresso"], "80.00")
+
+    def test_ids_explicitos_ignoram_scope(self):
+        """
+        Eventos passados (fora do scope=future padrão) também são retornados.
+        """
+        resp = self.client.get(self.url, self._ids(self.passado.id))
+        self.assertEqual([e["nome"] for e in resp.data["eventos"]], ["Festival Passado"])
+
+    def test_ids_inexistentes_em_nao_encontrados(self):
+        """
+        IDs sem evento não geram 404: vêm listados separadamente.
+        """
+        resp = self.client.get(self.url, self._ids(self.futuro.id, 999999, 888888))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data["eventos"]), 1)
+        self.assertEqual(resp.data["nao_encontrados"], [888888, 999999])
+
+    def test_ids_repetidos_e_parametros_multiplos(self):
+        """
+        Aceita ?ids=1&ids=2 e ignora repetições.
+        """
+        resp = self.client.get(
+            f"{self.url}?ids={self.futuro.id},{self.futuro.id}&ids={self.outro.id}"
+        )
+        self.assertEqual(len(resp.data["eventos"]), 2)
+
+    def test_mesmo_conjunto_vem_do_cache(self):
+        """
+        O mesmo conjunto de IDs, em qualquer ordem, é servido do cache;
+        revalidação com ETag recebe 304.
+        """
+        primeira = self.client.get(self.url, self._ids(self.futuro.id, self.outro.id))
+        with self.assertNumQueries(0):
+            segunda = self.client.get(self.url, self._ids(self.outro.id, self.futuro.id))
+        self.assertEqual(segunda.data, primeira.data)
+        self.assertEqual(segunda["ETag"], primeira["ETag"])
+
+        revalida = self.client.get(
+            self.url,
+            self._ids(self.futuro.id, self.outro.id),
+            HTTP_IF_NONE_MATCH=primeira["ETag"],
+        )
+        self.assertEqual(revalida.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_save_de_evento_invalida_lote(self):
+        """
+        Alterar um evento (ex.: preço) invalida o cache do lote.
+        """
+        self.client.get(self.url, self._ids(self.futuro.id))
+        self.futuro.ingresso = Decimal("95.00")
+        self.futuro.save()
+
+        resp = self.client.get(self.url, self._ids(self.futuro.id))
+        self.assertEqual(resp.data["eventos"][0]["ingresso"], "95.00")
+
+    def test_ids_invalidos_retorna_400(self):
+        """
+        ids ausente, vazio ou em excesso → 400.
+        """
+        excesso = ",".join(str(i) for i in range(1, 102))
+        for params in ({}, {"ids": ""}, {"ids": excesso}):
+            with self.subTest(params=params):
+                resp = self.client.get(self.url, params)
+                self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("ids", resp.data)
+
+    def test_ids_malformados_em_nao_encontrados(self):
+        """
+        Um id malformado não derruba o lote: os válidos voltam e ele vai
+        para "nao_encontrados".
+        """
+        resp = self.client.get(self.url, {"ids": f"{self.futuro.id},abc,0,999999"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([e["id"] for e in resp.data["eventos"]], [self.futuro.id])
+        self.assertEqual(resp.data["nao_encontrados"], [999999, "abc", "0"])
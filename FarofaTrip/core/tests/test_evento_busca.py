@@ -0,0 +1,178 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.busca import TABELA_FTS, garante_indice_busca, termos_normalizados
+from core.models import Evento
+
+
+@skipUnless(connection.vendor == "sqlite", "Testes do índice FTS5 (SQLite).")
+class EventoBuscaFullTextTests(APITestCase):
+    """
+    Testes da busca full-text de eventos (?search=).
+
+    Cobre:
+    - uso do índice FTS5 em vez de LIKE '%termo%'
+    - busca sem acentos e por prefixo
+    - todos os termos obrigatórios
+    - ordenação por relevância (e ?ordering= explícito)
+    - sincronização do índice em update/delete e bulk_create
+    - reinstalação dos triggers após migrations.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.list_url = reverse("evento-list")
+        self.data = date.today() + timedelta(days=3)
+
+    def _cria_evento(self, nome, cidade="Campinas", local="Arena", descricao="Evento"):
+        return Evento.objects.create(
+            nome=nome,
+            local=local,
+            cidade=cidade,
+            data=self.data,
+            descricao=descricao,
+            ingresso=Decimal("10.00"),
+        )
+
+    def _busca(self, termo, **params):
+        resp = self.client.get(self.list_url, {"search": termo, **params})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return [e["nome"] for e in resp.data]
+
+    def test_busca_usa_fts_sem_like(self):
+        """
+        A busca consulta a tabela FTS5, sem LIKE nos campos do evento.
+        """
+        self._cria_evento("Festival de Rock")
+        with CaptureQueriesContext(connection) as ctx:
+            nomes = self._busca("rock")
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertEqual(nomes, ["Festival de Rock"])
+        self.assertIn(TABELA_FTS, sql)
+        self.assertNotIn("LIKE", sql.upper())
+
+    def test_busca_ignora_acentos(self):
+        """
+        'sao paulo' encontra 'São Paulo' e 'Ação' encontra 'acao'.
+        """
+        self._cria_evento("Trance na Capital", cidade="São Paulo")
+        self._cria_evento("Festival Acao Social", cidade="Campinas")
+        self.assertEqual(self._busca("sao paulo"), ["Trance na Capital"])
+        self.assertEqual(self._busca("Ação"), ["Festival Acao Social"])
+
+    def test_busca_por_prefixo(self):
+        """
+        Termos parciais encontram palavras que começam com eles.
+        """
+        self._cria_evento("Festival Psicodélico")
+        self.assertEqual(self._busca("psico"), ["Festival Psicodélico"])
+
+    def test_todos_os_termos_sao_obrigatorios(self):
+        """
+        Cada termo deve aparecer em algum campo (como no SearchFilter).
+        """
+        self._cria_evento("Festival de Rock", cidade="Campinas")
+        self._cria_evento("Festival de Jazz", cidade="Santos")
+        self.assertEqual(self._busca("festival santos"), ["Festival de Jazz"])
+
+    def test_resultados_ordenados_por_relevancia(self):
+        """
+        Sem ?ordering=, o evento mais relevante vem primeiro.
+        """
+        self._cria_evento("Encontro", descricao="Tem um pouco de trance")
+        self._cria_evento("Trance Trance Trance", descricao="Trance a noite toda")
+        self.assertEqual(self._busca("trance")[0], "Trance Trance Trance")
+
+    def test_ordering_explicito_prevalece(self):
+        """
+        Com ?ordering=nome, a ordem alfabética prevalece sobre a relevância.
+        """
+        self._cria_evento("B Trance", descricao="trance trance")
+        self._cria_evento("A Trance")
+        self.assertEqual(self._busca("trance", ordering="nome"), ["A Trance", "B Trance"])
+
+    def test_indice_acompanha_update_e_delete(self):
+        """
+        Os triggers mantêm o índice em dia após update e delete.
+        """
+        evento = self._cria_evento("Festival Antigo")
+        evento.nome = "Festival Novo"
+        evento.save()
+        self.assertEqual(self._busca("antigo"), [])
+        self.assertEqual(self._busca("novo"), ["Festival Novo"])
+
+        evento.delete()
+        self.assertEqual(self._busca("novo"), [])
+
+    def test_indice_acompanha_bulk_create(self):
+        """
+        Inserções em massa (sem signals) também são indexadas.
+        """
+        Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Mandala {i}",
+                    local="Sítio",
+                    cidade="Atibaia",
+                    data=self.data,
+                    descricao="Evento",
+                    ingresso=Decimal("10.00"),
+                )
+                for i in range(3)
+            ]
+        )
+        self.assertEqual(len(self._busca("mandala atibaia")), 3)
+
+    def test_paginacao_por_relevancia(self):
+        """
+        O cursor funciona com a ordenação por relevância.
+        """
+        for i in range(5):
+            self._cria_evento(f"Rave {i}", descricao="rave " * (i + 1))
+        primeira = self.client.get(self.list_url, {"search": "rave", "page_size": 2})
+        nomes = [e["nome"] for e in primeira.data]
+        link = primeira["Link"].split(";")[0].strip("<>")
+        while link:
+            resp = self.client.get(link)
+            nomes.extend(e["nome"] for e in resp.data)
+            link = resp.get("Link", "").split(";")[0].strip("<>") or None
+        self.assertEqual(sorted(nomes), [f"Rave {i}" for i in range(5)])
+        self.assertEqual(len(nomes), 5)
+
+    def test_termo_sem_palavras_usa_busca_padrao(self):
+        """
+        Termos só com pontuação caem no SearchFilter padrão, sem erro.
+        """
+        self._cria_evento("Festival")
+        self.assertEqual(self._busca("!!!"), [])
+
+    def test_garante_indice_reinstala_triggers(self):
+        """
+        Se os triggers sumirem (tabela recriada por migration), o
+        post_migrate os reinstala e reconstrói o índice.
+        """
+        self._cria_evento("Festival Perdido")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TRIGGER {TABELA_FTS}_ai")
+
+        garante_indice_busca()
+
+        self._cria_evento("Festival Reencontrado")
+        self.assertEqual(len(self._busca("festival")), 2)
+
+    def test_termos_normalizados(self):
+        """
+        Operadores e aspas não chegam à consulta FTS.
+        """
+        self.assertEqual(
+            termos_normalizados(['"rock"', "AND", "são-paulo*"]),
+            ["rock", "AND", "são", "paulo"],
+        )
@@ -0,0 +1,154 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.catalogo import normaliza_parametros
+from core.models import Evento
+
+
+class CatalogoCacheTests(APITestCase):
+    """
+    Testes do cache versionado da listagem de eventos.
+
+    Cobre:
+    - respostas repetidas servidas do cache (sem queries)
+    - invalidação por save/delete de Evento
+    - invalidação na virada do dia
+    - normalização dos parâmetros
+    - revalidação com ETag / Last-Modified (304).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.list_url = reverse("evento-list")
+        self.evento = self._cria_evento("Festival Futuro", date.today() + timedelta(days=2))
+
+    def _cria_evento(self, nome, data):
+        return Evento.objects.create(
+            nome=nome,
+            local="Local",
+            cidade="Cidade",
+            data=data,
+            descricao="Descrição",
+            ingresso=Decimal("50.00"),
+        )
+
+    def test_segunda_listagem_vem_do_cache(self):
+        """
+        A segunda request idêntica não deve executar nenhuma query.
+        """
+        primeira = self.client.get(self.list_url)
+        self.assertEqual(primeira.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(0):
+            segunda = self.client.get(self.list_url)
+
+        self.assertEqual(segunda.status_code, status.HTTP_200_OK)
+        self.assertEqual(segunda.data, primeira.data)
+        self.assertEqual(segunda["ETag"], primeira["ETag"])
+
+    def test_save_de_evento_invalida_cache(self):
+        """
+        Criar/editar um evento muda a versão do catálogo e a resposta.
+        """
+        antes = self.client.get(self.list_url)
+
+        novo = self._cria_evento("Outro Festival", date.today() + timedelta(days=5))
+        depois = self.client.get(self.list_url)
+        self.assertNotEqual(antes["ETag"], depois["ETag"])
+        self.assertIn(novo.nome, {e["nome"] for e in depois.data})
+
+        novo.nome = "Festival Renomeado"
+        novo.save()
+        editado = self.client.get(self.list_url)
+        self.assertIn("Festival Renomeado", {e["nome"] for e in editado.data})
+
+    def test_delete_de_evento_invalida_cache(self):
+        """
+        Excluir um evento remove-o da listagem em cache.
+        """
+        self.client.get(self.list_url)
+        self.evento.delete()
+
+        resp = self.client.get(self.list_url)
+        self.assertEqual(resp.data, [])
+
+    def test_virada_do_dia_invalida_cache(self):
+        """
+        Na virada do dia, evento de 'hoje' sai do escopo future.
+        """
+        hoje = date.today()
+        self._cria_evento("Evento Hoje", hoje)
+        resp = self.client.get(self.list_url)
+        self.assertIn("Evento Hoje", {e["nome"] for e in resp.data})
+
+        amanha = hoje + timedelta(days=1)
+        with mock.patch("core.catalogo.timezone.localdate", return_value=amanha), \
+                mock.patch("core.views.localdate", return_value=amanha):
+            resp = self.client.get(self.list_url)
+
+        self.assertNotIn("Evento Hoje", {e["nome"] for e in resp.data})
+
+    def test_parametros_normalizados_compartilham_cache(self):
+        """
+        Variações irrelevantes (maiúsculas, espaços) usam a mesma entrada.
+        """
+        self.client.get(self.list_url, {"scope": "FUTURE", "search": "  Festival "})
+        with self.assertNumQueries(0):
+            resp = self.client.get(self.list_url, {"search": "festival"})
+        self.assertEqual(len(resp.data), 1)
+
+        self.assertEqual(
+            normaliza_parametros({"scope": " Past ", "ordering": "-data"}),
+            {
+                "scope": "past",
+                "search": "",
+                "ordering": "-data",
+                "cursor": "",
+                "page_size": "",
+                "count": "",
+            },
+        )
+
+    def test_parametros_diferentes_nao_compartilham_cache(self):
+        """
+        Buscas diferentes geram entradas diferentes.
+        """
+        com_resultado = self.client.get(self.list_url, {"search": "festival"})
+        sem_resultado = self.client.get(self.list_url, {"search": "inexistente"})
+        self.assertEqual(len(com_resultado.data), 1)
+        self.assertEqual(sem_resultado.data, [])
+        self.assertNotEqual(com_resultado["ETag"], sem_resultado["ETag"])
+
+    def test_if_none_match_retorna_304(self):
+        """
+        Revalidação com a ETag atual recebe 304 sem corpo.
+        """
+        resp = self.client.get(self.list_url)
+        self.assertIn("Last-Modified", resp)
+        self.assertIn("no-cache", resp["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            revalida = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=resp["ETag"])
+        self.assertEqual(revalida.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(revalida.content, b"")
+
+        # Após uma alteração, a ETag antiga não vale mais
+        self._cria_evento("Novo", date.today() + timedelta(days=1))
+        revalida = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=resp["ETag"])
+        self.assertEqual(revalida.status_code, status.HTTP_200_OK)
+
+    def test_if_modified_since_retorna_304(self):
+        """
+        Revalidação com Last-Modified recebe 304 enquanto nada mudar.
+        """
+        resp = self.client.get(self.list_url)
+        revalida = self.client.get(
+            self.list_url, HTTP_IF_MODIFIED_SINCE=resp["Last-Modified"]
+        )
+        self.assertEqual(revalida.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,160 @@
+import multiprocessing
+import tempfile
+from io import StringIO
+from unittest import skipIf
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher,
+    check_password,
+    identify_hasher,
+    make_password,
+)
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import hashing
+from core.hashing import PBKDF2LimitadoPasswordHasher, VagasEntreProcessos, executor_hash
+
+
+User = get_user_model()
+
+
+def _segura_vaga(diretorio, pronto, libera):
+    vagas = VagasEntreProcessos(diretorio, 1)
+    vagas.acquire(blocking=False)
+    pronto.set()
+    libera.wait(10)
+    vagas.release()
+
+
+@override_settings(HASHING_LOCK_DIR=tempfile.mkdtemp(prefix="farofatrip-hash-test-"))
+class HashingLimitadoTests(APITestCase):
+    """
+    Testes do hash de senhas no pool limitado (core.hashing).
+
+    Cobre:
+    - compatibilidade com hashes pbkdf2_sha256 existentes
+    - 503 com Retry-After quando o pool está cheio (registro, login da
+      API e login do admin)
+    - vagas compartilhadas entre processos
+    - iterações configuráveis por settings.
+    """
+
+    def test_hash_compativel_com_pbkdf2_do_django(self):
+        """
+        Senhas gravadas pelo hasher padrão continuam válidas, e vice-versa.
+        """
+        antigo = PBKDF2PasswordHasher().encode("Senha@123", "salt1234")
+        self.assertTrue(check_password("Senha@123", antigo))
+
+        novo = make_password("Senha@123")
+        self.assertIsInstance(identify_hasher(novo), PBKDF2LimitadoPasswordHasher)
+        self.assertTrue(PBKDF2PasswordHasher().verify("Senha@123", novo))
+
+    @override_settings(HASHING_WORKERS=1, HASHING_MAX_PENDENTES=1, HASHING_RETRY_AFTER=3)
+    def test_pool_cheio_responde_503_com_retry_after(self):
+        """
+        Sem vaga no pool, registro e login falham na hora com 503.
+        """
+        User.objects.create_user(username="cliente", password="StrongPass123!")
+        executor = executor_hash()
+        self.assertTrue(executor.vagas.acquire(blocking=False))
+        try:
+            registro = self.client.post(
+                reverse("api_register"),
+                {
+                    "username": "novo",
+                    "email": "novo@example.com",
+                    "password": "StrongPass123!",
+                    "nome": "Novo Cliente",
+                    "cpf": "12345678901",
+                },
+                format="json",
+            )
+            login = self.client.post(
+                reverse("api_login"),
+                {"username": "cliente", "password": "StrongPass123!"},
+                format="json",
+            )
+        finally:
+            executor.vagas.release()
+
+        for resp in (registro, login):
+            self.assertEqual(resp.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            self.assertEqual(resp["Retry-After"], "3")
+        self.assertFalse(User.objects.filter(username="novo").exists())
+
+        # Com a vaga liberada, o login volta a funcionar
+        login = self.client.post(
+            reverse("api_login"),
+            {"username": "cliente", "password": "StrongPass123!"},
+            format="json",
+        )
+        self.assertEqual(login.status_code, status.HTTP_200_OK)
+
+    @override_settings(HASHING_WORKERS=1, HASHING_MAX_PENDENTES=1, HASHING_RETRY_AFTER=2)
+    def test_login_do_admin_com_pool_cheio_responde_503(self):
+        """
+        Fora do DRF o HashingOcupado vira 503 (HashingOcupadoMiddleware), não 500.
+        """
+        User.objects.create_superuser("admin", "admin@example.com", "StrongPass123!")
+        executor = executor_hash()
+        self.assertTrue(executor.vagas.acquire(blocking=False))
+        try:
+            resp = self.client.post(
+                "/admin/login/", {"username": "admin", "password": "StrongPass123!"}
+            )
+        finally:
+            executor.vagas.release()
+        self.assertEqual(resp.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(resp["Retry-After"], "2")
+
+    @skipIf(hashing.fcntl is None, "sem fcntl: limite por processo")
+    @override_settings(HASHING_WORKERS=1, HASHING_MAX_PENDENTES=1)
+    def test_vaga_ocupada_por_outro_processo(self):
+        """
+        Uma vaga presa por outro processo (outro worker do gunicorn) conta
+        no limite deste.
+        """
+        contexto = multiprocessing.get_context("fork")
+        pronto, libera = contexto.Event(), contexto.Event()
+        diretorio = tempfile.mkdtemp(prefix="farofatrip-hash-test-")
+        processo = contexto.Process(target=_segura_vaga, args=(diretorio, pronto, libera))
+        processo.start()
+        try:
+            self.assertTrue(pronto.wait(10))
+            vagas = VagasEntreProcessos(diretorio, 1)
+            self.assertFalse(vagas.acquire(blocking=False))
+        finally:
+            libera.set()
+            processo.join(10)
+        self.assertTrue(vagas.acquire(blocking=False))
+        vagas.release()
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=120_000)
+    def test_iteracoes_configuraveis(self):
+        """
+        PASSWORD_HASH_ITERATIONS define as iterações dos novos hashes.
+        """
+        self.assertTrue(make_password("Senha@123").startswith("pbkdf2_sha256$120000$"))
+
+
+class CalibrarHashCommandTests(SimpleTestCase):
+    """
+    Testes do comando calibrar_hash.
+    """
+
+    def test_sugere_iteracoes_para_o_alvo(self):
+        """
+        Nunca sugere menos iterações que o padrão do Django, mesmo com
+        --minimo menor.
+        """
+        saida = StringIO()
+        call_command("calibrar_hash", "--alvo-ms", "5", "--amostras", "1", "--minimo", "10000", stdout=saida)
+        self.assertIn("PASSWORD_HASH_ITERATIONS = ", saida.getvalue())
+        iteracoes = int(saida.getvalue().rsplit("= ", 1)[1])
+        self.assertGreaterEqual(iteracoes, PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from core.models import Evento, Pedido, usuarios_por_email
+
+
+User = get_user_model()
+
+
+class IndicesConsultasTests(TestCase):
+    """
+    Roda EXPLAIN nas consultas mais frequentes e verifica que o
+    plano usa o índice criado para cada uma:
+
+    - catálogo: Evento por data, ordenado por (data, id)
+    - histórico: Pedido do usuário, ordenado por (criado_em, id) DESC
+    - login/registro: usuário por LOWER(email).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cliente", email="Cliente@Example.com", password="StrongPass123!"
+        )
+
+    def assertUsaIndice(self, queryset, indice):
+        plano = queryset.explain()
+        if connection.vendor == "sqlite":
+            self.assertIn(f"USING INDEX {indice}", plano)
+        elif connection.vendor == "postgresql":
+            self.assertIn(indice, plano)
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plano)
+
+    def test_catalogo_usa_indice_data_id(self):
+        """
+        Evento futuro ordenado por (data, id) usa core_evento_data_id_idx.
+        """
+        qs = Evento.objects.filter(data__gte=date.today()).order_by("data", "id")
+        self.assertUsaIndice(qs, "core_evento_data_id_idx")
+
+    def test_pagina_seguinte_do_catalogo_usa_indice(self):
+        """
+        A condição keyset da paginação também é atendida pelo índice.
+        """
+        hoje = date.today()
+        qs = (
+            Evento.objects.filter(data__gte=hoje)
+            .filter(data__gt=hoje + timedelta(days=1))
+            .order_by("data", "id")
+        )
+        self.assertUsaIndice(qs, "core_evento_data_id_idx")
+
+    def test_historico_de_pedidos_usa_indice_usuario_criado(self):
+        """
+        Pedidos do usuário, mais recentes primeiro, sem ordenação em memória.
+        """
+        qs = Pedido.objects.filter(usuario=self.user).order_by("-criado_em", "-id")
+        self.assertUsaIndice(qs, "core_pedido_usuario_criado_idx")
+
+    def test_busca_por_email_usa_indice_funcional(self):
+        """
+        usuarios_por_email usa o índice único em LOWER(email).
+        """
+        self.assertUsaIndice(
+            usuarios_por_email("cliente@example.com"), "core_user_email_lower_uniq"
+        )
+
+    def test_busca_por_email_ignora_maiusculas(self):
+        """
+        O resultado continua igual ao de email__iexact.
+        """
+        self.assertEqual(usuarios_por_email("  CLIENTE@example.COM ").get(), self.user)
+        self.assertFalse(usuarios_por_email("outro@example.com").exists())
@@ -0,0 +1,132 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from core.leitura import LeituraCompilada
+from core.models import Evento, Pedido, PedidoItem
+from core.serializers import EventoSerializer, PedidoSerializer
+
+
+User = get_user_model()
+
+
+class LeituraCompiladaTests(APITestCase):
+    """
+    Testes da leitura compilada das listagens (core.leitura).
+
+    Cobre:
+    - saída idêntica ao EventoSerializer (imagem com URL absoluta, Decimal)
+    - saída idêntica ao PedidoSerializer com itens aninhados e nulos
+    - listagens da API iguais ao serializer, com paginação por cursor
+    - campos não suportados falham na compilação.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cliente", password="StrongPass123!")
+        hoje = date.today()
+        self.eventos = [
+            Evento.objects.create(
+                nome=f"Evento {i}",
+                local="Arena",
+                cidade="São Paulo",
+                data=hoje + timedelta(days=i + 1),
+                descricao="Descrição",
+                imagem="eventos/banner.jpg" if i % 2 else None,
+                ingresso=Decimal("149.90"),
+                excursao=Decimal("0"),
+            )
+            for i in range(5)
+        ]
+        self.pedidos = []
+        for i in range(3):
+            pedido = Pedido.objects.create(
+                usuario=self.user,
+                valor_total=Decimal("199.80"),
+                forma_pagamento="pix" if i else None,
+                observacoes="Entrega rápida" if i == 1 else None,
+            )
+            for evento in self.eventos[: i + 1]:
+                PedidoItem.objects.create(
+                    pedido=pedido,
+                    evento=evento,
+                    quantidade=2,
+                    preco_ingresso=evento.ingresso,
+                    preco_excursao=Decimal("10.00"),
+                )
+            self.pedidos.append(pedido)
+        Pedido.objects.create(usuario=None, valor_total=Decimal("0"))
+
+    def contexto(self):
+        request = APIRequestFactory().get("/api/eventos/", HTTP_HOST="testserver")
+        return {"request": request}
+
+    def test_eventos_identicos_ao_serializer(self):
+        """
+        Mesma lista de dicts, com imagem nula ou URL absoluta.
+        """
+        leitura = LeituraCompilada(EventoSerializer)
+        contexto = self.contexto()
+        esperado = EventoSerializer(Evento.objects.order_by("id"), many=True, context=contexto).data
+        obtido = leitura.representa(leitura.consulta(Evento.objects.order_by("id")), contexto)
+        self.assertEqual(obtido, esperado)
+        self.assertEqual(obtido[1]["imagem"], "http://testserver/media/eventos/banner.jpg")
+        self.assertIsNone(obtido[0]["imagem"])
+
+    def test_pedidos_identicos_ao_serializer(self):
+        """
+        Pedidos com itens aninhados (nome do evento via join) em duas queries.
+        """
+        leitura = LeituraCompilada(PedidoSerializer)
+        qs = Pedido.objects.order_by("id")
+        esperado = PedidoSerializer(
+            qs.prefetch_related("itens__evento"), many=True, context=self.contexto()
+        ).data
+        with self.assertNumQueries(2):
+            obtido = leitura.representa(leitura.consulta(qs), self.contexto())
+        self.assertEqual(obtido, esperado)
+        self.assertEqual(len(obtido[2]["itens"]), 3)
+        self.assertEqual(obtido[3]["itens"], [])
+
+    def test_listagens_da_api_iguais_ao_serializer(self):
+        """
+        /eventos/ e /pedidos/ (com cursor) devolvem o mesmo que o serializer.
+        """
+        resp = self.client.get(reverse("evento-list"), {"page_size": 2})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        request = resp.wsgi_request
+        esperado = EventoSerializer(self.eventos[:2], many=True, context={"request": request}).data
+        self.assertEqual(resp.json(), esperado)
+
+        proxima = resp["Link"].split(";")[0].strip("<>")
+        resp = self.client.get(proxima)
+        self.assertEqual([e["id"] for e in resp.json()], [e.id for e in self.eventos[2:4]])
+
+        self.client.force_authenticate(self.user)
+        resp = self.client.get(reverse("pedido-list"))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        pedidos = Pedido.objects.filter(usuario=self.user).order_by("-criado_em", "-id")
+        self.assertEqual(resp.json(), PedidoSerializer(pedidos, many=True).data)
+
+    def test_campo_nao_suportado_falha_na_compilacao(self):
+        """
+        SerializerMethodField não tem projeção: a leitura recusa o serializer.
+        """
+        class ComMetodo(serializers.ModelSerializer):
+            resumo = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Evento
+                fields = ["id", "resumo"]
+
+            def get_resumo(self, obj):
+                return obj.nome
+
+        with self.assertRaises(ImproperlyConfigured):
+            LeituraCompilada(ComMetodo).consulta(Evento.objects.all())
@@ -1,3 +1,4 @@
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from core.forms import LoginForm
@@ -14,7 +15,7 @@ class LoginFormTests(TestCase):
     - autenticação bem-sucedida
     - e-mails não institucionais
     - case-insensitive no e-mail
-    - erros para e-mail duplicado, inexistente, senha errada
+    - e-mail único no banco; erros para e-mail inexistente e senha errada
     - mensagens de erro em campos obrigatórios.
     """
 
@@ -74,21 +75,17 @@ class LoginFormTests(TestCase):
         self.assertTrue(form.is_valid(), form.errors.as_json())
         self.assertEqual(form.user.pk, u.pk)
 
-    def test_duplicate_email_generates_form_error(self):
+    def test_duplicate_email_is_rejected_by_database(self):
         """
-        Se existirem múltiplos usuários com o mesmo e-mail,
-        o formulário deve acusar erro de ambiguidade.
+        O e-mail é único (ignorando maiúsculas), então o login nunca
+        encontra dois usuários: o segundo cadastro falha no banco.
         """
-        email_dup = "dup@exemplo.com"
-        User.objects.create_user(username="dup1", email=email_dup, password="Senha@123")
-        User.objects.create_user(username="dup2", email=email_dup, password="Senha@123")
-        form = LoginForm(data={"email": email_dup, "password": "Senha@123"})
+        User.objects.create_user(username="dup1", email="dup@exemplo.com", password="Senha@123")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(username="dup2", email="DUP@exemplo.com", password="Senha@123")
 
-        self.assertFalse(form.is_valid())
-        self.assertIn(
-            "Há mais de um usuário com este e-mail",
-            " ".join(form.non_field_errors())
-        )
+        form = LoginForm(data={"email": "dup@exemplo.com", "password": "Senha@123"})
+        self.assertTrue(form.is_valid(), form.errors.as_json())
 
     def test_unknown_email_generates_form_error(self):
         """
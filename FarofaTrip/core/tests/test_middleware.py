@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase
+from django.urls import reverse
+from rest_framework import status
+
+
+User = get_user_model()
+
+
+class ForaDaApiMiddlewareTests(TestCase):
+    """
+    Testes da cadeia de middleware por prefixo (core.middleware).
+
+    Cobre:
+    - /api/ sem sessão, autenticação de sessão nem X-Frame-Options
+    - /admin/ com a cadeia completa: X-Frame-Options, sessão e CSRF
+      validado em process_view
+    - admin fora de /api/ (lá não há sessão nem request.user)
+    - preflight CORS com Access-Control-Max-Age de 2 h.
+    """
+
+    def test_api_com_cadeia_enxuta(self):
+        """
+        A request da API não ganha request.session nem request.user do Django.
+        """
+        resp = self.client.get(reverse("evento-list"))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Frame-Options", resp)
+        self.assertFalse(hasattr(resp.wsgi_request, "session"))
+        self.assertNotIn("sessionid", resp.cookies)
+
+    def test_admin_com_cadeia_completa(self):
+        """
+        Admin autenticado por sessão, com X-Frame-Options.
+        """
+        admin = User.objects.create_superuser("admin", "admin@example.com", "StrongPass123!")
+        self.client.force_login(admin)
+        resp = self.client.get("/admin/")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp["X-Frame-Options"], "DENY")
+        self.assertEqual(resp.wsgi_request.user, admin)
+
+    def test_admin_valida_csrf(self):
+        """
+        POST no login do admin sem token CSRF é recusado.
+        """
+        client = Client(enforce_csrf_checks=True)
+        resp = client.post("/admin/login/", {"username": "x", "password": "y"})
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+        client.get("/admin/login/")
+        token = client.cookies["csrftoken"].value
+        resp = client.post(
+            "/admin/login/", {"username": "x", "password": "y", "csrfmiddlewaretoken": token}
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_admin_nao_servido_na_api(self):
+        """
+        /api/admin/ não existe: o admin só é servido em /admin/, com a
+        cadeia completa (antes, /api/admin/login/ respondia 500).
+        """
+        resp = self.client.get("/api/admin/login/")
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get("/admin/login/").status_code, status.HTTP_200_OK)
+
+    def test_preflight_cors_com_max_age(self):
+        """
+        O navegador pode guardar o preflight por 2 h.
+        """
+        resp = self.client.options(
+            reverse("evento-list"),
+            HTTP_ORIGIN="http://localhost:5500",
+            HTTP_ACCESS_CONTROL_REQUEST_METHOD="GET",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp["Access-Control-Max-Age"], "7200")
+        self.assertEqual(resp["Access-Control-Allow-Origin"], "http://localhost:5500")
@@ -0,0 +1,284 @@
+import json
+import threading
+from io import StringIO
+from datetime import date, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from core.models import Evento, NotificacaoWhatsApp, Pedido
+from core.notificacoes import calcula_backoff, processa_fila
+from core.serializers import PedidoSerializer
+
+
+User = get_user_model()
+
+
+class StubGraphAPI:
+    """
+    Servidor HTTP local que simula a Graph API do WhatsApp.
+
+    - respostas: lista de status HTTP devolvidos em ordem
+      (quando acaba, responde sempre 200).
+    - recebidas: lista de (path, headers, corpo JSON) recebidos.
+    """
+
+    def __init__(self):
+        self.respostas = []
+        self.recebidas = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                tamanho = int(self.headers.get("Content-Length") or 0)
+                corpo = json.loads(self.rfile.read(tamanho) or b"{}")
+                with stub._lock:
+                    stub.recebidas.append((self.path, dict(self.headers), corpo))
+                    codigo = stub.respostas.pop(0) if stub.respostas else 200
+                self.send_response(codigo)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(b'{"messages": [{"id": "wamid.teste"}]}')
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class NotificacaoOutboxTests(TestCase):
+    """
+    Testes da fila de notificações de WhatsApp:
+    - enfileiramento na mesma transação do pedido
+    - envio via worker (servidor HTTP local no lugar da Graph API)
+    - retry com backoff e dead letter.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.stub = StubGraphAPI()
+        cls.stub.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stub.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.stub.respostas.clear()
+        self.stub.recebidas.clear()
+
+        settings_ctx = override_settings(
+            WHATSAPP_TOKEN="token-teste",
+            WHATSAPP_PHONE_ID="123",
+            WHATSAPP_TARGET="+5511999999999",
+            WHATSAPP_API_URL=self.stub.url,
+            WHATSAPP_MAX_TENTATIVAS=3,
+            WHATSAPP_TIMEOUT=5,
+        )
+        settings_ctx.enable()
+        self.addCleanup(settings_ctx.disable)
+
+        self.user = User.objects.create_user(
+            username="cliente",
+            email="cliente@example.com",
+            password="StrongPass123!",
+            first_name="Cliente",
+        )
+        self.evento = Evento.objects.create(
+            nome="Festival",
+            local="Local",
+            cidade="Cidade",
+            data=date.today() + timedelta(days=5),
+            descricao="Descrição",
+            ingresso=Decimal("100.00"),
+            excursao=Decimal("20.00"),
+        )
+
+    def _cria_pedido(self, **extra):
+        request = APIRequestFactory().post("/api/pedidos/")
+        request.user = self.user
+        serializer = PedidoSerializer(
+            data={"itens": [{"evento_id": self.evento.id, "quantidade": 2}], **extra},
+            context={"request": request},
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer.save()
+
+    def test_criar_pedido_enfileira_sem_chamar_api(self):
+        """
+        Criar o pedido só grava a notificação; nenhuma chamada HTTP é feita.
+        """
+        pedido = self._cria_pedido()
+
+        notificacao = NotificacaoWhatsApp.objects.get(pedido=pedido)
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_PENDENTE)
+        self.assertEqual(notificacao.destino, "+5511999999999")
+        self.assertEqual(self.stub.recebidas, [])
+
+    def test_sem_configuracao_nao_enfileira(self):
+        """
+        Sem token/phone_id, o pedido é criado sem notificação.
+        """
+        with override_settings(WHATSAPP_TOKEN=None):
+            pedido = self._cria_pedido()
+        self.assertFalse(NotificacaoWhatsApp.objects.filter(pedido=pedido).exists())
+
+    def test_falha_no_pedido_desfaz_notificacao(self):
+        """
+        Se a transação do pedido falhar, a notificação não fica na fila.
+        """
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self._cria_pedido()
+                raise RuntimeError("falha simulada")
+
+        self.assertEqual(Pedido.objects.count(), 0)
+        self.assertEqual(NotificacaoWhatsApp.objects.count(), 0)
+
+    def test_worker_envia_mensagem(self):
+        """
+        O worker envia a mensagem para a API e marca como 'enviado'.
+        """
+        pedido = self._cria_pedido()
+
+        total = processa_fila(workers=2)
+
+        self.assertEqual(total["enviadas"], 1)
+        notificacao = NotificacaoWhatsApp.objects.get(pedido=pedido)
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_ENVIADO)
+        self.assertIsNotNone(notificacao.enviado_em)
+        self.assertIn(f"#{pedido.id}", notificacao.corpo)
+
+        path, headers, corpo = self.stub.recebidas[0]
+        self.assertEqual(path, "/123/messages")
+        self.assertEqual(headers["Authorization"], "Bearer token-teste")
+        self.assertEqual(corpo["to"], "5511999999999")
+        self.assertEqual(corpo["text"]["body"], notificacao.corpo)
+
+    def test_erro_temporario_reagenda_com_backoff(self):
+        """
+        Erro 500 reagenda a mensagem para o futuro e não reenvia antes disso.
+        """
+        pedido = self._cria_pedido()
+        self.stub.respostas.extend([500])
+
+        total = processa_fila(workers=1)
+
+        self.assertEqual(total["reagendadas"], 1)
+        notificacao = NotificacaoWhatsApp.objects.get(pedido=pedido)
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_PENDENTE)
+        self.assertEqual(notificacao.tentativas, 1)
+        self.assertGreater(notificacao.proxima_tentativa_em, timezone.now())
+        self.assertIn("500", notificacao.ultimo_erro)
+
+        # Ainda não venceu: nada é enviado
+        processa_fila(workers=1)
+        self.assertEqual(len(self.stub.recebidas), 1)
+
+        # Venceu: reenvia o mesmo texto e conclui
+        NotificacaoWhatsApp.objects.filter(pk=notificacao.pk).update(
+            proxima_tentativa_em=timezone.now()
+        )
+        processa_fila(workers=1)
+        notificacao.refresh_from_db()
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_ENVIADO)
+        self.assertEqual(notificacao.tentativas, 2)
+        self.assertEqual(
+            self.stub.recebidas[0][2]["text"]["body"],
+            self.stub.recebidas[1][2]["text"]["body"],
+        )
+
+    def test_esgotar_tentativas_vai_para_dead_letter(self):
+        """
+        Após WHATSAPP_MAX_TENTATIVAS erros, o status vira 'falhou'.
+        """
+        pedido = self._cria_pedido()
+        self.stub.respostas.extend([503, 503, 503])
+
+        with self.assertLogs("core.notificacoes", level="ERROR"):
+            for _ in range(3):
+                NotificacaoWhatsApp.objects.update(proxima_tentativa_em=timezone.now())
+                processa_fila(workers=1)
+
+        notificacao = NotificacaoWhatsApp.objects.get(pedido=pedido)
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_FALHOU)
+        self.assertEqual(notificacao.tentativas, 3)
+
+    def test_erro_permanente_vai_direto_para_dead_letter(self):
+        """
+        Erro 400 (ex.: número inválido) não é repetido.
+        """
+        pedido = self._cria_pedido()
+        self.stub.respostas.extend([400])
+
+        with self.assertLogs("core.notificacoes", level="ERROR"):
+            total = processa_fila(workers=1)
+
+        self.assertEqual(total["falhas"], 1)
+        notificacao = NotificacaoWhatsApp.objects.get(pedido=pedido)
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_FALHOU)
+        self.assertEqual(notificacao.tentativas, 1)
+
+    def test_reserva_expirada_volta_para_fila(self):
+        """
+        Mensagem presa em 'enviando' (worker morreu) é reprocessada.
+        """
+        pedido = self._cria_pedido()
+        NotificacaoWhatsApp.objects.filter(pedido=pedido).update(
+            status=NotificacaoWhatsApp.STATUS_ENVIANDO,
+            bloqueado_em=timezone.now() - timedelta(hours=1),
+        )
+
+        processa_fila(workers=1)
+
+        notificacao = NotificacaoWhatsApp.objects.get(pedido=pedido)
+        self.assertEqual(notificacao.status, NotificacaoWhatsApp.STATUS_ENVIADO)
+
+    def test_comando_processa_varios_pedidos(self):
+        """
+        O comando enviar_notificacoes esvazia a fila usando o thread pool.
+        """
+        for _ in range(8):
+            self._cria_pedido()
+
+        saida = StringIO()
+        call_command(
+            "enviar_notificacoes", "--workers", "4", "--lote", "3", stdout=saida
+        )
+
+        self.assertIn("enviadas=8", saida.getvalue())
+        self.assertEqual(
+            NotificacaoWhatsApp.objects.filter(
+                status=NotificacaoWhatsApp.STATUS_ENVIADO
+            ).count(),
+            8,
+        )
+        self.assertEqual(len(self.stub.recebidas), 8)
+
+    def test_calcula_backoff_exponencial_com_limite(self):
+        """
+        O intervalo dobra a cada tentativa e respeita o máximo configurado.
+        """
+        with self.settings(WHATSAPP_BACKOFF_BASE=10, WHATSAPP_BACKOFF_MAX=60):
+            self.assertGreaterEqual(calcula_backoff(1).total_seconds(), 10)
+            self.assertLess(calcula_backoff(1).total_seconds(), 11.01)
+            self.assertGreaterEqual(calcula_backoff(3).total_seconds(), 40)
+            self.assertLessEqual(calcula_backoff(10).total_seconds(), 66)
@@ -0,0 +1,228 @@
+import re
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models import Evento, Pedido
+from core.pagination import EventoPagination
+
+
+User = get_user_model()
+
+
+def proximo_link(response):
+    """
+    Extrai a URL rel="next" do header Link (ou None).
+    """
+    match = re.search(r'<([^>]+)>;\s*rel="next"', response.get("Link", ""))
+    return match.group(1) if match else None
+
+
+class PaginacaoEventosTests(APITestCase):
+    """
+    Testes da paginação por cursor no catálogo de eventos.
+
+    Cobre:
+    - corpo continua sendo uma lista; navegação no header Link
+    - percorrer todas as páginas sem repetir nem pular eventos
+      (inclusive com datas repetidas)
+    - limite máximo de page_size
+    - URLs da home: uma página por vez e busca no servidor
+    - contagem estimada limitada, sem COUNT(*) completo
+    - cursor inválido.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.list_url = reverse("evento-list")
+        hoje = date.today()
+        # 3 eventos por data, para exercitar o desempate por id
+        for i in range(12):
+            Evento.objects.create(
+                nome=f"Evento {i:02d}",
+                local="Local",
+                cidade="Cidade",
+                data=hoje + timedelta(days=i // 3),
+                descricao="Descrição",
+                ingresso=Decimal("10.00"),
+            )
+
+    def _percorre(self, url, **params):
+        nomes = []
+        resp = self.client.get(url, params)
+        while True:
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertIsInstance(resp.data, list)
+            nomes.extend(e["nome"] for e in resp.data)
+            link = proximo_link(resp)
+            if not link:
+                return nomes
+            resp = self.client.get(link)
+
+    def test_percorre_todas_as_paginas_em_ordem(self):
+        """
+        Seguir os links percorre todos os eventos, sem repetir nem pular.
+        """
+        nomes = self._percorre(self.list_url, page_size=5)
+        self.assertEqual(nomes, [f"Evento {i:02d}" for i in range(12)])
+
+    def test_catalogo_da_home_em_varias_paginas(self):
+        """
+        A URL da home traz uma página de 20 eventos e o Link (exposto via
+        CORS) da próxima, seguido pelo botão "Carregar mais" até o fim.
+        """
+        hoje = date.today()
+        Evento.objects.bulk_create(
+            [
+                Evento(
+                    nome=f"Antigo {i:03d}",
+                    local="Local",
+                    cidade="Cidade",
+                    data=hoje - timedelta(days=i + 1),
+                    descricao="Descrição",
+                    ingresso=Decimal("10.00"),
+                )
+                for i in range(150)
+            ]
+        )
+        params = {
+            "scope": "all",
+            "page_size": 20,
+            "fields": "id,nome,data,cidade,local,descricao,imagem",
+            "ordering": "-data",
+        }
+        resp = self.client.get(self.list_url, params, HTTP_ORIGIN="http://localhost:5500")
+        self.assertEqual(len(resp.data), 20)
+        self.assertIn("Link", resp["Access-Control-Expose-Headers"])
+        self.assertIn("cursor=", proximo_link(resp))
+
+        nomes = self._percorre(self.list_url, **params)
+        self.assertEqual(len(nomes), 162)
+        self.assertEqual(len(set(nomes)), 162)
+
+    def test_busca_da_home_no_servidor(self):
+        """
+        A busca da home vai para o servidor (?search=) com a mesma
+        paginação, em vez de filtrar uma cópia do catálogo no navegador.
+        """
+        params = {
+            "scope": "all",
+            "page_size": 5,
+            "fields": "id,nome,data,cidade,local,descricao,imagem",
+            "search": "evento",
+        }
+        resp = self.client.get(self.list_url, params)
+        self.assertEqual(len(resp.data), 5)
+        self.assertIn("cursor=", proximo_link(resp))
+        self.assertEqual(len(self._percorre(self.list_url, **params)), 12)
+
+        params["search"] = "inexistente"
+        self.assertEqual(self.client.get(self.list_url, params).data, [])
+
+    def test_primeira_pagina_tem_tamanho_e_link(self):
+        """
+        A primeira página respeita page_size e traz o link da próxima.
+        """
+        resp = self.client.get(self.list_url, {"page_size": 5})
+        self.assertEqual(len(resp.data), 5)
+        self.assertEqual(resp["X-Page-Size"], "5")
+        self.assertIn("cursor=", proximo_link(resp))
+
+    def test_ultima_pagina_sem_link(self):
+        """
+        Quando tudo cabe em uma página, não há header Link.
+        """
+        resp = self.client.get(self.list_url)
+        self.assertEqual(len(resp.data), 12)
+        self.assertNotIn("Link", resp)
+
+    def test_page_size_limitado_ao_maximo(self):
+        """
+        page_size acima do máximo é limitado a max_page_size.
+        """
+        resp = self.client.get(self.list_url, {"page_size": 100000})
+        self.assertEqual(resp["X-Page-Size"], "100")
+
+    def test_ordering_do_cliente_continua_valido(self):
+        """
+        A ordenação escolhida via ?ordering= também pagina corretamente.
+        """
+        nomes = self._percorre(self.list_url, page_size=4, ordering="-nome")
+        self.assertEqual(nomes, [f"Evento {i:02d}" for i in reversed(range(12))])
+
+    def test_pagina_seguinte_nao_usa_offset(self):
+        """
+        A próxima página é buscada pelo cursor (keyset), sem OFFSET.
+        """
+        resp = self.client.get(self.list_url, {"page_size": 5})
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(proximo_link(resp))
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn("OFFSET", sql.upper())
+
+    def test_count_estimado_limitado(self):
+        """
+        ?count=1 envia a contagem, limitada a max_count.
+        """
+        resp = self.client.get(self.list_url, {"count": "1"})
+        self.assertEqual(resp["X-Count-Estimate"], "12")
+
+        cache.clear()
+        with mock.patch.object(EventoPagination, "max_count", 10):
+            resp = self.client.get(self.list_url, {"count": "1"})
+        self.assertEqual(resp["X-Count-Estimate"], "10+")
+
+    def test_sem_count_nao_envia_header(self):
+        """
+        Sem ?count, nenhuma contagem é feita.
+        """
+        resp = self.client.get(self.list_url)
+        self.assertNotIn("X-Count-Estimate", resp)
+
+    def test_cursor_invalido_retorna_404(self):
+        """
+        Cursor corrompido retorna 404, como na CursorPagination do DRF.
+        """
+        resp = self.client.get(self.list_url, {"cursor": "nao-e-um-cursor"})
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class PaginacaoPedidosTests(APITestCase):
+    """
+    Testes da paginação por cursor no histórico de pedidos (criado_em, id).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cliente", email="cliente@example.com", password="StrongPass123!"
+        )
+        self.client.force_authenticate(self.user)
+        self.pedidos = [Pedido.objects.create(usuario=self.user) for _ in range(7)]
+        self.list_url = reverse("pedido-list")
+
+    def test_pedidos_do_mais_recente_para_o_mais_antigo(self):
+        """
+        As páginas seguem (criado_em, id) decrescente.
+        """
+        ids = []
+        resp = self.client.get(self.list_url, {"page_size": 3})
+        while True:
+            ids.extend(p["id"] for p in resp.data)
+            link = proximo_link(resp)
+            if not link:
+                break
+            resp = self.client.get(link)
+
+        esperado = [
+            p.id for p in sorted(self.pedidos, key=lambda p: (p.criado_em, p.id), reverse=True)
+        ]
+        self.assertEqual(ids, esperado)
@@ -0,0 +1,112 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models import Evento, Pedido
+
+
+User = get_user_model()
+
+
+class PedidoQuoteTests(APITestCase):
+    """
+    Testes da cotação do carrinho (POST /pedidos/quote/).
+
+    Cobre:
+    - subtotais e valor_total iguais aos do pedido criado
+    - nenhum pedido gravado
+    - preços servidos do cache, invalidados no save do Evento
+    - eventos inexistentes e carrinho vazio rejeitados.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("pedido-quote")
+        data = date.today() + timedelta(days=10)
+        self.show = Evento.objects.create(
+            nome="Show",
+            local="Arena",
+            cidade="Campinas",
+            data=data,
+            descricao="Show",
+            ingresso=Decimal("100.00"),
+            excursao=Decimal("40.00"),
+        )
+        self.rave = Evento.objects.create(
+            nome="Rave",
+            local="Sítio",
+            cidade="Atibaia",
+            data=data,
+            descricao="Rave",
+            ingresso=Decimal("75.50"),
+        )
+        self.itens = [
+            {"evento_id": self.show.id, "quantidade": 2},
+            {"evento_id": self.rave.id, "quantidade": 3},
+        ]
+
+    def test_cotacao_calcula_subtotais_e_total(self):
+        """
+        Subtotal = (ingresso + excursão) * quantidade; total = soma.
+        """
+        resp = self.client.post(self.url, {"itens": self.itens}, format="json")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [linha["subtotal"] for linha in resp.data["itens"]], ["280.00", "226.50"]
+        )
+        self.assertEqual(resp.data["itens"][0]["evento_nome"], "Show")
+        self.assertEqual(resp.data["valor_total"], "506.50")
+        self.assertEqual(Pedido.objects.count(), 0)
+
+    def test_cotacao_igual_ao_pedido_criado(self):
+        """
+        O total cotado é o mesmo que o pedido grava.
+        """
+        user = User.objects.create_user(username="cliente", password="StrongPass123!")
+        self.client.force_authenticate(user)
+        cotacao = self.client.post(self.url, {"itens": self.itens}, format="json")
+        pedido = self.client.post(reverse("pedido-list"), {"itens": self.itens}, format="json")
+
+        self.assertEqual(pedido.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Decimal(cotacao.data["valor_total"]), Decimal(pedido.data["valor_total"])
+        )
+
+    def test_precos_vem_do_cache(self):
+        """
+        Com os preços em cache, a cotação não consulta o banco.
+        """
+        self.client.post(self.url, {"itens": self.itens}, format="json")
+        with self.assertNumQueries(0):
+            resp = self.client.post(self.url, {"itens": self.itens}, format="json")
+        self.assertEqual(resp.data["valor_total"], "506.50")
+
+    def test_save_do_evento_invalida_preco(self):
+        """
+        Alterar o preço do evento reflete na próxima cotação.
+        """
+        self.client.post(self.url, {"itens": self.itens}, format="json")
+        self.rave.ingresso = Decimal("80.00")
+        self.rave.save()
+
+        resp = self.client.post(self.url, {"itens": self.itens}, format="json")
+        self.assertEqual(resp.data["valor_total"], "520.00")
+
+    def test_evento_inexistente_e_carrinho_vazio(self):
+        """
+        evento_id desconhecido ou lista vazia → 400.
+        """
+        resp = self.client.post(
+            self.url, {"itens": [{"evento_id": 999999, "quantidade": 1}]}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("evento_id", resp.data["itens"][0])
+
+        resp = self.client.post(self.url, {"itens": []}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
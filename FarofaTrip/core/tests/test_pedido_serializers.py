@@ -0,0 +1,200 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from core.models import Evento, Pedido, PedidoItem
+from core.serializers import PedidoSerializer
+
+
+User = get_user_model()
+
+
+class PedidoSerializerCreateTests(TestCase):
+    """
+    Testes do PedidoSerializer.create:
+    - cálculo de subtotais e valor_total
+    - preços do evento usados como padrão
+    - status derivado da forma de pagamento
+    - número de queries constante, independente da quantidade de itens.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário autenticado e alguns eventos futuros.
+        """
+        self.user = User.objects.create_user(
+            username="cliente",
+            email="cliente@example.com",
+            password="StrongPass123!",
+        )
+        self.request = APIRequestFactory().post("/api/pedidos/")
+        self.request.user = self.user
+
+        data = date.today() + timedelta(days=10)
+        self.eventos = [
+            Evento.objects.create(
+                nome=f"Evento {i}",
+                local="Local",
+                cidade="Cidade",
+                data=data,
+                descricao="Descrição",
+                ingresso=Decimal("100.00"),
+                excursao=Decimal("50.00"),
+            )
+            for i in range(20)
+        ]
+
+    def _cria_pedido(self, itens, **extra):
+        """
+        Helper que valida e salva um pedido com os itens informados.
+        """
+        payload = {"itens": itens, **extra}
+        serializer = PedidoSerializer(data=payload, context={"request": self.request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer.save()
+
+    def test_create_calcula_subtotais_e_total(self):
+        """
+        Subtotal = (ingresso + excursao) * quantidade; total = soma dos subtotais.
+        Preços ausentes no payload usam os preços do Evento.
+        """
+        pedido = self._cria_pedido(
+            [
+                {"evento_id": self.eventos[0].id, "quantidade": 2},
+                {
+                    "evento_id": self.eventos[1].id,
+                    "quantidade": 1,
+                    "preco_ingresso": "80.00",
+                    "preco_excursao": "0.00",
+                },
+            ]
+        )
+
+        itens = {i.evento_id: i for i in pedido.itens.all()}
+        self.assertEqual(itens[self.eventos[0].id].subtotal, Decimal("300.00"))
+        self.assertEqual(itens[self.eventos[1].id].subtotal, Decimal("80.00"))
+
+        pedido.refresh_from_db()
+        self.assertEqual(pedido.valor_total, Decimal("380.00"))
+        self.assertEqual(pedido.usuario, self.user)
+        self.assertEqual(pedido.status, "pendente")
+
+    def test_create_com_forma_pagamento_define_status_pago(self):
+        """
+        Com forma_pagamento informada, o pedido já é gravado como 'pago'.
+        """
+        pedido = self._cria_pedido(
+            [{"evento_id": self.eventos[0].id, "quantidade": 1}],
+            forma_pagamento="pix",
+        )
+        pedido.refresh_from_db()
+        self.assertEqual(pedido.status, "pago")
+
+    def test_create_grava_itens_com_pk(self):
+        """
+        Os itens gravados via bulk_create devem ter PK e aparecer no serializer.
+        """
+        pedido = self._cria_pedido(
+            [{"evento_id": e.id, "quantidade": 1} for e in self.eventos[:3]]
+        )
+        self.assertEqual(PedidoItem.objects.filter(pedido=pedido).count(), 3)
+
+        data = PedidoSerializer(pedido).data
+        self.assertEqual(len(data["itens"]), 3)
+        self.assertTrue(all(item["id"] for item in data["itens"]))
+
+    def test_create_numero_de_escritas_nao_cresce_com_itens(self):
+        """
+        A quantidade de INSERT/UPDATE deve ser a mesma para 1 ou 20 itens.
+        """
+
+        def conta_escritas(n):
+            itens = [{"evento_id": e.id, "quantidade": 1} for e in self.eventos[:n]]
+            serializer = PedidoSerializer(
+                data={"itens": itens}, context={"request": self.request}
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            with CaptureQueriesContext(connection) as ctx:
+                serializer.save()
+            return sum(
+                1
+                for q in ctx.captured_queries
+                if q["sql"].lstrip().upper().startswith(("INSERT", "UPDATE"))
+            )
+
+        self.assertEqual(conta_escritas(1), 2)
+        self.assertEqual(conta_escritas(20), 2)
+        self.assertEqual(Pedido.objects.count(), 2)
+
+
+class PedidoItemListSerializerTests(TestCase):
+    """
+    Testes da resolução em lote dos eventos dos itens:
+    - uma única query de Evento para qualquer quantidade de itens
+    - IDs inexistentes rejeitados de uma vez, com erro por item.
+    """
+
+    def setUp(self):
+        data = date.today() + timedelta(days=10)
+        self.eventos = [
+            Evento.objects.create(
+                nome=f"Evento {i}",
+                local="Local",
+                cidade="Cidade",
+                data=data,
+                descricao="Descrição",
+                ingresso=Decimal("10.00"),
+            )
+            for i in range(15)
+        ]
+
+    def test_validacao_faz_uma_query_para_todos_os_itens(self):
+        """
+        Validar 15 itens deve custar apenas 1 SELECT em core_evento.
+        """
+        itens = [{"evento_id": e.id, "quantidade": 1} for e in self.eventos]
+        serializer = PedidoSerializer(data={"itens": itens})
+
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        eventos = [i["evento"] for i in serializer.validated_data["itens"]]
+        self.assertEqual(eventos, self.eventos)
+
+    def test_ids_inexistentes_sao_rejeitados_por_item(self):
+        """
+        Todos os IDs desconhecidos devem aparecer nos erros, cada um na sua posição.
+        """
+        itens = [
+            {"evento_id": self.eventos[0].id, "quantidade": 1},
+            {"evento_id": 999999, "quantidade": 1},
+            {"evento_id": 888888, "quantidade": 1},
+        ]
+        serializer = PedidoSerializer(data={"itens": itens})
+
+        with self.assertNumQueries(1):
+            self.assertFalse(serializer.is_valid())
+
+        erros = serializer.errors["itens"]
+        self.assertEqual(erros[0], {})
+        self.assertIn("evento_id", erros[1])
+        self.assertIn("evento_id", erros[2])
+
+    def test_evento_id_com_tipo_invalido(self):
+        """
+        Valores não numéricos geram erro de tipo, sem quebrar o lote.
+        """
+        itens = [
+            {"evento_id": "abc", "quantidade": 1},
+            {"evento_id": self.eventos[1].id, "quantidade": 1},
+        ]
+        serializer = PedidoSerializer(data={"itens": itens})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("evento_id", serializer.errors["itens"][0])
+        self.assertEqual(serializer.errors["itens"][1], {})
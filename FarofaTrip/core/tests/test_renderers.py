@@ -0,0 +1,152 @@
+import json
+from io import BytesIO
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from uuid import UUID
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from core.models import Evento
+from core.renderers import ORJSONParser, ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    Testes do renderer/parser com orjson (core.renderers).
+
+    Cobre:
+    - mesma saída do JSONRenderer do DRF (Decimal, datas, lazy strings)
+    - U+2028/U+2029 escapados, inteiros acima de 64 bits e NaN/Infinity
+      tratados como no DRF
+    - indentação pedida no Accept
+    - parse de JSON válido e inválido
+    - mesmo resultado do JSONParser do DRF (inteiros longos, 1e400,
+      charset declarado).
+    """
+
+    def test_mesma_saida_do_json_renderer(self):
+        """
+        Tipos tratados pelo encoder do DRF saem iguais, byte a byte.
+        """
+        dados = {
+            "preco": Decimal("149.90"),
+            "data": date(2030, 1, 15),
+            "criado_em": datetime(2030, 1, 15, 12, 30, 5, 123456, tzinfo=dt_timezone.utc),
+            "duracao": timedelta(hours=2),
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "rotulo": gettext_lazy("Evento"),
+            "cidade": "São Paulo",
+            "itens": [{"quantidade": 2}, None, True],
+        }
+        self.assertEqual(ORJSONRenderer().render(dados), JSONRenderer().render(dados))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_casos_que_o_orjson_nao_representa_igual(self):
+        """
+        Separadores U+2028/U+2029 e inteiros acima de 64 bits saem iguais
+        ao DRF; NaN/Infinity levantam ValueError como no DRF.
+        """
+        for dados in (
+            {"descricao": "linha\u2028parágrafo\u2029fim"},
+            {"grande": 2**64, "negativo": -(2**63) - 1},
+            {"lista": [None, 1.5]},
+        ):
+            with self.subTest(dados=dados):
+                self.assertEqual(ORJSONRenderer().render(dados), JSONRenderer().render(dados))
+
+        for dados in (
+            {"valor": float("nan")},
+            [{"valor": None}, {"valor": float("inf")}],
+            {"valor": Decimal("NaN")},
+        ):
+            with self.subTest(dados=dados):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render(dados)
+                with self.assertRaises(ValueError):
+                    ORJSONRenderer().render(dados)
+
+    def test_indentacao_pelo_accept(self):
+        """
+        indent no Accept vira indentação de 2 espaços.
+        """
+        saida = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+        self.assertEqual(saida, b'{\n  "a": 1\n}')
+
+    def test_parse(self):
+        """
+        JSON válido vira dict; inválido levanta ParseError (400).
+        """
+        parser = ORJSONParser()
+        self.assertEqual(parser.parse(BytesIO('{"nome": "Ação", "n": 1}'.encode())), {"nome": "Ação", "n": 1})
+        with self.assertRaises(ParseError):
+            parser.parse(BytesIO(b'{"nome": '))
+
+
+    def test_parse_igual_ao_json_parser(self):
+        """
+        Inteiros acima de 64 bits, números fora do double e charsets
+        diferentes de UTF-8 saem iguais ao JSONParser, valor e tipo.
+        """
+        casos = [
+            (b'{"a": 123456789012345678901234567890}', "utf-8"),
+            (b'{"a": -9223372036854775809, "b": 18446744073709551615}', "utf-8"),
+            (b'{"a": 1e400, "b": -1e400}', "utf-8"),
+            (b'{"a": 0.1234567890123456789, "b": [1.5, null]}', "utf-8"),
+            ('{"nome": "Ação"}'.encode("latin-1"), "latin-1"),
+            ('{"nome": "Ação"}'.encode("utf-16"), "utf-16"),
+            ('{"nome": "Ação"}'.encode("utf-8"), "UTF8"),
+        ]
+        for corpo, encoding in casos:
+            with self.subTest(corpo=corpo, encoding=encoding):
+                contexto = {"encoding": encoding}
+                esperado = JSONParser().parse(BytesIO(corpo), parser_context=contexto)
+                obtido = ORJSONParser().parse(BytesIO(corpo), parser_context=contexto)
+                self.assertEqual(repr(obtido), repr(esperado))
+
+        for corpo in (b'{"nome": ', b'{"a": 1} x', b"\xff", b'{"a": NaN}'):
+            with self.subTest(corpo=corpo):
+                with self.assertRaises(ParseError):
+                    JSONParser().parse(BytesIO(corpo))
+                with self.assertRaises(ParseError):
+                    ORJSONParser().parse(BytesIO(corpo))
+
+
+class ORJSONApiTests(APITestCase):
+    """
+    Testes da API com o renderer/parser com orjson nos settings.
+    """
+
+    def test_listagem_de_eventos_em_json(self):
+        """
+        Preços continuam saindo como string.
+        """
+        Evento.objects.create(
+            nome="Show",
+            local="Arena",
+            cidade="Recife",
+            data=date.today() + timedelta(days=5),
+            descricao="Descrição",
+            ingresso=Decimal("50.00"),
+        )
+        resp = self.client.get(reverse("evento-list"), HTTP_ACCEPT="application/json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp["Content-Type"], "application/json")
+        corpo = json.loads(resp.content)
+        self.assertEqual(corpo[0]["ingresso"], "50.00")
+
+    def test_json_invalido_responde_400(self):
+        """
+        Corpo JSON malformado responde 400 com a mensagem do parser.
+        """
+        resp = self.client.post(
+            reverse("api_login"), data=b'{"username": ', content_type="application/json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("JSON parse error", resp.json()["detail"])
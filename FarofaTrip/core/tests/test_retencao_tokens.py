@@ -0,0 +1,106 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from core.retencao import estima_purga, limite_expiracao, purga_tokens
+
+
+User = get_user_model()
+
+
+class RetencaoTokensTests(TestCase):
+    """
+    Testes da purga de tokens expirados (core.retencao / purgar_tokens).
+
+    Cobre:
+    - apenas tokens expirados são apagados, com a blacklist junto
+    - lotes limitados
+    - retenção por dias
+    - dry-run sem apagar nada.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="StrongPass123!")
+        agora = timezone.now()
+        self._cria_tokens("exp", 7, agora - timedelta(days=3), blacklist=3)
+        self._cria_tokens("recente", 2, agora - timedelta(hours=1), blacklist=1)
+        self._cria_tokens("valido", 4, agora + timedelta(days=1), blacklist=2)
+
+    def _cria_tokens(self, prefixo, quantidade, expires_at, blacklist=0):
+        tokens = OutstandingToken.objects.bulk_create(
+            [
+                OutstandingToken(
+                    user=self.user,
+                    jti=f"{prefixo}-{i}",
+                    token=f"token-{prefixo}-{i}",
+                    expires_at=expires_at,
+                )
+                for i in range(quantidade)
+            ]
+        )
+        BlacklistedToken.objects.bulk_create(
+            [BlacklistedToken(token=token) for token in tokens[:blacklist]]
+        )
+
+    def test_purga_apenas_expirados(self):
+        """
+        Tokens expirados e suas entradas na blacklist somem; os válidos ficam.
+        """
+        total = purga_tokens(limite_expiracao(), lote=4, pausa=0)
+
+        self.assertEqual(total["outstanding"], 9)
+        self.assertEqual(total["blacklisted"], 4)
+        self.assertEqual(total["lotes"], 3)
+        self.assertEqual(OutstandingToken.objects.count(), 4)
+        self.assertEqual(BlacklistedToken.objects.count(), 2)
+        self.assertGreater(total["linhas_por_segundo"], 0)
+
+    def test_max_lotes_limita_a_execucao(self):
+        """
+        Cada lote apaga no máximo `lote` tokens.
+        """
+        total = purga_tokens(limite_expiracao(), lote=2, pausa=0, max_lotes=1)
+        self.assertEqual(total["outstanding"], 2)
+        self.assertEqual(OutstandingToken.objects.count(), 11)
+
+    def test_retencao_em_dias(self):
+        """
+        --reter-dias mantém os expirados recentemente.
+        """
+        purga_tokens(limite_expiracao(reter_dias=1), pausa=0)
+        self.assertEqual(
+            sorted(OutstandingToken.objects.values_list("jti", flat=True))[:2],
+            ["recente-0", "recente-1"],
+        )
+        self.assertEqual(OutstandingToken.objects.count(), 6)
+
+    def test_dry_run_nao_apaga(self):
+        """
+        O dry-run só estima linhas e lotes.
+        """
+        self.assertEqual(
+            estima_purga(limite_expiracao(), lote=4),
+            {"outstanding": 9, "blacklisted": 4, "lotes": 3},
+        )
+        saida = StringIO()
+        call_command("purgar_tokens", "--dry-run", stdout=saida)
+        self.assertIn("outstanding=9", saida.getvalue())
+        self.assertEqual(OutstandingToken.objects.count(), 13)
+
+    def test_comando_reporta_linhas_por_segundo(self):
+        """
+        O comando apaga e informa a vazão.
+        """
+        saida = StringIO()
+        call_command("purgar_tokens", "--lote", "5", "--pausa", "0", stdout=saida)
+        self.assertIn("outstanding=9", saida.getvalue())
+        self.assertIn("linhas/s=", saida.getvalue())
+        self.assertEqual(OutstandingToken.objects.count(), 4)
@@ -0,0 +1,171 @@
+import tempfile
+import threading
+from decimal import Decimal
+from pathlib import Path
+from unittest import TestCase, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections, transaction
+
+from FarofaTrip.database import database_config
+from core.models import Evento, Pedido, PedidoItem
+from core.sqlite import sql_pragma
+
+
+User = get_user_model()
+
+WRITERS = 8
+ESCRITAS_POR_WRITER = 25
+
+
+@skipUnless(connection.vendor == "sqlite", "Testes dos ajustes do SQLite.")
+class SQLiteConcorrenciaTests(TestCase):
+    """
+    Testes dos ajustes de concorrência do SQLite (core/sqlite.py), em um
+    banco em arquivo temporário registrado como alias extra (unittest puro:
+    os TestCases do Django só aceitam aliases definidos no settings).
+
+    Cobre:
+    - PRAGMAs aplicados em cada conexão nova (WAL, busy_timeout...)
+    - BEGIN IMMEDIATE nas transações
+    - N threads criando pedidos e usuários sem 'database is locked'
+    - validação dos PRAGMAs configurados.
+    """
+    alias = "sqlite_concorrencia"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        environ = {"SQLITE_PATH": str(Path(cls.tmpdir.name) / "concorrencia.sqlite3")}
+        config = database_config(Path(cls.tmpdir.name), environ=environ)
+        connections.settings[cls.alias] = connections.configure_settings(
+            {"default": connections.settings["default"], cls.alias: config}
+        )[cls.alias]
+        call_command("migrate", database=cls.alias, verbosity=0)
+        cls.eventos = Evento.objects.using(cls.alias).bulk_create(
+            [
+                Evento(
+                    nome=f"Evento {i}",
+                    local="Arena",
+                    cidade="Campinas",
+                    data="2030-01-01",
+                    descricao="Descrição",
+                    ingresso=Decimal("50.00"),
+                )
+                for i in range(2)
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        connections[cls.alias].close()
+        del connections[cls.alias]
+        del connections.settings[cls.alias]
+        cls.tmpdir.cleanup()
+
+    def _pragma(self, nome):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(f"PRAGMA {nome}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas_aplicados_na_conexao(self):
+        """
+        A conexão nova já vem com WAL, busy_timeout e temp_store em memória.
+        """
+        connections[self.alias].close()
+        self.assertEqual(self._pragma("journal_mode"), "wal")
+        self.assertEqual(self._pragma("busy_timeout"), 20000)
+        self.assertEqual(self._pragma("synchronous"), 1)  # NORMAL
+        self.assertEqual(self._pragma("temp_store"), 2)  # MEMORY
+        self.assertEqual(self._pragma("cache_size"), -20000)
+
+    def test_transacoes_com_begin_immediate(self):
+        """
+        transaction.atomic abre a transação com BEGIN IMMEDIATE.
+        """
+        conexao = connections[self.alias]
+        conexao.ensure_connection()
+        self.assertEqual(conexao.transaction_mode, "IMMEDIATE")
+
+    def _cria_pedidos(self, erros):
+        for _ in range(ESCRITAS_POR_WRITER):
+            try:
+                with transaction.atomic(using=self.alias):
+                    pedido = Pedido.objects.using(self.alias).create(
+                        valor_total=Decimal("100.00"), status="pago"
+                    )
+                    PedidoItem.objects.using(self.alias).bulk_create(
+                        [
+                            PedidoItem(
+                                pedido=pedido,
+                                evento=evento,
+                                quantidade=1,
+                                preco_ingresso=evento.ingresso,
+                                preco_excursao=Decimal("0.00"),
+                                subtotal=evento.ingresso,
+                            )
+                            for evento in self.eventos
+                        ]
+                    )
+            except OperationalError as exc:
+                erros.append(exc)
+
+    def _registra_usuarios(self, indice, erros):
+        for i in range(ESCRITAS_POR_WRITER):
+            try:
+                with transaction.atomic(using=self.alias):
+                    User.objects.db_manager(self.alias).create(
+                        username=f"writer{indice}_{i}", email=f"writer{indice}_{i}@example.com"
+                    )
+            except OperationalError as exc:
+                erros.append(exc)
+
+    def _executa(self, alvo, erros, *args):
+        try:
+            alvo(*args, erros)
+        finally:
+            connections[self.alias].close()
+
+    def test_writers_paralelos_sem_lock(self):
+        """
+        N threads criando pedidos (e registrando usuários) ao mesmo tempo
+        terminam sem nenhum 'database is locked'.
+        """
+        pedidos_antes = Pedido.objects.using(self.alias).count()
+        usuarios_antes = User.objects.using(self.alias).count()
+        erros = []
+        threads = []
+        for i in range(WRITERS):
+            if i % 2:
+                args = (self._registra_usuarios, erros, i)
+            else:
+                args = (self._cria_pedidos, erros)
+            threads.append(threading.Thread(target=self._executa, args=args))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(erros, [])
+        writers_pedido = (WRITERS + 1) // 2
+        self.assertEqual(
+            Pedido.objects.using(self.alias).count() - pedidos_antes,
+            writers_pedido * ESCRITAS_POR_WRITER,
+        )
+        self.assertEqual(
+            User.objects.using(self.alias).count() - usuarios_antes,
+            (WRITERS - writers_pedido) * ESCRITAS_POR_WRITER,
+        )
+
+    def test_sql_pragma_rejeita_valores_invalidos(self):
+        """
+        Nomes e valores fora do formato simples não viram SQL.
+        """
+        self.assertEqual(sql_pragma("journal_mode", "WAL"), "PRAGMA journal_mode=WAL")
+        self.assertEqual(sql_pragma("cache_size", -2000), "PRAGMA cache_size=-2000")
+        with self.assertRaises(ImproperlyConfigured):
+            sql_pragma("journal_mode", "WAL; DROP TABLE core_pedido")
+        with self.assertRaises(ImproperlyConfigured):
+            sql_pragma("cache size", 10)
@@ -0,0 +1,209 @@
+import tempfile
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.throttling import cache_throttle, contadores_throttle, registra_tentativa
+
+
+User = get_user_model()
+
+TAXAS_TESTE = {
+    "login_ip": "5/min",
+    "login_conta": "3/min",
+    "registro_ip": "2/hour",
+    "registro_conta": "5/hour",
+    "senha_conta": "2/min",
+}
+
+
+@override_settings(REST_FRAMEWORK={
+    "DEFAULT_AUTHENTICATION_CLASSES": ("core.authentication.CachedJWTAuthentication",),
+    "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.KeysetPagination",
+    "DEFAULT_THROTTLE_RATES": TAXAS_TESTE,
+})
+class ThrottlingAutenticacaoTests(APITestCase):
+    """
+    Testes do throttling de login, registro e troca de senha (core.throttling).
+
+    Cobre:
+    - limite por conta (e-mail/username normalizado) e por IP
+    - 429 com Retry-After, sem queries no banco
+    - limite por usuário na troca de senha
+    - contadores de requests rejeitadas.
+    """
+
+    def setUp(self):
+        cache_throttle().clear()
+        # Relógio fixo no início de uma janela: um teste que cruzasse a
+        # virada do minuto veria a janela anterior com peso < 1
+        relogio = mock.patch("core.throttling.time")
+        relogio.start().time.return_value = 1_800_000_000.0
+        self.addCleanup(relogio.stop)
+        self.user = User.objects.create_user(
+            username="alvo",
+            email="alvo@example.com",
+            password="StrongPass123!",
+        )
+        self.url = reverse("api_login")
+
+    def tearDown(self):
+        cache_throttle().clear()
+
+    def login(self, username, password="errada", ip="10.0.0.1"):
+        return self.client.post(
+            self.url,
+            {"username": username, "password": password},
+            format="json",
+            REMOTE_ADDR=ip,
+        )
+
+    def test_limite_por_conta_normaliza_identificador(self):
+        """
+        Variações de caixa/espaços do mesmo e-mail contam para a mesma
+        conta, mesmo vindas de IPs diferentes.
+        """
+        for i, ident in enumerate(["alvo@example.com", " ALVO@example.com", "Alvo@Example.com "]):
+            resp = self.login(ident, ip=f"10.0.0.{i + 1}")
+            self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with self.assertNumQueries(0):
+            resp = self.login("alvo@example.com", password="StrongPass123!", ip="10.0.0.9")
+        self.assertEqual(resp.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreaterEqual(int(resp["Retry-After"]), 1)
+
+        # Outra conta não é afetada
+        self.assertEqual(self.login("outra@example.com").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_limite_por_ip(self):
+        """
+        Contas diferentes a partir do mesmo IP esbarram no limite por IP.
+        """
+        for i in range(5):
+            self.assertEqual(self.login(f"conta{i}").status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.login("conta9").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(self.login("conta9", ip="10.0.0.2").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_registro_limitado_por_ip(self):
+        """
+        O registro usa o escopo "registro" e rejeita antes de validar.
+        """
+        url = reverse("api_register")
+        for i in range(2):
+            resp = self.client.post(url, {"email": f"n{i}@example.com"}, format="json")
+            self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        with self.assertNumQueries(0):
+            resp = self.client.post(url, {"email": "n9@example.com"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_troca_de_senha_limitada_por_usuario(self):
+        """
+        A troca de senha conta tentativas pelo id do usuário autenticado.
+        """
+        self.client.force_authenticate(self.user)
+        url = reverse("api_change_password")
+        dados = {
+            "old_password": "errada",
+            "new_password": "OutraSenha123!",
+            "new_password_confirm": "OutraSenha123!",
+        }
+        for _ in range(2):
+            resp = self.client.post(url, dados, format="json")
+            self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        resp = self.client.post(url, dados, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_contadores_de_rejeicao(self):
+        """
+        Com cache compartilhado (aqui, em arquivo), cada rejeição
+        incrementa o contador do escopo que a causou, e o comando
+        contadores_throttle mostra e zera os valores.
+        """
+        caches = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": tempfile.mkdtemp(prefix="farofatrip-throttle-test-"),
+            }
+        }
+        with self.settings(CACHES=caches):
+            self._verifica_contadores()
+
+    def test_contadores_exigem_cache_compartilhado(self):
+        """
+        Com o LocMemCache (por processo) as rejeições não são contadas e o
+        comando recusa mostrar contadores que seriam sempre 0.
+        """
+        for _ in range(5):
+            self.login("alvo")
+        self.assertEqual(contadores_throttle(["login_conta"]), {"login_conta": 0})
+        with self.assertRaises(CommandError):
+            call_command("contadores_throttle", stdout=StringIO())
+
+    def _verifica_contadores(self):
+        for _ in range(5):
+            self.login("alvo")
+        self.assertEqual(
+            contadores_throttle(["login_ip", "login_conta"]),
+            {"login_ip": 0, "login_conta": 2},
+        )
+
+        saida = StringIO()
+        call_command("contadores_throttle", "--zerar", stdout=saida)
+        self.assertIn("login_conta=2", saida.getvalue())
+        self.assertIn("total=2", saida.getvalue())
+        self.assertEqual(contadores_throttle(["login_conta"]), {"login_conta": 0})
+
+
+class JanelaDeslizanteTests(SimpleTestCase):
+    """
+    Testes de registra_tentativa (janela deslizante aproximada).
+    """
+
+    def setUp(self):
+        cache_throttle().clear()
+
+    def tearDown(self):
+        cache_throttle().clear()
+
+    def test_janela_anterior_conta_proporcionalmente(self):
+        """
+        Tentativas da janela anterior pesam pela fração do período que
+        ainda se sobrepõe à janela deslizante.
+        """
+        for _ in range(4):
+            self.assertTrue(registra_tentativa("t", 4, 60, agora=600)[0])
+        permitido, espera = registra_tentativa("t", 4, 60, agora=630)
+        self.assertFalse(permitido)
+        self.assertEqual(espera, 30)
+
+        # Em 3/4 da janela seguinte, a anterior pesa 1 -> cabem mais 3
+        resultados = [registra_tentativa("t", 4, 60, agora=705)[0] for _ in range(4)]
+        self.assertEqual(resultados, [True, True, True, False])
+
+    def test_tentativas_simultaneas_respeitam_o_limite(self):
+        """
+        A contagem é feita com add + incr: requests simultâneas não passam
+        com a mesma contagem.
+        """
+        resultados = []
+        barreira = threading.Barrier(20)
+
+        def tenta():
+            barreira.wait()
+            resultados.append(registra_tentativa("paralelo", 5, 60, agora=600)[0])
+
+        threads = [threading.Thread(target=tenta) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(resultados.count(True), 5)
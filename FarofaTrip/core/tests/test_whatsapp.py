@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core.models import Evento, Pedido, PedidoItem
+from core.whatsapp import (
+    format_order_message,
+    format_order_messages,
+    load_order_for_message,
+)
+
+
+User = get_user_model()
+
+
+class FormatOrderMessageTests(TestCase):
+    """
+    Testes da montagem da mensagem de WhatsApp do pedido:
+    - conteúdo do texto (cliente, itens, observações)
+    - número fixo de queries no carregamento
+    - nenhuma query na formatação de pedidos pré-carregados
+    - versão em lote.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário com nome completo e alguns eventos.
+        """
+        self.user = User.objects.create_user(
+            username="cliente",
+            email="cliente@example.com",
+            password="StrongPass123!",
+            first_name="Maria",
+            last_name="Souza",
+        )
+        data = date.today() + timedelta(days=3)
+        self.eventos = [
+            Evento.objects.create(
+                nome=f"Festival {i}",
+                local="Local",
+                cidade="Cidade",
+                data=data,
+                descricao="Descrição",
+                ingresso=Decimal("100.00"),
+                excursao=Decimal("0.00"),
+            )
+            for i in range(5)
+        ]
+
+    def _cria_pedido(self, n_itens, **extra):
+        """
+        Cria um pedido com n_itens (um por evento).
+        """
+        pedido = Pedido.objects.create(
+            usuario=self.user, valor_total=Decimal("100.00") * n_itens, **extra
+        )
+        for evento in self.eventos[:n_itens]:
+            PedidoItem.objects.create(
+                pedido=pedido,
+                evento=evento,
+                quantidade=1,
+                preco_ingresso=evento.ingresso,
+                preco_excursao=evento.excursao,
+            )
+        return pedido
+
+    def test_mensagem_contem_dados_do_pedido(self):
+        """
+        O texto traz cliente, pagamento, total, itens e observações.
+        """
+        pedido = self._cria_pedido(2, forma_pagamento="pix", observacoes="Sem pressa")
+
+        texto = format_order_message(load_order_for_message(pedido.id))
+
+        self.assertIn(f"Novo pedido #{pedido.id}", texto)
+        self.assertIn("Cliente: Maria Souza", texto)
+        self.assertIn("Forma de pagamento: pix", texto)
+        self.assertIn("Valor total: R$ 200.00", texto)
+        self.assertIn("- 1x Festival 0 | ingresso R$ 100.00 | subtotal R$ 100.00", texto)
+        self.assertIn("- 1x Festival 1", texto)
+        self.assertIn("Sem pressa", texto)
+        self.assertNotIn("sem itens cadastrados", texto)
+
+    def test_pedido_sem_itens(self):
+        """
+        Pedido sem itens mostra o aviso de 'sem itens cadastrados'.
+        """
+        pedido = self._cria_pedido(0)
+        texto = format_order_message(load_order_for_message(pedido.id))
+        self.assertIn("sem itens cadastrados", texto)
+
+    def test_carregamento_tem_queries_fixas_e_formatacao_nenhuma(self):
+        """
+        Carregar custa 2 queries para 1 ou 5 itens; formatar, zero.
+        """
+        for n in (1, 5):
+            pedido = self._cria_pedido(n)
+            with self.assertNumQueries(2):
+                carregado = load_order_for_message(pedido.id)
+            with self.assertNumQueries(0):
+                format_order_message(carregado)
+
+    def test_pedido_sem_prefetch_continua_funcionando(self):
+        """
+        Sem o loader, a formatação ainda funciona, sem query por item.
+        """
+        pedido = self._cria_pedido(5)
+        pedido = Pedido.objects.get(pk=pedido.pk)
+        with self.assertNumQueries(2):
+            texto = format_order_message(pedido)
+        self.assertIn("Festival 4", texto)
+
+    def test_format_order_messages_em_lote(self):
+        """
+        A versão em lote retorna um texto por pedido com 2 queries no total.
+        """
+        pedidos = [self._cria_pedido(n) for n in (1, 3, 5)]
+
+        with self.assertNumQueries(2):
+            textos = format_order_messages(pedidos + [999999])
+
+        self.assertEqual(set(textos), {p.id for p in pedidos})
+        for pedido in pedidos:
+            self.assertEqual(
+                textos[pedido.id],
+                format_order_message(load_order_for_message(pedido.id)),
+            )
@@ -0,0 +1,215 @@
+# FarofaTrip/core/throttling.py
+"""
+Throttling de login, registro e troca de senha.
+
+Cada request de autenticação custa um hash de senha (ver core.hashing).
+Aqui as tentativas são contadas em janela deslizante no cache
+compartilhado, com duas chaves independentes:
+
+- IP de origem (BaseThrottle.get_ident, respeita NUM_PROXIES);
+- conta alvo: e-mail/username normalizado do corpo da request ou, para
+  usuários autenticados, o id.
+
+O DRF verifica os throttles em APIView.initial(), antes do handler: a
+request rejeitada recebe 429 com Retry-After sem tocar no banco nem no
+hasher.
+
+A janela deslizante é aproximada com duas janelas fixas (a atual e a
+anterior, ponderada pela fração ainda dentro do período): dois
+incr/get no cache por request, em vez do histórico de timestamps do
+SimpleRateThrottle.
+
+Configuração:
+    REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]
+        "<throttle_scope>_ip" e "<throttle_scope>_conta" (ex.: "login_ip");
+        escopo sem taxa não é limitado
+    THROTTLE_CACHE   alias do cache usado (padrão: "default")
+
+As rejeições são contadas por escopo no mesmo cache (ver
+contadores_throttle e o comando `contadores_throttle`), apenas quando
+ele é compartilhado entre processos (CACHE_BACKEND=file, o padrão sem
+DEBUG, redis ou memcached): com o LocMemCache cada worker teria as suas
+janelas e os seus contadores, e o comando, rodando em outro processo,
+leria sempre 0. No FileBasedCache o
+incr não é atômico entre processos, então os contadores são aproximados.
+
+As contagens usam add + incr (o incr é atômico no Redis/Memcached): cada
+tentativa recebe um valor distinto do contador, e duas requests
+simultâneas não passam com a mesma contagem.
+"""
+import hashlib
+import logging
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+logger = logging.getLogger(__name__)
+
+PREFIXO = "throttle"
+CAMPOS_CONTA = ("email", "username")
+# Primeira letra do período da taxa -> segundos (como no DRF)
+DURACOES = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def cache_throttle():
+    return caches[getattr(settings, "THROTTLE_CACHE", "default")]
+
+
+def cache_compartilhado():
+    """
+    True se o cache do throttling é visto por todos os processos.
+    """
+    return not isinstance(cache_throttle(), LocMemCache)
+
+
+def _parse_taxa(taxa):
+    """
+    "5/min" -> (5, 60).
+    """
+    quantidade, periodo = taxa.split("/")
+    return int(quantidade), DURACOES[periodo[0]]
+
+
+def _incrementa(cache, chave, timeout):
+    cache.add(chave, 0, timeout)
+    try:
+        return cache.incr(chave)
+    except ValueError:
+        # Despejada entre o add e o incr
+        cache.set(chave, 1, timeout)
+        return 1
+
+
+def registra_tentativa(chave, limite, periodo, agora=None):
+    """
+    Conta uma tentativa para `chave` na janela deslizante de `periodo`
+    segundos. Retorna (permitido, espera): quando o limite já foi
+    atingido a tentativa não é contada e `espera` estima os segundos até
+    a próxima vaga.
+    """
+    cache = cache_throttle()
+    agora = time.time() if agora is None else agora
+    janela, decorrido = divmod(agora, periodo)
+    janela = int(janela)
+    chave_atual = f"{PREFIXO}:{chave}:{janela}"
+    chave_anterior = f"{PREFIXO}:{chave}:{janela - 1}"
+
+    # Conta primeiro (atômico) e desfaz se passou do limite
+    atual = _incrementa(cache, chave_atual, 2 * periodo) - 1
+    anterior = cache.get(chave_anterior, 0)
+    peso = 1 - decorrido / periodo
+
+    if anterior * peso + atual >= limite:
+        try:
+            cache.decr(chave_atual)
+        except ValueError:
+            pass
+        return False, _espera(limite, periodo, decorrido, atual, anterior)
+    return True, None
+
+
+def _espera(limite, periodo, decorrido, atual, anterior):
+    restante = periodo - decorrido
+    if atual >= limite or not anterior:
+        # Só abre vaga quando a janela atual virar a anterior
+        return math.ceil(restante)
+    # anterior * (1 - t / periodo) + atual < limite
+    t = periodo * (1 - (limite - atual) / anterior)
+    return max(1, math.ceil(min(t, periodo) - decorrido))
+
+
+def contadores_throttle(escopos):
+    """
+    Requests rejeitadas por escopo (desde o último zerar).
+    """
+    chaves = {escopo: f"{PREFIXO}:rejeitados:{escopo}" for escopo in escopos}
+    valores = cache_throttle().get_many(list(chaves.values()))
+    return {escopo: valores.get(chave, 0) for escopo, chave in chaves.items()}
+
+
+def zera_contadores_throttle(escopos):
+    cache_throttle().delete_many([f"{PREFIXO}:rejeitados:{e}" for e in escopos])
+
+
+def escopos_configurados():
+    return sorted(api_settings.DEFAULT_THROTTLE_RATES or {})
+
+
+def _registra_rejeicao(escopo):
+    if cache_compartilhado():
+        _incrementa(cache_throttle(), f"{PREFIXO}:rejeitados:{escopo}", None)
+    logger.info("Throttle %s: request rejeitada.", escopo)
+
+
+class JanelaDeslizanteThrottle(BaseThrottle):
+    """
+    Base: limita por view.throttle_scope + sufixo, com a taxa lida de
+    DEFAULT_THROTTLE_RATES a cada request (acompanha override_settings).
+    Subclasses definem identidade(request).
+    """
+    sufixo = None
+
+    def __init__(self):
+        self.espera = None
+
+    def identidade(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        escopo_view = getattr(view, "throttle_scope", None)
+        if not escopo_view:
+            return True
+        escopo = f"{escopo_view}_{self.sufixo}"
+        taxa = (api_settings.DEFAULT_THROTTLE_RATES or {}).get(escopo)
+        if not taxa:
+            return True
+        ident = self.identidade(request)
+        if not ident:
+            return True
+
+        limite, periodo = _parse_taxa(taxa)
+        digest = hashlib.blake2b(ident.encode("utf-8"), digest_size=12).hexdigest()
+        permitido, self.espera = registra_tentativa(f"{escopo}:{digest}", limite, periodo)
+        if not permitido:
+            _registra_rejeicao(escopo)
+        return permitido
+
+    def wait(self):
+        return self.espera
+
+
+class IPThrottle(JanelaDeslizanteThrottle):
+    """
+    Tentativas por IP de origem.
+    """
+    sufixo = "ip"
+
+    def identidade(self, request):
+        return self.get_ident(request)
+
+
+class ContaThrottle(JanelaDeslizanteThrottle):
+    """
+    Tentativas por conta alvo: id do usuário autenticado ou o primeiro de
+    email/username informado, sem espaços e em minúsculas.
+    """
+    sufixo = "conta"
+
+    def identidade(self, request):
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"id:{user.pk}"
+        dados = request.data
+        if not hasattr(dados, "get"):
+            return None
+        for campo in CAMPOS_CONTA:
+            valor = dados.get(campo)
+            if isinstance(valor, str) and valor.strip():
+                return valor.strip().lower()
+        return None
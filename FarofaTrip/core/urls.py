@@ -1,4 +1,3 @@
-from django.contrib import admin
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from core.views import UsuarioViewSet, EventoViewSet, PedidoViewSet
@@ -12,9 +11,8 @@ router.register(r'pedidos', PedidoViewSet, basename='pedido')
 
 # URLs da aplicação "core"
 urlpatterns = [
-    # Rota do painel administrativo do Django
-    path('admin/', admin.site.urls),
-
+    # O admin fica só em /admin/ (FarofaTrip/urls.py): em /api/ não há
+    # sessão nem autenticação do Django (core.middleware)
 
     # Endpoints de autenticação JWT
 
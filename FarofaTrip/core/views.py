@@ -1,21 +1,110 @@
 from rest_framework import viewsets, status, permissions, filters
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.utils.timezone import localdate
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.decorators import action
 
+from .blacklist import FilteredRefreshToken
+from .busca import EventoSearchFilter
+from .cache import (
+    chave,
+    chave_instancia,
+    namespace_dono,
+    obtem_com_revalidacao,
+    obtem_ou_calcula,
+)
+from .catalogo import (
+    HEADERS_CACHEADOS,
+    chave_catalogo,
+    chave_lote,
+    monta_entrada,
+    timeout_catalogo,
+    versao_catalogo,
+)
+from .campos import campos_da_request, colunas_dos_campos
+from .compressao import variantes_comprimidas
+from .leitura import LeituraCompilada
 from .models import Perfil, Evento, Pedido
+from .pagination import EventoPagination, PedidoPagination, UsuarioPagination
 from .serializers import (
     PerfilSerializer,
     EventoSerializer,
     RegisterSerializer,
     EmailOrUsernameTokenObtainPairSerializer,
     PedidoSerializer,
-    ChangePasswordSerializer
+    ChangePasswordSerializer,
+    CotacaoSerializer,
+    FilteredTokenRefreshSerializer,
 )
+from .throttling import ContaThrottle, IPThrottle
+
+
+class CamposEsparsosViewMixin:
+    """
+    ?fields= / ?expand= (core.campos) nas leituras (GET/HEAD/OPTIONS):
+    repassa a seleção ao serializer e à leitura compilada; get_queryset()
+    usa colunas_selecionadas() para o .only().
+    """
+
+    def get_campos(self):
+        """
+        Campos pedidos na request (validados) ou None para a resposta completa.
+        """
+        if self.request is None or self.request.method not in permissions.SAFE_METHODS:
+            return None
+        if not hasattr(self, "_campos"):
+            self._campos = campos_da_request(self.request, self.get_serializer_class())
+        return self._campos
+
+    def colunas_selecionadas(self):
+        """
+        Colunas do model para .only(), ou None sem seleção de campos.
+        """
+        campos = self.get_campos()
+        if campos is None:
+            return None
+        return colunas_dos_campos(self.get_serializer_class(), campos)
+
+    def get_serializer(self, *args, **kwargs):
+        campos = self.get_campos()
+        if campos is not None:
+            kwargs.setdefault("campos", campos)
+        return super().get_serializer(*args, **kwargs)
+
+
+class ListagemCompiladaMixin:
+    """
+    list() pela leitura compilada (core.leitura): .values() + função de
+    montagem gerada a partir do serializer, com a mesma saída do
+    serializer_class(many=True).
+    """
+    leitura = None
+
+    def lista_compilada(self, request):
+        """
+        Retorna a Response da listagem (paginada, se a view tiver paginação).
+        """
+        leitura = self.leitura
+        if hasattr(self, "get_campos"):
+            leitura = leitura.seleciona(self.get_campos())
+        queryset = self.filter_queryset(self.get_queryset())
+        contexto = self.get_serializer_context()
+        paginator = self.paginator
+        if paginator is None:
+            return Response(leitura.representa(leitura.consulta(queryset), contexto))
+
+        # O cursor precisa das colunas de ordenação em cada linha
+        ordem = [campo.lstrip("-") for campo in paginator.get_ordering(queryset)]
+        pagina = paginator.paginate_queryset(
+            leitura.consulta(queryset, ordem), request, view=self
+        )
+        return paginator.get_paginated_response(leitura.representa(pagina, contexto))
 
 
 # LOGIN
@@ -26,6 +115,8 @@ class LoginView(TokenObtainPairView):
     """
     serializer_class = EmailOrUsernameTokenObtainPairSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [IPThrottle, ContaThrottle]
+    throttle_scope = "login"
 
 
 # REFRESH padrão
@@ -33,7 +124,10 @@ class RefreshView(TokenRefreshView):
     """
     Endpoint padrão do SimpleJWT para renovar o access token
     a partir de um refresh token válido.
+
+    A verificação de blacklist usa o filtro em memória (core.blacklist).
     """
+    serializer_class = FilteredTokenRefreshSerializer
     permission_classes = [AllowAny]
 
 
@@ -53,7 +147,7 @@ class LogoutView(APIView):
                     {"detail": "refresh token é obrigatório."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            token = RefreshToken(refresh)
+            token = FilteredRefreshToken(refresh)
             token.blacklist()
             # 205 Reset Content indica que o cliente deve "resetar" o estado
             return Response(status=status.HTTP_205_RESET_CONTENT)
@@ -69,6 +163,8 @@ class RegisterView(APIView):
     Usa o RegisterSerializer para criar User + Perfil.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPThrottle, ContaThrottle]
+    throttle_scope = "registro"
 
     def post(self, request, *args, **kwargs):
         s = RegisterSerializer(data=request.data)
@@ -104,6 +200,8 @@ class ChangePasswordView(APIView):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [ContaThrottle]
+    throttle_scope = "senha"
 
     def post(self, request, *args, **kwargs):
         serializer = ChangePasswordSerializer(
@@ -127,11 +225,13 @@ class UsuarioViewSet(viewsets.ModelViewSet):
     ViewSet CRUD para Perfil de usuário.
 
     - Usa PerfilSerializer, que embute dados do User.
+    - Listagem paginada por cursor (ordem por id).
     - Permission AllowAny pode ser ajustada futuramente para regras de acesso.
     """
     queryset = Perfil.objects.select_related("user").all()
     serializer_class = PerfilSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = UsuarioPagination
 
     @action(
         detail=False,
@@ -143,47 +243,64 @@ class UsuarioViewSet(viewsets.ModelViewSet):
         """
         Retorna ou atualiza o perfil do usuário autenticado.
 
-        - GET /usuarios/me/  -> dados do perfil do usuário logado
+        - GET /usuarios/me/  -> dados do perfil do usuário logado, em
+          cache (core.cache) até o próximo save do Perfil ou do User
         - PATCH /usuarios/me/ -> atualiza somente os campos enviados
           (ex.: first_name, last_name, email, telefone, endereco, etc.)
         """
+        def perfil_do_usuario():
+            return Perfil.objects.select_related("user").get(user=request.user)
+
         try:
-            perfil = Perfil.objects.select_related("user").get(user=request.user)
+            if request.method.lower() == "patch":
+                serializer = self.get_serializer(
+                    perfil_do_usuario(), data=request.data, partial=True
+                )
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+                return Response(serializer.data)
+
+            # GET
+            data = obtem_ou_calcula(
+                chave_instancia("perfil", request.user.pk),
+                lambda: dict(self.get_serializer(perfil_do_usuario()).data),
+                dict,
+            )
         except Perfil.DoesNotExist:
             return Response(
                 {"detail": "Perfil não encontrado."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-
-        if request.method.lower() == "patch":
-            serializer = self.get_serializer(
-                perfil, data=request.data, partial=True
-            )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data)
-
-        # GET
-        serializer = self.get_serializer(perfil)
-        return Response(serializer.data)
+        return Response(data)
 
 
 
-class EventoViewSet(viewsets.ModelViewSet):
+class EventoViewSet(CamposEsparsosViewMixin, ListagemCompiladaMixin, viewsets.ModelViewSet):
     """
     ViewSet CRUD para Evento.
 
     Inclui:
-    - filtros de busca (nome, cidade, local, descrição)
+    - busca full-text (nome, cidade, local, descrição) via core.busca,
+      sem acentos e ordenada por relevância
     - ordenação por data, nome ou cidade
     - filtro 'scope' (future/past) por query param
+    - paginação por cursor em (data, id), com links no header Link
+    - cache versionado da listagem, com ETag/Last-Modified (core.catalogo)
+    - busca em lote por IDs (/eventos/batch/?ids=1,2,3) para o carrinho
+    - listagem montada por .values() (core.leitura), sem instanciar Evento
+    - ?fields=id,nome,data devolve só esses campos e lê só essas colunas
     """
     serializer_class = EventoSerializer
+    leitura = LeituraCompilada(EventoSerializer)
     permission_classes = [permissions.AllowAny]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = EventoPagination
+    # A busca fica depois da ordenação para poder ordenar por relevância
+    filter_backends = [filters.OrderingFilter, EventoSearchFilter]
     search_fields = ['nome', 'cidade', 'local', 'descricao']
     ordering_fields = ['data', 'nome', 'cidade']
     ordering = ['data']
+    # Limite de IDs por chamada de /eventos/batch/
+    batch_max_ids = 100
 
     def get_queryset(self):
         """
@@ -191,8 +308,13 @@ class EventoViewSet(viewsets.ModelViewSet):
 
         - scope=future (padrão): eventos com data >= hoje.
         - scope=past: eventos com data < hoje.
+
+        Com ?fields=, carrega só as colunas dos campos pedidos.
         """
         qs = Evento.objects.all().order_by('data')
+        colunas = self.colunas_selecionadas()
+        if colunas is not None:
+            qs = qs.only(*colunas)
         scope = (self.request.query_params.get('scope') or 'future').lower()
         if scope == 'future':
             qs = qs.filter(data__gte=localdate())
@@ -200,17 +322,153 @@ class EventoViewSet(viewsets.ModelViewSet):
             qs = qs.filter(data__lt=localdate())
         return qs
 
+    def list(self, request, *args, **kwargs):
+        """
+        Listagem com cache versionado.
+
+        - A resposta serializada fica em cache por parâmetros normalizados
+          + versão do catálogo (invalidada por save/delete de Evento e
+          pela virada do dia).
+        - Envia ETag/Last-Modified; revalidações com If-None-Match ou
+          If-Modified-Since recebem 304 sem tocar no banco.
+        """
+        def monta_listagem():
+            response = self.lista_compilada(request)
+            return response.data, response.headers
 
-class PedidoViewSet(viewsets.ModelViewSet):
+        return self._resposta_cacheada(request, chave_catalogo(request), monta_listagem)
+
+    @action(detail=False, methods=["get"], url_path="batch")
+    def batch(self, request):
+        """
+        Busca vários eventos de uma vez: GET /eventos/batch/?ids=1,2,3
+
+        - Uma única consulta id__in, sem o filtro de scope (eventos
+          passados também são retornados para IDs explícitos).
+        - Resposta: {"eventos": [...em ordem de id...], "nao_encontrados": [ids]};
+          ids malformados também vão para "nao_encontrados" (como texto).
+        - Cacheada por conjunto de IDs, com ETag/Last-Modified como a listagem.
+        """
+        ids, invalidos = self._parse_ids(request)
+
+        def monta_lote():
+            qs = Evento.objects.all()
+            colunas = self.colunas_selecionadas()
+            if colunas is not None:
+                qs = qs.only(*colunas)
+            encontrados = qs.in_bulk(ids)
+            eventos = [encontrados[pk] for pk in sorted(encontrados)]
+            data = {
+                "eventos": self.get_serializer(eventos, many=True).data,
+                "nao_encontrados": [pk for pk in sorted(ids) if pk not in encontrados]
+                + invalidos,
+            }
+            return data, {}
+
+        return self._resposta_cacheada(
+            request, chave_lote(request, [*ids, *invalidos]), monta_lote
+        )
+
+    def _parse_ids(self, request):
+        """
+        Lê ?ids=1,2,3 (ou ?ids=1&ids=2) e retorna (ids válidos, ids
+        inválidos), sem repetição. Um id inválido não derruba o lote:
+        vai para "nao_encontrados". ids ausente ou em excesso geram 400.
+        """
+        brutos = list(dict.fromkeys(
+            parte.strip()
+            for valor in request.query_params.getlist("ids")
+            for parte in valor.split(",")
+            if parte.strip()
+        ))
+        if not brutos:
+            raise ValidationError(
+                {"ids": ["Informe ao menos um id (ex.: ?ids=1,2,3)."]}
+            )
+
+        ids, invalidos = [], []
+        for bruto in brutos:
+            try:
+                pk = int(bruto)
+            except ValueError:
+                pk = None
+            if pk is None or not 0 < pk < 2**63:
+                invalidos.append(bruto)
+            else:
+                ids.append(pk)
+
+        ids = list(dict.fromkeys(ids))
+        if len(ids) + len(invalidos) > self.batch_max_ids:
+            raise ValidationError(
+                {"ids": [f"No máximo {self.batch_max_ids} ids por chamada."]}
+            )
+        return ids, invalidos
+
+    def _resposta_cacheada(self, request, chave, monta):
+        """
+        Devolve a entrada `chave` do cache (criando-a com `monta()`, que
+        retorna (data, headers)), com ETag/Last-Modified e 304 nas
+        revalidações.
+
+        Só uma request por vez recalcula uma entrada expirada ou de versão
+        antiga; as concorrentes recebem a entrada anterior (ver
+        core.cache.obtem_com_revalidacao).
+
+        Respostas JSON guardam também as variantes gzip/brotli do corpo
+        (core.compressao), comprimidas uma vez por entrada.
+        """
+        versao = versao_catalogo()
+
+        def calcula():
+            data, headers = monta()
+            return monta_entrada(chave, versao, data, headers, self._variantes(request, data))
+
+        entrada = obtem_com_revalidacao(chave, calcula, versao, timeout_catalogo())
+
+        last_modified = int(entrada["last_modified"].timestamp())
+        not_modified = get_conditional_response(
+            request._request, etag=entrada["etag"], last_modified=last_modified
+        )
+        if not_modified is not None:
+            response = not_modified
+        else:
+            response = Response(entrada["data"], headers=entrada["headers"])
+            # Corpo já comprimido para o CompressaoMiddleware
+            response.variantes_comprimidas = entrada.get("variantes")
+        response["ETag"] = entrada["etag"]
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def _variantes(self, request, data):
+        # Só o JSON tem renderização que depende apenas dos dados
+        renderer = getattr(request, "accepted_renderer", None)
+        if not isinstance(renderer, JSONRenderer):
+            return None
+        corpo = renderer.render(data, request.accepted_media_type, self.get_renderer_context())
+        return variantes_comprimidas(corpo)
+
+
+class PedidoViewSet(CamposEsparsosViewMixin, ListagemCompiladaMixin, viewsets.ModelViewSet):
     """
     ViewSet CRUD para Pedido.
 
     - Permite leitura para todos.
     - Criação/edição requer autenticação (IsAuthenticatedOrReadOnly).
     - get_queryset() restringe a listagem aos pedidos do usuário logado.
+    - Listagem paginada por cursor em (criado_em, id), mais recentes primeiro.
+    - cada página do histórico fica em cache por usuário (core.cache),
+      invalidada pelo save/delete dos pedidos dele.
+    - POST /pedidos/quote/ calcula o total do carrinho sem criar o pedido.
+    - listagem montada por .values() (core.leitura): pedidos e itens em
+      duas queries, sem instanciar os models.
+    - ?fields=id,status devolve só esses campos, sem buscar os itens;
+      ?expand=itens inclui os itens.
     """
     serializer_class = PedidoSerializer
+    leitura = LeituraCompilada(PedidoSerializer)
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = PedidoPagination
 
     def get_queryset(self):
         """
@@ -218,10 +476,19 @@ class PedidoViewSet(viewsets.ModelViewSet):
 
         - select_related('usuario') para otimizar acesso ao usuário.
         - prefetch_related('itens__evento') para otimizar itens e eventos.
+
+        Com ?fields=, carrega só as colunas dos campos pedidos e busca os
+        itens apenas se "itens" estiver entre eles (ou em ?expand=).
         """
-        qs = Pedido.objects.all().select_related("usuario").prefetch_related(
-            "itens__evento"
-        )
+        qs = Pedido.objects.all()
+        campos = self.get_campos()
+        if campos is None:
+            qs = qs.select_related("usuario").prefetch_related("itens__evento")
+        else:
+            # O serializer só usa usuario_id: sem join com o usuário
+            qs = qs.only(*self.colunas_selecionadas())
+            if "itens" in campos:
+                qs = qs.prefetch_related("itens__evento")
 
         user = self.request.user
         if user.is_authenticated:
@@ -229,3 +496,46 @@ class PedidoViewSet(viewsets.ModelViewSet):
 
         # Usuário anônimo não deve ver pedidos
         return qs.none()
+
+    def list(self, request, *args, **kwargs):
+        user = request.user
+        if not user.is_authenticated:
+            return self.lista_compilada(request)
+
+        def monta_pagina():
+            response = self.lista_compilada(request)
+            return {
+                "data": response.data,
+                "headers": {
+                    nome: response[nome] for nome in HEADERS_CACHEADOS if nome in response
+                },
+            }
+
+        # Host (links absolutos), formato negociado e parâmetros da request
+        partes = [
+            request.build_absolute_uri("/"),
+            getattr(request.accepted_renderer, "format", ""),
+        ] + [
+            f"{nome}={','.join(request.query_params.getlist(nome))}"
+            for nome in sorted(request.query_params)
+        ]
+        entrada = obtem_ou_calcula(
+            chave(namespace_dono("pedidos", user.pk), *partes), monta_pagina, dict
+        )
+        return Response(entrada["data"], headers=entrada["headers"])
+
+    @action(
+        detail=False,
+        methods=["post"],
+        permission_classes=[permissions.AllowAny],
+        url_path="quote",
+    )
+    def quote(self, request):
+        """
+        Cotação do carrinho: recebe {"itens": [{"evento_id", "quantidade"}, ...]}
+        e retorna o subtotal de cada linha e o valor_total, com os preços
+        atuais dos eventos. Não grava nada.
+        """
+        serializer = CotacaoSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+        return Response(serializer.to_representation(serializer.cota()))
@@ -1,22 +1,60 @@
 # FarofaTrip/core/whatsapp.py
+import logging
 import os
 import requests
-from typing import Optional
+from typing import Dict, Iterable, Optional, Union
 from django.conf import settings
-from .models import Pedido
+from django.db.models import Prefetch
+from .models import Pedido, PedidoItem
 
 
 WHATSAPP_TARGET_DEFAULT = "+5519971173838"
+WHATSAPP_API_URL_DEFAULT = "https://graph.facebook.com/v21.0"
+
+logger = logging.getLogger(__name__)
 
 
 def _get_env(name: str, default: Optional[str] = None) -> Optional[str]:
     return getattr(settings, name, None) or os.getenv(name, default)
 
 
+def orders_for_message_queryset():
+    """
+    Queryset de pedidos com tudo que a mensagem precisa já carregado:
+    usuário (JOIN), itens e seus eventos (1 prefetch com JOIN).
+
+    Qualquer quantidade de pedidos custa sempre 2 queries.
+    """
+    itens = PedidoItem.objects.select_related("evento").order_by("id")
+    return Pedido.objects.select_related("usuario").prefetch_related(
+        Prefetch("itens", queryset=itens)
+    )
+
+
+def load_order_for_message(pedido_id: int) -> Pedido:
+    """
+    Carrega um Pedido pronto para format_order_message (2 queries fixas).
+    """
+    return orders_for_message_queryset().get(pk=pedido_id)
+
+
+def _itens_do_pedido(pedido: Pedido):
+    """
+    Retorna os itens do pedido, usando o prefetch quando existir.
+    Sem prefetch, carrega itens + eventos em uma única query.
+    """
+    if "itens" in getattr(pedido, "_prefetched_objects_cache", {}):
+        return list(pedido.itens.all())
+    return list(pedido.itens.select_related("evento").order_by("id"))
+
+
 def format_order_message(pedido: Pedido) -> str:
     """
     Monta o texto que será enviado pelo WhatsApp com os dados do pedido.
     Ajuste o texto como quiser.
+
+    Para não fazer queries, passe um pedido carregado por
+    load_order_for_message() / orders_for_message_queryset().
     """
     usuario = pedido.usuario
 
@@ -36,7 +74,8 @@ def format_order_message(pedido: Pedido) -> str:
 
     itens_lines = ["📦 *Itens do pedido:*"]
 
-    for item in pedido.itens.all():
+    itens = _itens_do_pedido(pedido)
+    for item in itens:
         partes = [f"- {item.quantidade}x {item.evento.nome}"]
 
         if item.preco_ingresso:
@@ -47,7 +86,7 @@ def format_order_message(pedido: Pedido) -> str:
         partes.append(f"subtotal R$ {item.subtotal:.2f}")
         itens_lines.append(" | ".join(partes))
 
-    if not pedido.itens.exists():
+    if not itens:
         itens_lines.append("- (sem itens cadastrados 😅)")
 
     if pedido.observacoes:
@@ -62,34 +101,68 @@ def format_order_message(pedido: Pedido) -> str:
     return "\n".join(header + [""] + itens_lines)
 
 
-def send_whatsapp_order(pedido: Pedido) -> None:
+def format_order_messages(pedidos: Iterable[Union[Pedido, int]]) -> Dict[int, str]:
     """
-    Envia a mensagem de WhatsApp via WhatsApp Cloud API.
+    Versão em lote de format_order_message, para resumos e reenvios.
 
-    Requer as variáveis:
-      - WHATSAPP_TOKEN       -> token de acesso (Bearer)
-      - WHATSAPP_PHONE_ID    -> phone_number_id da API do WhatsApp
-      - WHATSAPP_TARGET      -> número destino (opcional, default é o seu)
+    Recebe pedidos ou IDs de pedidos e retorna {pedido_id: texto}.
+    Todos os pedidos são recarregados juntos com
+    orders_for_message_queryset(), então o custo é de 2 queries
+    independentemente da quantidade.
+    """
+    ids = [p.pk if isinstance(p, Pedido) else int(p) for p in pedidos]
+    if not ids:
+        return {}
+
+    carregados = orders_for_message_queryset().in_bulk(ids)
+    return {
+        pedido_id: format_order_message(carregados[pedido_id])
+        for pedido_id in ids
+        if pedido_id in carregados
+    }
+
+
+def get_whatsapp_config() -> Optional[dict]:
+    """
+    Lê a configuração da WhatsApp Cloud API (settings ou variáveis de ambiente).
+
+    Retorna None se token ou phone_id não estiverem configurados.
     """
     token = _get_env("WHATSAPP_TOKEN")
     phone_id = _get_env("WHATSAPP_PHONE_ID")
-    to_number = _get_env("WHATSAPP_TARGET", WHATSAPP_TARGET_DEFAULT)
-
-    # Se não tiver configuração, apenas sai silenciosamente
     if not token or not phone_id:
-        # aqui poderia logar com logging.warning se quiser
-        return
+        return None
+
+    return {
+        "token": token,
+        "phone_id": phone_id,
+        "to_number": _get_env("WHATSAPP_TARGET", WHATSAPP_TARGET_DEFAULT),
+        "api_url": _get_env("WHATSAPP_API_URL", WHATSAPP_API_URL_DEFAULT).rstrip("/"),
+    }
 
-    text_body = format_order_message(pedido)
 
-    url = f"https://graph.facebook.com/v21.0/{phone_id}/messages"
+def post_whatsapp_message(
+    config: dict,
+    text_body: str,
+    to_number: Optional[str] = None,
+    session=None,
+    timeout: float = 10,
+):
+    """
+    Faz o POST de uma mensagem de texto na WhatsApp Cloud API.
+
+    - session: requests.Session opcional (permite reaproveitar conexões).
+    - Levanta requests.RequestException em caso de erro HTTP/rede.
+    """
+    url = f"{config['api_url']}/{config['phone_id']}/messages"
     headers = {
-        "Authorization": f"Bearer {token}",
+        "Authorization": f"Bearer {config['token']}",
         "Content-Type": "application/json",
     }
+    destino = to_number or config["to_number"]
     payload = {
         "messaging_product": "whatsapp",
-        "to": to_number.replace("+", ""),  # E.164 sem o "+"
+        "to": destino.replace("+", ""),  # E.164 sem o "+"
         "type": "text",
         "text": {
             "preview_url": False,
@@ -97,9 +170,35 @@ def send_whatsapp_order(pedido: Pedido) -> None:
         },
     }
 
+    client = session or requests
+    resp = client.post(url, headers=headers, json=payload, timeout=timeout)
+    resp.raise_for_status()
+    return resp
+
+
+def send_whatsapp_order(pedido: Pedido) -> None:
+    """
+    Envia a mensagem de WhatsApp via WhatsApp Cloud API (síncrono).
+
+    Requer as variáveis:
+      - WHATSAPP_TOKEN       -> token de acesso (Bearer)
+      - WHATSAPP_PHONE_ID    -> phone_number_id da API do WhatsApp
+      - WHATSAPP_TARGET      -> número destino (opcional, default é o seu)
+      - WHATSAPP_API_URL     -> URL base da Graph API (opcional)
+
+    Bloqueia a thread até a resposta da API; no fluxo de pedidos use a
+    fila de notificações (core.notificacoes) em vez desta função.
+    """
+    config = get_whatsapp_config()
+
+    # Se não tiver configuração, apenas sai silenciosamente
+    if config is None:
+        logger.debug("WhatsApp não configurado; pedido #%s não notificado.", pedido.id)
+        return
+
+    text_body = format_order_message(pedido)
+
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=10)
-        resp.raise_for_status()
-    except Exception as e:
-        (...)
-        print(f"[WHATSAPP] Erro ao enviar mensagem do pedido #{pedido.id}: {e}")
+        post_whatsapp_message(config, text_body)
+    except requests.RequestException as e:
+        logger.warning("Erro ao enviar mensagem do pedido #%s: %s", pedido.id, e)